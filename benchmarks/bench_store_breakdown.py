@@ -0,0 +1,81 @@
+"""상점별 합계 계산을 기존 서비스 루프와 build_store_breakdown 으로 비교하는 마이크로 벤치마크입니다.
+
+    uv run python -m benchmarks.bench_store_breakdown
+
+기존 루프는 joinedload 된 CartProduct -> Product -> Store 객체를 돌며 라인마다 검증된
+Pydantic 모델을 만들었으므로, 같은 모양의 객체를 만들어 그대로 재현합니다.
+"""
+import timeit
+from types import SimpleNamespace
+
+from wapang.app.carts.schemas import CartDetails, CartItems
+from wapang.common.breakdown import build_store_breakdown
+
+LINE_COUNTS = (1, 50, 500)
+STORE_COUNT = 10
+
+
+def make_lines(count: int) -> tuple[list, list]:
+    stores = [
+        SimpleNamespace(id=f"store-{i}", store_name=f"상점{i}", delivery_fee=3000)
+        for i in range(STORE_COUNT)
+    ]
+    cart_products = []
+    rows = []
+    for i in range(count):
+        store = stores[i % STORE_COUNT]
+        product = SimpleNamespace(id=f"item-{i}", name=f"상품{i}", price=1000 + i, store=store)
+        cart_products.append(SimpleNamespace(product=product, count=1 + i % 5))
+        rows.append((product.id, product.name, product.price, 1 + i % 5, store.id, store.store_name, store.delivery_fee))
+    return cart_products, rows
+
+
+def legacy_breakdown(cart_products: list) -> tuple[dict[str, CartDetails], int]:
+    stores_data = {}
+    for cp in cart_products:
+        product = cp.product
+        store = product.store
+
+        if store.id not in stores_data:
+            stores_data[store.id] = CartDetails(
+                store_id=str(store.id),
+                store_name=store.store_name,
+                delivery_fee=store.delivery_fee,
+                store_total_price=store.delivery_fee,
+                items=[]
+            )
+
+        subtotal = product.price * cp.count
+        stores_data[store.id].items.append(
+            CartItems(
+                item_id=str(product.id),
+                item_name=product.name,
+                price=product.price,
+                quantity=cp.count,
+                subtotal=subtotal
+            )
+        )
+        stores_data[store.id].store_total_price += subtotal
+
+    total_price = sum(store.store_total_price for store in stores_data.values())
+    return stores_data, total_price
+
+
+def main() -> None:
+    print(f"{'lines':>6} {'legacy (us)':>12} {'builder (us)':>13} {'speedup':>8}")
+    for count in LINE_COUNTS:
+        cart_products, rows = make_lines(count)
+
+        legacy, legacy_total = legacy_breakdown(cart_products)
+        built, built_total = build_store_breakdown(rows, CartDetails)
+        assert legacy_total == built_total
+        assert [d.model_dump() for d in legacy.values()] == [d.model_dump() for d in built.values()]
+
+        number = max(1, 20_000 // count)
+        old = min(timeit.repeat(lambda: legacy_breakdown(cart_products), number=number, repeat=5)) / number
+        new = min(timeit.repeat(lambda: build_store_breakdown(rows, CartDetails), number=number, repeat=5)) / number
+        print(f"{count:>6} {old * 1e6:>12.1f} {new * 1e6:>13.1f} {old / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""verify_and_decode_token 의 캐시 적중 / 미적중 경로를 비교하는 마이크로 벤치마크입니다.
+
+    ENV=test uv run python -m benchmarks.bench_token_cache
+
+앱 모듈을 import 하므로 애플리케이션과 같은 환경 변수(DB_* 등)가 필요합니다.
+"""
+import os
+import timeit
+
+os.environ.setdefault("ACCESS_TOKEN_SECRET", "bench-access-secret")
+os.environ.setdefault("REFRESH_TOKEN_SECRET", "bench-refresh-secret")
+
+from wapang.app.auth.utils import (  # noqa: E402
+    issue_token,
+    token_claims_cache,
+    verify_and_decode_token,
+)
+
+SECRET = os.environ["ACCESS_TOKEN_SECRET"]
+ROUNDS = 20_000
+
+
+def main() -> None:
+    token = issue_token("bench-user", 15, SECRET)
+
+    def uncached() -> None:
+        token_claims_cache.clear()
+        verify_and_decode_token(token, SECRET)
+
+    def cached() -> None:
+        verify_and_decode_token(token, SECRET)
+
+    cached()
+    miss = min(timeit.repeat(uncached, number=ROUNDS, repeat=3)) / ROUNDS
+    hit = min(timeit.repeat(cached, number=ROUNDS, repeat=3)) / ROUNDS
+
+    print(f"decode + verify : {miss * 1e6:8.2f} us/request")
+    print(f"cache hit       : {hit * 1e6:8.2f} us/request")
+    print(f"saving          : {(miss - hit) * 1e6:8.2f} us/request ({miss / hit:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""로그인 폭주 중 다른 엔드포인트의 지연 시간을 측정하는 부하 테스트입니다.
+
+argon2 검증이 이벤트 루프를 막으면 GET /api/items/ 의 p99 가 로그인 처리 시간만큼 늘어납니다.
+테스트용 인메모리 SQLite 위에서 ASGI 앱을 직접 호출합니다.
+
+    ENV=test uv run python -m benchmarks.load_signin_burst
+"""
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("ENV", "test")
+os.environ.setdefault("ACCESS_TOKEN_SECRET", "bench-access-secret")
+os.environ.setdefault("REFRESH_TOKEN_SECRET", "bench-refresh-secret")
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from wapang.database.async_connection import async_db_manager  # noqa: E402
+from wapang.database.common import Base  # noqa: E402
+from wapang.main import app  # noqa: E402
+
+SIGNIN_BURST = 16
+PROBE_INTERVAL = 0.05
+IDLE_DURATION = 2.0
+CREDENTIALS = {"email": "bench@snu.ac.kr", "password": "password123"}
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def timed_get(client: AsyncClient, scheduled_at: float, latencies: list[float]) -> None:
+    await client.get("/api/items/")
+    latencies.append(time.perf_counter() - scheduled_at)
+
+
+async def probe(client: AsyncClient, latencies: list[float], until: asyncio.Event) -> None:
+    # 응답을 기다리지 않고 일정 간격으로 요청을 보내야 루프가 막힌 시간이 지연에 그대로 드러납니다.
+    pending = []
+    next_at = time.perf_counter()
+    while not until.is_set():
+        pending.append(asyncio.create_task(timed_get(client, next_at, latencies)))
+        next_at += PROBE_INTERVAL
+        await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+    await asyncio.gather(*pending)
+
+
+async def signin_burst(client: AsyncClient, done: asyncio.Event) -> None:
+    await asyncio.gather(
+        *(client.post("/api/auth/tokens", json=CREDENTIALS) for _ in range(SIGNIN_BURST))
+    )
+    done.set()
+
+
+async def main() -> None:
+    async with async_db_manager.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench/") as client:
+        await client.post("/api/users/", json=CREDENTIALS)
+
+        idle: list[float] = []
+        idle_done = asyncio.Event()
+        asyncio.get_running_loop().call_later(IDLE_DURATION, idle_done.set)
+        await probe(client, idle, idle_done)
+
+        busy: list[float] = []
+        burst_done = asyncio.Event()
+        await asyncio.gather(probe(client, busy, burst_done), signin_burst(client, burst_done))
+
+    await async_db_manager.engine.dispose()
+
+    for label, samples in (("idle", idle), ("signin burst", busy)):
+        print(
+            f"{label:>12}: p50 {statistics.median(samples) * 1e3:7.2f} ms"
+            f"  p99 {percentile(samples, 0.99) * 1e3:7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,157 @@
+from httpx import AsyncClient
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_refresh_tokens(
+    async_client: AsyncClient,
+    token: dict,
+):
+    res = await async_client.get(
+        "/api/auth/tokens/refresh",
+        headers={"Authorization": f"Bearer {token['refresh_token']}"},
+    )
+    assert res.status_code == 200
+    res_json = res.json()
+    assert res_json["access_token"] != token["access_token"]
+    assert res_json["refresh_token"] != token["refresh_token"]
+
+@pytest.mark.asyncio
+async def test_refresh_with_used_refresh_token(
+    async_client: AsyncClient,
+    token: dict,
+):
+    auth_header = {"Authorization": f"Bearer {token['refresh_token']}"}
+
+    res = await async_client.get("/api/auth/tokens/refresh", headers=auth_header)
+    assert res.status_code == 200
+
+    res = await async_client.get("/api/auth/tokens/refresh", headers=auth_header)
+    assert res.status_code == 401
+    assert res.json()["error_code"] == "ERR_007"
+    assert res.json()["error_msg"] == "INVALID TOKEN"
+
+@pytest.mark.asyncio
+async def test_concurrent_refresh_with_same_token(
+    async_client: AsyncClient,
+    token: dict,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    auth_header = {"Authorization": f"Bearer {token['refresh_token']}"}
+
+    res = await async_client.get("/api/auth/tokens/refresh", headers=auth_header)
+    assert res.status_code == 200
+
+    # 두 요청이 모두 폐기 확인을 통과한 뒤 같은 토큰을 막으려는 상황을 흉내 냅니다.
+    async def not_revoked(auth_repository, token):
+        return False
+    monkeypatch.setattr("wapang.app.auth.services.is_token_revoked", not_revoked)
+
+    res = await async_client.get("/api/auth/tokens/refresh", headers=auth_header)
+    assert res.status_code == 401
+    assert res.json()["error_code"] == "ERR_007"
+
+@pytest.mark.asyncio
+async def test_refresh_after_signout(
+    async_client: AsyncClient,
+    token: dict,
+):
+    auth_header = {"Authorization": f"Bearer {token['refresh_token']}"}
+
+    res = await async_client.delete("/api/auth/tokens", headers=auth_header)
+    assert res.status_code == 204
+
+    res = await async_client.get("/api/auth/tokens/refresh", headers=auth_header)
+    assert res.status_code == 401
+    assert res.json()["error_code"] == "ERR_007"
+
+    res = await async_client.delete("/api/auth/tokens", headers=auth_header)
+    assert res.status_code == 401
+    assert res.json()["error_code"] == "ERR_007"
+
+@pytest.mark.asyncio
+async def test_refresh_skips_db_for_unrevoked_token(
+    async_client: AsyncClient,
+    token: dict,
+    sql_statements: list[str],
+):
+    sql_statements.clear()
+    res = await async_client.get(
+        "/api/auth/tokens/refresh",
+        headers={"Authorization": f"Bearer {token['refresh_token']}"},
+    )
+    assert res.status_code == 200
+    assert not any(statement.startswith("SELECT") for statement in sql_statements)
+
+@pytest.mark.asyncio
+async def test_revoked_tokens_rebuilt_from_db(
+    async_client: AsyncClient,
+    token: dict,
+):
+    from wapang.app.auth.revocation import rebuild_revoked_tokens, revoked_tokens
+    from wapang.database.async_connection import async_db_manager
+
+    auth_header = {"Authorization": f"Bearer {token['refresh_token']}"}
+    res = await async_client.delete("/api/auth/tokens", headers=auth_header)
+    assert res.status_code == 204
+
+    revoked_tokens.clear()
+    async with async_db_manager.session_factory() as session:
+        assert await rebuild_revoked_tokens(session) == 1
+
+    res = await async_client.get("/api/auth/tokens/refresh", headers=auth_header)
+    assert res.status_code == 401
+    assert res.json()["error_code"] == "ERR_007"
+
+@pytest.mark.asyncio
+async def test_rebuild_keeps_tokens_revoked_after_its_snapshot(
+    async_client: AsyncClient,
+    token: dict,
+    monkeypatch,
+):
+    from wapang.app.auth.repositories import AuthRepository
+    from wapang.app.auth.revocation import rebuild_revoked_tokens
+    from wapang.database.async_connection import async_db_manager
+
+    auth_header = {"Authorization": f"Bearer {token['refresh_token']}"}
+    res = await async_client.delete("/api/auth/tokens", headers=auth_header)
+    assert res.status_code == 204
+
+    # 로그아웃이 커밋되기 전에 SELECT 한 재구성처럼 빈 스냅샷을 돌려줍니다.
+    async def _stale_snapshot(self, now):
+        return []
+
+    monkeypatch.setattr(AuthRepository, "get_active_blocked_tokens", _stale_snapshot)
+    async with async_db_manager.session_factory() as session:
+        assert await rebuild_revoked_tokens(session) == 0
+
+    res = await async_client.get("/api/auth/tokens/refresh", headers=auth_header)
+    assert res.status_code == 401
+    assert res.json()["error_code"] == "ERR_007"
+
+@pytest.mark.asyncio
+async def test_purge_expired_tokens(
+    async_client: AsyncClient,
+):
+    from datetime import datetime, timedelta
+    from sqlalchemy import select
+    from wapang.app.auth.models import BlockedToken
+    from wapang.app.auth.purge import purge_expired_tokens, token_purge_stats
+    from wapang.database.async_connection import async_db_manager
+
+    now = datetime.now()
+    async with async_db_manager.session_factory() as session:
+        session.add_all(
+            [BlockedToken(token=f"expired-{i}", expired_at=now - timedelta(minutes=i + 1)) for i in range(5)]
+            + [BlockedToken(token="active", expired_at=now + timedelta(minutes=10))]
+        )
+        await session.commit()
+
+    batches_before = token_purge_stats.batches
+    assert await purge_expired_tokens(async_db_manager.session_factory, batch_size=2) == 5
+    assert token_purge_stats.batches - batches_before == 3
+    assert token_purge_stats.last_run_rows == 5
+
+    async with async_db_manager.session_factory() as session:
+        remaining = (await session.scalars(select(BlockedToken.token))).all()
+    assert remaining == ["active"]
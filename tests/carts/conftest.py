@@ -1,8 +1,18 @@
+import pytest
 import pytest_asyncio
 from httpx import AsyncClient
 
 from tests.items.conftest import item, items, item_create_request, item_2
 
+
+@pytest.fixture(autouse=True, params=["database", "memory"])
+def cart_store_backend(request, monkeypatch) -> str:
+	"""Run every cart test against both CartRepository backends."""
+	from wapang.app.carts.settings import CART_SETTINGS
+
+	monkeypatch.setattr(CART_SETTINGS, "CART_STORE_BACKEND", request.param)
+	return request.param
+
 @pytest_asyncio.fixture(scope="function")
 async def add_to_cart(async_client: "AsyncClient", access_token: str):
 	"""Helper to add or update a cart line for the logged-in user."""
@@ -231,4 +231,362 @@ async def test_checkout_not_enough_stock(
 	assert res2.status_code == 409
 	res_json = res2.json()
 	assert res_json["error_code"] == "ERR_017"
-	assert res_json["error_msg"] == "NOT ENOUGH STOCK"
\ No newline at end of file
+	assert res_json["error_msg"] == "NOT ENOUGH STOCK"
+@pytest.mark.asyncio
+async def test_checkout_with_idempotency_key(
+	async_client: "AsyncClient",
+	access_token: str,
+	add_to_cart,
+	item: dict,
+):
+	res = await add_to_cart(item_id=item["id"], quantity=2)
+	assert res.status_code == 200
+
+	headers = {"Authorization": f"Bearer {access_token}", "Idempotency-Key": "checkout-retry-1"}
+	res = await async_client.post("/api/carts/checkout/", headers=headers)
+	assert res.status_code == 201
+
+	retry = await async_client.post("/api/carts/checkout/", headers=headers)
+	assert retry.status_code == 201
+	assert retry.json() == res.json()
+
+	res = await async_client.get("/api/users/me/orders", headers={"Authorization": f"Bearer {access_token}"})
+	assert len(res.json()) == 1
+
+@pytest.mark.asyncio
+async def test_memory_cart_writes_behind(
+	cart_store_backend: str,
+	item: dict,
+	item_2: dict,
+	add_to_cart,
+	get_cart,
+	sql_statements: list[str],
+):
+	from sqlalchemy import select
+	from wapang.app.carts.models import CartProduct
+	from wapang.app.carts.services import flush_carts
+	from wapang.app.carts.store import cart_store
+	from wapang.database.async_connection import async_db_manager
+
+	if cart_store_backend != "memory":
+		pytest.skip("write-behind only applies to the memory backend")
+
+	res = await add_to_cart(item_id=item["id"], quantity=1)
+	assert res.status_code == 200
+
+	sql_statements.clear()
+	res = await add_to_cart(item_id=item_2["id"], quantity=2)
+	assert res.status_code == 200
+	assert not any("cart_products" in s for s in sql_statements)
+	expected = (await get_cart()).json()
+
+	async with async_db_manager.session_factory() as session:
+		assert (await session.scalars(select(CartProduct))).all() == []
+
+	assert await flush_carts(async_db_manager.session_factory) == 1
+	assert await flush_carts(async_db_manager.session_factory) == 0
+
+	async with async_db_manager.session_factory() as session:
+		rows = (await session.execute(select(CartProduct.product_id, CartProduct.count))).tuples().all()
+	assert sorted(rows) == sorted([(item["id"], 1), (item_2["id"], 2)])
+
+	# 프로세스가 다시 뜬 것처럼 해시를 비워도 cart_products 에서 다시 읽어 옵니다.
+	await cart_store.reset()
+	res = await get_cart()
+	by_store = lambda cart: sorted(cart["details"], key=lambda d: d["store_id"])
+	assert by_store(res.json()) == by_store(expected)
+	assert res.json()["total_price"] == expected["total_price"]
+
+@pytest.mark.asyncio
+async def test_cart_totals_update_incrementally(
+	store: dict,
+	store_2: dict,
+	item: dict,
+	item_2: dict,
+	add_to_cart,
+	get_cart,
+	sql_statements: list[str],
+):
+	from wapang.app.carts.summary import cart_summary_cache
+
+	res = await add_to_cart(item_id=item["id"], quantity=1)
+	assert res.status_code == 200
+
+	sql_statements.clear()
+	res = await add_to_cart(item_id=item_2["id"], quantity=2)
+	assert res.status_code == 200
+	res = await add_to_cart(item_id=item["id"], quantity=3)
+	assert res.status_code == 200
+	# 바뀐 라인만 읽고, 장바구니 전체를 다시 읽지 않습니다.
+	assert not any("FROM cart_products JOIN" in s or "products.id IN" in s for s in sql_statements)
+
+	res_json = res.json()
+	assert res_json["total_price"] == item["price"] * 3 + item_2["price"] * 2 + store["delivery_fee"] + store_2["delivery_fee"]
+
+	cart_summary_cache.clear()
+	rebuilt = (await get_cart()).json()
+	by_store = lambda cart: sorted(cart["details"], key=lambda d: d["store_id"])
+	assert by_store(rebuilt) == by_store(res_json)
+	assert rebuilt["total_price"] == res_json["total_price"]
+
+	res = await add_to_cart(item_id=item_2["id"], quantity=0)
+	assert res.json()["details"] == [d for d in res_json["details"] if d["store_id"] == store["id"]]
+	assert res.json()["total_price"] == item["price"] * 3 + store["delivery_fee"]
+
+@pytest.mark.asyncio
+async def test_cart_totals_follow_price_change(
+	async_client: "AsyncClient",
+	access_token: str,
+	store: dict,
+	item: dict,
+	add_to_cart,
+	get_cart,
+):
+	auth_header = {"Authorization": f"Bearer {access_token}"}
+	res = await add_to_cart(item_id=item["id"], quantity=2)
+	assert res.status_code == 200
+
+	res = await async_client.patch(f"/api/items/{item['id']}", json={"price": item["price"] + 100}, headers=auth_header)
+	assert res.status_code == 200
+
+	res_json = (await get_cart()).json()
+	assert res_json["details"][0]["items"][0]["price"] == item["price"] + 100
+	assert res_json["total_price"] == (item["price"] + 100) * 2 + store["delivery_fee"]
+
+@pytest.mark.asyncio
+async def test_cart_totals_follow_delivery_fee_change(
+	async_client: "AsyncClient",
+	access_token: str,
+	store: dict,
+	item: dict,
+	add_to_cart,
+	get_cart,
+):
+	auth_header = {"Authorization": f"Bearer {access_token}"}
+	res = await add_to_cart(item_id=item["id"], quantity=2)
+	assert res.status_code == 200
+
+	res = await async_client.patch(f"/api/stores/{store['id']}", json={"delivery_fee": 500}, headers=auth_header)
+	assert res.status_code == 200
+
+	res_json = (await get_cart()).json()
+	assert res_json["details"][0]["delivery_fee"] == 500
+	assert res_json["total_price"] == item["price"] * 2 + 500
+
+@pytest.mark.asyncio
+async def test_patch_cart_items_in_one_request(
+	async_client: "AsyncClient",
+	access_token: str,
+	cart_store_backend: str,
+	store: dict,
+	store_2: dict,
+	item: dict,
+	item_2: dict,
+	add_to_cart,
+	get_cart,
+	sql_statements: list[str],
+):
+	auth_header = {"Authorization": f"Bearer {access_token}"}
+	res = await add_to_cart(item_id=item["id"], quantity=1)
+	assert res.status_code == 200
+
+	sql_statements.clear()
+	res = await async_client.patch(
+		"/api/carts/items/",
+		json={"items": [
+			{"item_id": item["id"], "quantity": 2},
+			{"item_id": item_2["id"], "quantity": 1},
+			{"item_id": item["id"], "quantity": 4},
+		]},
+		headers=auth_header,
+	)
+	assert res.status_code == 200
+	res_json = res.json()
+	assert res_json["total_price"] == item["price"] * 4 + item_2["price"] + store["delivery_fee"] + store_2["delivery_fee"]
+	by_store = {d["store_id"]: d for d in res_json["details"]}
+	assert by_store[store["id"]]["items"][0]["quantity"] == 4
+	assert by_store[store_2["id"]]["items"][0]["quantity"] == 1
+
+	product_reads = [s for s in sql_statements if "FROM products" in s]
+	assert len(product_reads) == 1 and " IN (" in product_reads[0]
+	cart_writes = [s for s in sql_statements if s.startswith("INSERT INTO cart_products")]
+	assert len(cart_writes) == (1 if cart_store_backend == "database" else 0)
+
+	res = await get_cart()
+	assert res.json()["total_price"] == res_json["total_price"]
+
+	res = await async_client.patch(
+		"/api/carts/items/",
+		json={"items": [{"item_id": item["id"], "quantity": 0}]},
+		headers=auth_header,
+	)
+	assert res.status_code == 200
+	assert [d["store_id"] for d in res.json()["details"]] == [store_2["id"]]
+
+@pytest.mark.asyncio
+async def test_patch_cart_items_validates_before_writing(
+	async_client: "AsyncClient",
+	access_token: str,
+	item: dict,
+	get_cart,
+):
+	auth_header = {"Authorization": f"Bearer {access_token}"}
+
+	res = await async_client.patch(
+		"/api/carts/items/",
+		json={"items": [{"item_id": item["id"], "quantity": 1}, {"item_id": "invalid-item-id", "quantity": 1}]},
+		headers=auth_header,
+	)
+	assert res.status_code == 404
+	assert res.json()["error_code"] == "ERR_013"
+
+	res = await async_client.patch(
+		"/api/carts/items/",
+		json={"items": [{"item_id": item["id"], "quantity": -1}]},
+		headers=auth_header,
+	)
+	assert res.status_code == 400
+	assert res.json()["error_code"] == "ERR_002"
+
+	res = await async_client.patch("/api/carts/items/", json={"items": []}, headers=auth_header)
+	assert res.status_code == 422
+	assert res.json()["error_code"] == "ERR_024"
+
+	res = await get_cart()
+	assert res.json() == {"details": [], "total_price": 0}
+
+@pytest.mark.asyncio
+async def test_cart_endpoints_commit_once(
+	async_client: "AsyncClient",
+	access_token: str,
+	item: dict,
+	item_2: dict,
+	add_to_cart,
+	clear_cart,
+	checkout_cart,
+	commits: list,
+):
+	auth_header = {"Authorization": f"Bearer {access_token}"}
+
+	commits.clear()
+	res = await add_to_cart(item_id=item["id"], quantity=1)
+	assert res.status_code == 200
+	assert len(commits) == 1
+
+	commits.clear()
+	res = await async_client.patch(
+		"/api/carts/items/",
+		json={"items": [{"item_id": item["id"], "quantity": 0}, {"item_id": item_2["id"], "quantity": 2}]},
+		headers=auth_header,
+	)
+	assert res.status_code == 200
+	assert len(commits) == 1
+
+	commits.clear()
+	res = await checkout_cart()
+	assert res.status_code == 201
+	assert len(commits) == 1
+
+	commits.clear()
+	res = await clear_cart()
+	assert res.status_code == 204
+	assert len(commits) == 1
+
+@pytest.mark.asyncio
+async def test_cart_summary_survives_rolled_back_write(
+	user: dict,
+	store: dict,
+	item: dict,
+	item_2: dict,
+	add_to_cart,
+	get_cart,
+	monkeypatch: pytest.MonkeyPatch,
+):
+	from sqlalchemy.ext.asyncio import AsyncSession
+	from wapang.app.carts.summary import cart_summary_cache
+
+	res = await add_to_cart(item_id=item["id"], quantity=1)
+	assert res.status_code == 200
+	before = (await get_cart()).json()
+	cached = cart_summary_cache.get(user["id"])
+	assert cached is not None
+
+	async def failing_commit(self):
+		raise RuntimeError("commit failed")
+
+	with monkeypatch.context() as m, pytest.raises(RuntimeError):
+		m.setattr(AsyncSession, "commit", failing_commit)
+		await add_to_cart(item_id=item_2["id"], quantity=2)
+
+	# 커밋되지 않은 변경은 캐시된 요약에도 보이지 않아야 합니다.
+	assert cart_summary_cache.get(user["id"]) is cached
+	assert (await get_cart()).json() == before
+
+@pytest.mark.asyncio
+async def test_failed_checkout_keeps_memory_cart(
+	cart_store_backend: str,
+	user: dict,
+	item: dict,
+	add_to_cart,
+	get_cart,
+	checkout_cart,
+	monkeypatch: pytest.MonkeyPatch,
+):
+	from sqlalchemy.ext.asyncio import AsyncSession
+	from wapang.app.carts.store import cart_store
+
+	if cart_store_backend != "memory":
+		pytest.skip("cart_store only backs the memory backend")
+
+	res = await add_to_cart(item_id=item["id"], quantity=2)
+	assert res.status_code == 200
+	expected = (await get_cart()).json()
+
+	async def failing_commit(self):
+		raise RuntimeError("commit failed")
+
+	with monkeypatch.context() as m, pytest.raises(RuntimeError):
+		m.setattr(AsyncSession, "commit", failing_commit)
+		await checkout_cart()
+
+	# 주문이 롤백되면 아직 DB 에 쓰지 않은 장바구니도 그대로 남아 있어야 합니다.
+	assert await cart_store.get_counts(user["id"]) == {item["id"]: 2}
+	assert user["id"] in cart_store.dirty
+	assert (await get_cart()).json() == expected
+
+	res = await checkout_cart()
+	assert res.status_code == 201
+	assert await cart_store.get_counts(user["id"]) == {}
+
+@pytest.mark.asyncio
+async def test_checkout_survives_failing_after_commit_callback(
+	cart_store_backend: str,
+	user: dict,
+	store: dict,
+	item: dict,
+	add_to_cart,
+	get_cart,
+	checkout_cart,
+	monkeypatch: pytest.MonkeyPatch,
+):
+	from wapang.app.carts.store import cart_store
+	from wapang.app.carts.summary import cart_summary_cache
+	from wapang.app.stores.cache import store_version
+
+	if cart_store_backend != "memory":
+		pytest.skip("cart_store only backs the memory backend")
+
+	res = await add_to_cart(item_id=item["id"], quantity=1)
+	assert res.status_code == 200
+	await get_cart()
+	version = store_version(store["id"])
+
+	async def failing_clear(user_id):
+		raise ConnectionError("cart store is down")
+	monkeypatch.setattr(cart_store, "clear", failing_clear)
+
+	# 커밋된 주문은 201 로 끝나고, 실패한 콜백 뒤에 등록된 무효화도 모두 실행됩니다.
+	res = await checkout_cart()
+	assert res.status_code == 201
+	assert cart_summary_cache.get(user["id"]) is None
+	assert store_version(store["id"]) != version
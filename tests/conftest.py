@@ -33,6 +33,12 @@ async def async_client(set_test_env) -> AsyncGenerator["AsyncClient", None]:
     from wapang.main import app
     from wapang.database.common import Base
     from wapang.database.async_connection import async_db_manager
+    from wapang.app.users.services import user_cache
+    from wapang.app.auth.utils import token_claims_cache
+    from wapang.app.auth.revocation import clear_revoked_tokens
+    from wapang.app.stores.cache import store_page_cache
+    from wapang.app.carts.store import cart_store
+    from wapang.app.carts.summary import cart_summary_cache
 
     # 데이터베이스 초기화 및 스키마 반영
     async with async_db_manager.engine.begin() as conn:
@@ -49,6 +55,14 @@ async def async_client(set_test_env) -> AsyncGenerator["AsyncClient", None]:
 
     await async_db_manager.engine.dispose()
 
+    # 테스트 간에 프로세스 로컬 캐시가 공유되지 않도록 비웁니다.
+    user_cache.clear()
+    token_claims_cache.clear()
+    clear_revoked_tokens()
+    store_page_cache.clear()
+    await cart_store.reset()
+    cart_summary_cache.clear()
+
 
 @pytest_asyncio.fixture(scope="function")
 async def user(async_client: "AsyncClient", user_signup_data: dict) -> dict:
@@ -93,3 +107,54 @@ async def another_user_access_token(
     login_json = login_res.json()
 
     return login_json["access_token"]
+
+
+@pytest_asyncio.fixture(scope="function")
+async def sql_statements(async_client: "AsyncClient") -> AsyncGenerator[list[str], None]:
+    """테스트 동안 엔진에서 실행된 SQL 문을 순서대로 기록합니다."""
+    from sqlalchemy import event
+    from wapang.database.async_connection import async_db_manager
+
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = async_db_manager.engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(sync_engine, "before_cursor_execute", _record)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def commits(async_client: "AsyncClient") -> AsyncGenerator[list[None], None]:
+    """테스트 동안 엔진에서 일어난 COMMIT 마다 한 항목씩 쌓습니다."""
+    from sqlalchemy import event
+    from wapang.database.async_connection import async_db_manager
+
+    recorded: list[None] = []
+
+    def _record(conn):
+        recorded.append(None)
+
+    sync_engine = async_db_manager.engine.sync_engine
+    event.listen(sync_engine, "commit", _record)
+    yield recorded
+    event.remove(sync_engine, "commit", _record)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def explain_query_plan(async_client: "AsyncClient"):
+    """SQLite 의 EXPLAIN QUERY PLAN 결과에서 detail 컬럼만 모아 돌려줍니다."""
+    from wapang.database.async_connection import async_db_manager
+
+    async def _explain(query) -> list[str]:
+        compiled = query.compile(
+            dialect=async_db_manager.engine.dialect,
+            compile_kwargs={"literal_binds": True},
+        )
+        async with async_db_manager.engine.connect() as conn:
+            result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}")
+            return [row[-1] for row in result.all()]
+
+    return _explain
@@ -280,6 +280,84 @@ async def test_get_items(
         assert item["price"] <= query_params["max_price"]
         assert item["stock"] > 0
 
+@pytest.mark.asyncio
+async def test_get_items_query_count_is_constant(
+    async_client: AsyncClient,
+    items: dict,
+    store: dict,
+    sql_statements: list[str],
+):
+    sql_statements.clear()
+    res = await async_client.get("/api/items/", params={"min_price": 13000})
+    assert res.status_code == 200
+    assert len(res.json()) == 1
+    single_match_count = len(sql_statements)
+
+    sql_statements.clear()
+    res = await async_client.get("/api/items/")
+    assert res.status_code == 200
+    assert len(res.json()) == len(items)
+    for item in res.json():
+        assert item["store_name"] == store["store_name"]
+    assert len(sql_statements) == single_match_count
+
+@pytest.mark.asyncio
+async def test_get_items_paginated(
+    async_client: AsyncClient,
+    items: dict,
+):
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 4}
+        if cursor is not None:
+            params["cursor"] = cursor
+        res = await async_client.get("/api/items/", params=params)
+        assert res.status_code == 200
+        assert len(res.json()) <= 4
+        seen.extend(res.json())
+        cursor = res.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert [item["id"] for item in seen] == [
+        item["id"] for item in sorted(items, key=lambda i: (i["price"], i["id"]))
+    ]
+
+@pytest.mark.asyncio
+async def test_get_items_invalid_cursor(
+    async_client: AsyncClient,
+    items: dict,
+):
+    res = await async_client.get("/api/items/", params={"cursor": "not-a-cursor"})
+    assert res.status_code == 400
+    assert res.json()["error_code"] == "ERR_003"
+
+    res = await async_client.get("/api/items/", params={"limit": 0})
+    assert res.status_code == 400
+    assert res.json()["error_code"] == "ERR_003"
+
+@pytest.mark.asyncio
+async def test_get_items_uses_catalog_indexes(
+    explain_query_plan,
+):
+    from sqlalchemy import select
+    from wapang.app.items.models import Product
+
+    plan = await explain_query_plan(
+        select(Product.id)
+        .where(Product.store_id == "store", Product.price >= 1000, Product.price <= 9000)
+        .order_by(Product.price, Product.id)
+    )
+    assert any("ix_products_store_id_price" in detail for detail in plan)
+
+    plan = await explain_query_plan(
+        select(Product.id)
+        .where(Product.price >= 1000, Product.stock > 0)
+        .order_by(Product.price, Product.id)
+    )
+    assert any("ix_products_price_id" in detail for detail in plan)
+
 @pytest.mark.asyncio
 async def test_get_items_no_store(
     async_client: AsyncClient,
@@ -298,6 +376,42 @@ async def test_get_items_no_store(
     assert res_json["error_code"] == "ERR_010"
     assert res_json["error_msg"] == "STORE NOT FOUND"
 
+@pytest.mark.asyncio
+async def test_list_items_conditional_requests(
+    async_client: AsyncClient,
+    access_token: str,
+    item: dict,
+    sql_statements: list[str],
+):
+    res = await async_client.get("/api/items/")
+    assert res.status_code == 200
+    etag = res.headers["ETag"]
+
+    sql_statements.clear()
+    res = await async_client.get("/api/items/", headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    assert res.content == b""
+    assert sql_statements == []
+
+    res = await async_client.patch(f"/api/items/{item['id']}", json={"price": 1234}, headers={"Authorization": f"Bearer {access_token}"})
+    assert res.status_code == 200
+
+    res = await async_client.get("/api/items/", headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.json()[0]["price"] == 1234
+    etag = res.headers["ETag"]
+
+    res = await async_client.patch("/api/users/me", json={"nickname": "waffle"}, headers={"Authorization": f"Bearer {access_token}"})
+    res = await async_client.post(f"/api/items/{item['id']}/reviews", json={"rating": 5, "comment": "good"}, headers={"Authorization": f"Bearer {access_token}"})
+    assert res.status_code == 201
+
+    res = await async_client.get("/api/items/", headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.json()[0]["rating_count"] == 1
+
+    res = await async_client.get("/api/items/", params={"store_id": "invalid-store-id"}, headers={"If-None-Match": "*"})
+    assert res.status_code == 404
+
 @pytest.mark.asyncio
 async def test_delete_item(
     async_client: AsyncClient,
@@ -307,6 +421,94 @@ async def test_delete_item(
     res = await async_client.delete(f"/api/items/{item['id']}", headers={"Authorization": f"Bearer {access_token}"})
     assert res.status_code == 204
 
+    res = await async_client.get("/api/items/", params={"store_id": item["store_id"]})
+    assert all(i["id"] != item["id"] for i in res.json())
+
+@pytest.mark.asyncio
+async def test_delete_item_removes_its_reviews_in_the_database(
+    async_client: AsyncClient,
+    access_token: str,
+    item: dict,
+    sql_statements: list[str],
+):
+    auth_header = {"Authorization": f"Bearer {access_token}"}
+    res = await async_client.patch("/api/users/me", json={"nickname": "waffle"}, headers=auth_header)
+    assert res.status_code == 200
+    res = await async_client.post(f"/api/items/{item['id']}/reviews", json={"rating": 5, "comment": "good"}, headers=auth_header)
+    assert res.status_code == 201
+    review_id = res.json()["review_id"]
+
+    sql_statements.clear()
+    res = await async_client.delete(f"/api/items/{item['id']}", headers=auth_header)
+    assert res.status_code == 204
+    # 리뷰는 ORM 으로 읽어 하나씩 지우지 않고 외래 키의 ON DELETE CASCADE 로 지워집니다.
+    assert not any("FROM reviews" in s or s.startswith("DELETE FROM reviews") for s in sql_statements)
+
+    res = await async_client.get(f"/api/reviews/{review_id}")
+    assert res.status_code == 404
+
+@pytest.mark.asyncio
+async def test_delete_ordered_item(
+    async_client: AsyncClient,
+    access_token: str,
+    item: dict
+):
+    auth_header = {"Authorization": f"Bearer {access_token}"}
+    res = await async_client.post("/api/orders/", json={"items": [{"item_id": item["id"], "quantity": 1}]}, headers=auth_header)
+    assert res.status_code == 201
+
+    res = await async_client.delete(f"/api/items/{item['id']}", headers=auth_header)
+    assert res.status_code == 409
+    assert res.json()["error_code"] == "ERR_027"
+    assert res.json()["error_msg"] == "ITEM HAS ORDERS"
+
+    res = await async_client.get("/api/items/", params={"store_id": item["store_id"]})
+    assert [i["id"] for i in res.json()] == [item["id"]]
+
+@pytest.mark.asyncio
+async def test_delete_item_ordered_after_the_check(
+    async_client: AsyncClient,
+    access_token: str,
+    item: dict,
+    monkeypatch,
+):
+    from wapang.app.items.repositories import ItemRepository
+
+    auth_header = {"Authorization": f"Bearer {access_token}"}
+    res = await async_client.post("/api/orders/", json={"items": [{"item_id": item["id"], "quantity": 1}]}, headers=auth_header)
+    assert res.status_code == 201
+
+    # 첫 확인은 주문이 들어오기 전에 본 것처럼 False 를 돌려줍니다.
+    has_order_lines = ItemRepository.has_order_lines
+    checks = []
+
+    async def _racy_check(self, product_id):
+        checks.append(product_id)
+        return len(checks) > 1 and await has_order_lines(self, product_id)
+
+    monkeypatch.setattr(ItemRepository, "has_order_lines", _racy_check)
+    res = await async_client.delete(f"/api/items/{item['id']}", headers=auth_header)
+    assert res.status_code == 409
+    assert res.json()["error_code"] == "ERR_027"
+    assert len(checks) == 2
+
+@pytest.mark.asyncio
+async def test_delete_item_in_a_cart(
+    async_client: AsyncClient,
+    access_token: str,
+    item: dict
+):
+    auth_header = {"Authorization": f"Bearer {access_token}"}
+    res = await async_client.patch("/api/carts/", json={"item_id": item["id"], "quantity": 1}, headers=auth_header)
+    assert res.status_code == 200
+
+    # 장바구니 라인만 참조하는 상품은 ERR_027 없이 지워지고 장바구니에서도 빠집니다.
+    res = await async_client.delete(f"/api/items/{item['id']}", headers=auth_header)
+    assert res.status_code == 204
+
+    res = await async_client.get("/api/carts/", headers=auth_header)
+    assert res.json() == {"details": [], "total_price": 0}
+
 @pytest.mark.asyncio
 async def test_delete_item_not_found(
     async_client: AsyncClient,
@@ -356,4 +558,74 @@ async def test_get_store_items_no_store(
     res_json = res.json()
     assert res.status_code == 404
     assert res_json["error_code"] == "ERR_010"
-    assert res_json["error_msg"] == "STORE NOT FOUND"
\ No newline at end of file
+    assert res_json["error_msg"] == "STORE NOT FOUND"
+@pytest.mark.asyncio
+async def test_request_uses_one_session_and_connection(
+    async_client: AsyncClient,
+    access_token: str,
+    item: dict,
+):
+    auth_header = {"Authorization": f"Bearer {access_token}"}
+    res = await async_client.patch("/api/users/me", json={"nickname": "waffle"}, headers=auth_header)
+    assert res.status_code == 200
+    assert res.headers["X-DB-Connections"] == "1"
+
+    # ItemService 의 네 레포지토리와 login_with_header 의 UserService 가 같은 세션을 씁니다.
+    res = await async_client.post(f"/api/items/{item['id']}/reviews", json={"rating": 5, "comment": "Great"}, headers=auth_header)
+    assert res.status_code == 201
+    assert res.headers["X-DB-Connections"] == "1"
+
+@pytest.mark.asyncio
+async def test_second_checkout_in_request_is_counted(
+    async_client: AsyncClient,
+):
+    from sqlalchemy import select
+    from wapang.database.async_connection import async_db_manager
+    from wapang.database.request_usage import RequestDbUsage, track_db_usage
+
+    with track_db_usage() as usage:
+        for _ in range(2):
+            async with async_db_manager.session_factory() as session:
+                await session.execute(select(1))
+    assert usage.checkouts == 2
+
+    strict = RequestDbUsage(strict=True)
+    strict.record_checkout()
+    with pytest.raises(AssertionError):
+        strict.record_checkout()
+
+@pytest.mark.asyncio
+async def test_item_endpoints_commit_once(
+    async_client: AsyncClient,
+    access_token: str,
+    store: dict,
+    item_create_request: dict,
+    commits: list,
+):
+    auth_header = {"Authorization": f"Bearer {access_token}"}
+
+    commits.clear()
+    res = await async_client.post("/api/items/", json=item_create_request, headers=auth_header)
+    assert res.status_code == 201
+    assert len(commits) == 1
+    item_id = res.json()["id"]
+
+    # 쓰기가 커밋된 뒤에야 캐시가 비워지므로 다음 조회에 바로 반영됩니다.
+    res = await async_client.get(f"/api/stores/{store['id']}/items")
+    assert [i["id"] for i in res.json()] == [item_id]
+
+    commits.clear()
+    res = await async_client.patch(f"/api/items/{item_id}", json={"price": 100}, headers=auth_header)
+    assert res.status_code == 200
+    assert len(commits) == 1
+
+    res = await async_client.get(f"/api/stores/{store['id']}/items")
+    assert res.json()[0]["price"] == 100
+
+    commits.clear()
+    res = await async_client.delete(f"/api/items/{item_id}", headers=auth_header)
+    assert res.status_code == 204
+    assert len(commits) == 1
+
+    res = await async_client.get(f"/api/stores/{store['id']}/items")
+    assert res.json() == []
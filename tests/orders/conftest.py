@@ -58,4 +58,33 @@ async def order(async_client: "AsyncClient", access_token: str, order_items: lis
     assert res.status_code == 201
     res_json = res.json()
     assert res_json["order_id"] is not None
-    return res_json
\ No newline at end of file
+    return res_json
+
+
+@pytest_asyncio.fixture(scope="function")
+async def file_backed_db(async_client: "AsyncClient", tmp_path, monkeypatch):
+    """요청마다 별도 커넥션을 쓰는 파일 SQLite 로 앱의 세션 팩토리를 바꿉니다.
+
+    기본 테스트 엔진은 인메모리 DB 라 모든 세션이 커넥션 하나를 공유하므로
+    동시 트랜잭션을 검증하는 테스트에서는 이 fixture 를 가장 먼저 요청해야 합니다.
+    커밋/롤백은 앱의 get_unit_of_work 가 그대로 맡습니다.
+    """
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from wapang.database.common import Base
+    from wapang.database.async_connection import async_db_manager
+
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'wapang.db'}",
+        connect_args={"timeout": 30},
+        pool_size=10,
+        pool_timeout=60,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    monkeypatch.setattr(
+        async_db_manager, "session_factory", async_sessionmaker(bind=engine, expire_on_commit=False)
+    )
+    yield
+    await engine.dispose()
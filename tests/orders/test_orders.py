@@ -132,6 +132,28 @@ async def test_get_order(
     res_json = res.json()
     assert res_json == order
 
+@pytest.mark.asyncio
+async def test_get_order_keeps_price_at_order_time(
+    async_client: "AsyncClient",
+    access_token: str,
+    order_items: list[dict],
+    order: dict,
+    sql_statements: list[str],
+):
+    auth_header = {"Authorization": f"Bearer {access_token}"}
+    item = order_items[0]
+    res = await async_client.patch(f"/api/items/{item['id']}", json={"price": item["price"] * 10}, headers=auth_header)
+    assert res.status_code == 200
+
+    sql_statements.clear()
+    res = await async_client.get(f"/api/orders/{order['order_id']}", headers=auth_header)
+    assert res.status_code == 200
+    assert res.json() == order
+
+    order_reads = [s for s in sql_statements if "FROM order_products" in s]
+    assert len(order_reads) == 1
+    assert "JOIN" not in order_reads[0]
+
 @pytest.mark.asyncio
 async def test_get_order_with_invalid_order_id(
     async_client: "AsyncClient",
@@ -243,4 +265,109 @@ async def test_get_orders_by_user(
     assert res.status_code == 200
     res_json = res.json()
     assert isinstance(res_json, list)
-    assert len(res_json) >= 1
\ No newline at end of file
+    assert len(res_json) >= 1
+@pytest.mark.asyncio
+async def test_concurrent_orders_do_not_oversell(
+    file_backed_db,
+    async_client: "AsyncClient",
+    access_token: str,
+    item: dict,
+):
+    import asyncio
+
+    auth_header = {"Authorization": f"Bearer {access_token}"}
+    req = {"items": [{"item_id": item["id"], "quantity": 1}]}
+
+    responses = await asyncio.gather(
+        *(async_client.post("/api/orders/", json=req, headers=auth_header) for _ in range(200))
+    )
+    status_codes = [res.status_code for res in responses]
+    assert status_codes.count(201) == item["stock"]
+    assert status_codes.count(409) == 200 - item["stock"]
+
+    res = await async_client.get("/api/items/")
+    assert res.json()[0]["stock"] == 0
+
+    res = await async_client.get("/api/users/me/orders", headers=auth_header)
+    assert len(res.json()) == item["stock"]
+
+@pytest.mark.asyncio
+async def test_create_order_with_idempotency_key(
+    async_client: "AsyncClient",
+    access_token: str,
+    order_items: list[dict],
+):
+    headers = {"Authorization": f"Bearer {access_token}", "Idempotency-Key": "order-retry-1"}
+    req = {"items": [{"item_id": order_items[0]["id"], "quantity": 2}]}
+
+    res = await async_client.post("/api/orders/", json=req, headers=headers)
+    assert res.status_code == 201
+
+    retry = await async_client.post("/api/orders/", json=req, headers=headers)
+    assert retry.status_code == 201
+    assert retry.json() == res.json()
+
+    res = await async_client.get("/api/users/me/orders", headers={"Authorization": f"Bearer {access_token}"})
+    assert len(res.json()) == 1
+
+    res = await async_client.get("/api/items/", params={"store_id": order_items[0]["store_id"]})
+    stocks = {item["id"]: item["stock"] for item in res.json()}
+    assert stocks[order_items[0]["id"]] == order_items[0]["stock"] - 2
+
+@pytest.mark.asyncio
+async def test_create_order_with_reused_idempotency_key(
+    async_client: "AsyncClient",
+    access_token: str,
+    order_items: list[dict],
+):
+    headers = {"Authorization": f"Bearer {access_token}", "Idempotency-Key": "order-retry-2"}
+
+    res = await async_client.post("/api/orders/", json={"items": [{"item_id": order_items[0]["id"], "quantity": 1}]}, headers=headers)
+    assert res.status_code == 201
+
+    res = await async_client.post("/api/orders/", json={"items": [{"item_id": order_items[1]["id"], "quantity": 1}]}, headers=headers)
+    assert res.status_code == 422
+    assert res.json()["error_code"] == "ERR_026"
+    assert res.json()["error_msg"] == "IDEMPOTENCY KEY REUSED"
+
+@pytest.mark.asyncio
+async def test_failed_order_does_not_consume_idempotency_key(
+    async_client: "AsyncClient",
+    access_token: str,
+    order_items: list[dict],
+):
+    headers = {"Authorization": f"Bearer {access_token}", "Idempotency-Key": "order-retry-3"}
+    req = {"items": [{"item_id": order_items[0]["id"], "quantity": order_items[0]["stock"] + 1}]}
+
+    res = await async_client.post("/api/orders/", json=req, headers=headers)
+    assert res.status_code == 409
+
+    res = await async_client.post("/api/orders/", json=req, headers=headers)
+    assert res.status_code == 409
+    assert res.json()["error_code"] == "ERR_017"
+
+@pytest.mark.asyncio
+async def test_order_endpoints_commit_once(
+    async_client: "AsyncClient",
+    access_token: str,
+    order_items: list[dict],
+    commits: list,
+):
+    auth_header = {"Authorization": f"Bearer {access_token}"}
+    req = {"items": [{"item_id": order_items[0]["id"], "quantity": 1}]}
+
+    commits.clear()
+    res = await async_client.post("/api/orders/", json=req, headers=auth_header)
+    assert res.status_code == 201
+    assert len(commits) == 1
+    order_id = res.json()["order_id"]
+
+    commits.clear()
+    res = await async_client.patch(f"/api/orders/{order_id}", json={"status": "CANCELED"}, headers=auth_header)
+    assert res.status_code == 200
+    assert len(commits) == 1
+
+    commits.clear()
+    res = await async_client.post("/api/orders/", json={"items": [{"item_id": order_items[0]["id"], "quantity": 10_000}]}, headers=auth_header)
+    assert res.status_code == 409
+    assert commits == []
@@ -258,6 +258,29 @@ async def test_delete_review(
     assert res_json["error_code"] == "ERR_022"
     assert res_json["error_msg"] == "REVIEW NOT FOUND"
 
+@pytest.mark.asyncio
+async def test_rating_aggregates_follow_review_changes(
+    async_client: AsyncClient,
+    access_token: str,
+    item: dict,
+    review: dict
+):
+    async def get_rating() -> tuple[int, int]:
+        res = await async_client.get("/api/items/", params={"store_id": item["store_id"]})
+        assert res.status_code == 200
+        listed = next(i for i in res.json() if i["id"] == item["id"])
+        return listed["rating_count"], listed["rating_sum"]
+
+    assert await get_rating() == (1, 4)
+
+    res = await async_client.patch(f"/api/reviews/{review['review_id']}", json={"rating": 2}, headers={"Authorization": f"Bearer {access_token}"})
+    assert res.status_code == 200
+    assert await get_rating() == (1, 2)
+
+    res = await async_client.delete(f"/api/reviews/{review['review_id']}", headers={"Authorization": f"Bearer {access_token}"})
+    assert res.status_code == 204
+    assert await get_rating() == (0, 0)
+
 @pytest.mark.asyncio
 async def test_delete_review_of_another_user(
     async_client: AsyncClient,
@@ -336,6 +359,22 @@ async def test_list_reviews_without_login(
         else:
             assert False
 
+@pytest.mark.asyncio
+async def test_list_reviews_loads_writers_in_one_query(
+    async_client: AsyncClient,
+    item: dict,
+    review: dict,
+    another_review: dict,
+    sql_statements: list[str],
+):
+    sql_statements.clear()
+    res = await async_client.get(f"/api/items/{item['id']}/reviews")
+    assert res.status_code == 200
+    assert len(res.json()) == 2
+
+    assert len([s for s in sql_statements if "FROM reviews" in s]) == 1
+    assert len([s for s in sql_statements if "FROM users" in s]) == 1
+
 @pytest.mark.asyncio
 async def test_list_reviews_with_nonexistent_item(
     async_client: AsyncClient,
@@ -349,6 +388,74 @@ async def test_list_reviews_with_nonexistent_item(
     assert res_json["error_code"] == "ERR_013"
     assert res_json["error_msg"] == "ITEM NOT FOUND"
 
+@pytest.mark.asyncio
+async def test_list_reviews_uses_sort_indexes(
+    explain_query_plan,
+):
+    from sqlalchemy import select
+    from wapang.app.reviews.models import Review
+
+    plan = await explain_query_plan(
+        select(Review)
+        .where(Review.product_id == "product")
+        .order_by(Review.created_at.desc(), Review.id.desc())
+    )
+    assert any("ix_reviews_product_id_created_at_id" in detail for detail in plan)
+    assert not any("TEMP B-TREE" in detail for detail in plan)
+
+    plan = await explain_query_plan(
+        select(Review)
+        .where(Review.product_id == "product")
+        .order_by(Review.rating, Review.id)
+    )
+    assert any("ix_reviews_product_id_rating_id" in detail for detail in plan)
+    assert not any("TEMP B-TREE" in detail for detail in plan)
+
+@pytest.mark.asyncio
+async def test_list_reviews_sorted_and_paginated(
+    async_client: AsyncClient,
+    item: dict,
+    review: dict,
+    another_review: dict,
+):
+    res = await async_client.get(f"/api/items/{item['id']}/reviews", params={"limit": 1})
+    assert res.status_code == 200
+    assert [r["review_id"] for r in res.json()] == [another_review["review_id"]]
+    cursor = res.headers["X-Next-Cursor"]
+
+    res = await async_client.get(f"/api/items/{item['id']}/reviews", params={"limit": 1, "cursor": cursor})
+    assert res.status_code == 200
+    assert [r["review_id"] for r in res.json()] == [review["review_id"]]
+    assert "X-Next-Cursor" not in res.headers
+
+    res = await async_client.get(f"/api/items/{item['id']}/reviews", params={"sort": "highest"})
+    assert [r["rating"] for r in res.json()] == [4, 3]
+
+    res = await async_client.get(f"/api/items/{item['id']}/reviews", params={"sort": "lowest", "limit": 1})
+    assert [r["rating"] for r in res.json()] == [3]
+    res = await async_client.get(
+        f"/api/items/{item['id']}/reviews",
+        params={"sort": "lowest", "limit": 1, "cursor": res.headers["X-Next-Cursor"]},
+    )
+    assert [r["rating"] for r in res.json()] == [4]
+
+@pytest.mark.asyncio
+async def test_list_reviews_with_invalid_sort_or_cursor(
+    async_client: AsyncClient,
+    item: dict,
+    review: dict,
+    another_review: dict,
+):
+    res = await async_client.get(f"/api/items/{item['id']}/reviews", params={"sort": "oldest"})
+    assert res.status_code == 400
+    assert res.json()["error_code"] == "ERR_003"
+
+    res = await async_client.get(f"/api/items/{item['id']}/reviews", params={"sort": "highest", "limit": 1})
+    cursor = res.headers["X-Next-Cursor"]
+    res = await async_client.get(f"/api/items/{item['id']}/reviews", params={"sort": "newest", "cursor": cursor})
+    assert res.status_code == 400
+    assert res.json()["error_code"] == "ERR_003"
+
 @pytest.mark.asyncio
 async def test_list_user_reviews(
     async_client: AsyncClient,
@@ -368,4 +475,58 @@ async def test_list_user_reviews(
                 assert r["rating"] == review["rating"]
                 assert r["comment"] == review["comment"]
                 break
-        assert found is True
\ No newline at end of file
+        assert found is True
+@pytest.mark.asyncio
+async def test_list_user_reviews_in_one_query(
+    async_client: AsyncClient,
+    access_token: str,
+    items: list[dict],
+    reviews: dict,
+    sql_statements: list[str],
+):
+    sql_statements.clear()
+    res = await async_client.get("/api/users/me/reviews", headers={"Authorization": f"Bearer {access_token}"})
+    assert res.status_code == 200
+    item_names = {item["id"]: item["item_name"] for item in items}
+    for r in res.json():
+        assert r["item_name"] == item_names[r["item_id"]]
+
+    review_reads = [s for s in sql_statements if "reviews" in s]
+    assert len(review_reads) == 1
+    assert "JOIN products" in review_reads[0]
+    assert not any("FROM products" in s for s in sql_statements)
+
+@pytest.mark.asyncio
+async def test_create_review_commits_once(
+    async_client: AsyncClient,
+    access_token: str,
+    item: dict,
+    commits: list,
+):
+    auth_header = {"Authorization": f"Bearer {access_token}"}
+    res = await async_client.patch("/api/users/me", json={"nickname": "김와플"}, headers=auth_header)
+    assert res.status_code == 200
+
+    commits.clear()
+    res = await async_client.post(f"/api/items/{item['id']}/reviews", json={"rating": 5, "comment": "Great"}, headers=auth_header)
+    assert res.status_code == 201
+    assert len(commits) == 1
+
+@pytest.mark.asyncio
+async def test_update_and_delete_review_commit_once(
+    async_client: AsyncClient,
+    access_token: str,
+    review: dict,
+    commits: list,
+):
+    auth_header = {"Authorization": f"Bearer {access_token}"}
+
+    commits.clear()
+    res = await async_client.patch(f"/api/reviews/{review['review_id']}", json={"rating": 1}, headers=auth_header)
+    assert res.status_code == 200
+    assert len(commits) == 1
+
+    commits.clear()
+    res = await async_client.delete(f"/api/reviews/{review['review_id']}", headers=auth_header)
+    assert res.status_code == 204
+    assert len(commits) == 1
@@ -174,6 +174,100 @@ async def test_create_store_already_exists(
     assert res_json["error_code"] == "ERR_008"
     assert res_json["error_msg"] == "STORE ALREADY EXISTS"
 
+@pytest.mark.asyncio
+async def test_create_store_checks_duplicates_in_one_query(
+    async_client: AsyncClient,
+    access_token: str,
+    store_create_request: dict,
+    sql_statements: list[str],
+):
+    sql_statements.clear()
+    res = await async_client.post("/api/stores/", json=store_create_request, headers={"Authorization": f"Bearer {access_token}"})
+    assert res.status_code == 201
+
+    store_reads = [s for s in sql_statements if s.startswith("SELECT") and "FROM stores" in s]
+    assert len(store_reads) == 1
+
+@pytest.mark.asyncio
+async def test_create_store_conflict_from_unique_constraint(
+    async_client: AsyncClient,
+    store: dict,
+    access_token: str,
+    another_user_access_token: str,
+    store_create_request: dict,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from wapang.app.stores.repositories import StoreRepository
+
+    # 중복 조회를 통과한 직후 다른 요청이 같은 값을 먼저 쓴 상황을 흉내 냅니다.
+    # 첫 조회만 비어 있고, 고유 제약 위반 뒤의 재조회는 실제 DB 를 봅니다.
+    get_conflicting_fields = StoreRepository.get_conflicting_fields
+    calls = []
+
+    async def racy_conflicts(self, *args):
+        calls.append(args)
+        if len(calls) % 2:
+            return set()
+        return await get_conflicting_fields(self, *args)
+    monkeypatch.setattr(StoreRepository, "get_conflicting_fields", racy_conflicts)
+
+    req = {**store_create_request, "email": "spring@wafflestudio.com", "phone_number": "010-1111-2222"}
+    res = await async_client.post("/api/stores/", json=req, headers={"Authorization": f"Bearer {another_user_access_token}"})
+    assert res.status_code == 409
+    assert res.json()["error_code"] == "ERR_009"
+
+    req = {**store_create_request, "store_name": "Your Store", "email": "spring@wafflestudio.com", "phone_number": "010-1111-2222"}
+    res = await async_client.post("/api/stores/", json=req, headers={"Authorization": f"Bearer {access_token}"})
+    assert res.status_code == 409
+    assert res.json()["error_code"] == "ERR_008"
+    assert len(calls) == 4
+
+@pytest.mark.asyncio
+async def test_create_store_conflict_the_recheck_cannot_find(
+    async_client: AsyncClient,
+    store: dict,
+    another_user_access_token: str,
+    store_create_request: dict,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from wapang.app.stores.repositories import StoreRepository
+
+    # 고유 제약은 위반했지만 두 번의 조회 모두 겹친 컬럼을 찾지 못해도 500 이 아니라 409 를 돌려줍니다.
+    async def no_conflicts(self, *args):
+        return set()
+    monkeypatch.setattr(StoreRepository, "get_conflicting_fields", no_conflicts)
+
+    req = {**store_create_request, "email": "spring@wafflestudio.com", "phone_number": "010-1111-2222"}
+    res = await async_client.post("/api/stores/", json=req, headers={"Authorization": f"Bearer {another_user_access_token}"})
+    assert res.status_code == 409
+    assert res.json()["error_code"] == "ERR_009"
+
+@pytest.fixture
+def case_insensitive_store_name(monkeypatch: pytest.MonkeyPatch) -> None:
+    """store_name 컬럼을 MySQL 기본 콜레이션처럼 대소문자를 무시하도록 만듭니다. async_client 보다 먼저 요청해야 합니다."""
+    from wapang.app.stores.models import Store
+
+    monkeypatch.setattr(Store.__table__.c.store_name.type, "collation", "NOCASE")
+
+@pytest.mark.asyncio
+async def test_create_store_conflict_under_case_insensitive_collation(
+    case_insensitive_store_name: None,
+    async_client: AsyncClient,
+    store: dict,
+    access_token: str,
+    store_create_request: dict,
+):
+    # 어느 필드가 겹쳤는지는 DB 의 비교로 정하므로, 대소문자만 다른 이름도 충돌로 찾습니다.
+    req = {
+        **store_create_request,
+        "store_name": store_create_request["store_name"].upper(),
+        "email": "spring@wafflestudio.com",
+        "phone_number": "010-1111-2222",
+    }
+    res = await async_client.post("/api/stores/", json=req, headers={"Authorization": f"Bearer {access_token}"})
+    assert res.status_code == 409
+    assert res.json()["error_code"] == "ERR_009"
+
 @pytest.mark.asyncio
 async def test_patch_store(
     async_client: AsyncClient,
@@ -399,4 +493,157 @@ async def test_get_store_not_found(
     assert res.status_code == 404
     res_json = res.json()
     assert res_json["error_code"] == "ERR_010"
-    assert res_json["error_msg"] == "STORE NOT FOUND"
\ No newline at end of file
+    assert res_json["error_msg"] == "STORE NOT FOUND"
+@pytest.mark.asyncio
+async def test_get_store_is_cached_until_modified(
+    async_client: AsyncClient,
+    access_token: str,
+    store: dict,
+    sql_statements: list[str],
+):
+    store_id = store["id"]
+    res = await async_client.get(f"/api/stores/{store_id}")
+    assert res.status_code == 200
+
+    sql_statements.clear()
+    res = await async_client.get(f"/api/stores/{store_id}")
+    assert res.status_code == 200
+    assert res.json()["store_name"] == store["store_name"]
+    assert not any("FROM stores" in s for s in sql_statements)
+
+    res = await async_client.patch(f"/api/stores/{store_id}", json={"store_name": "Renamed Store"}, headers={"Authorization": f"Bearer {access_token}"})
+    assert res.status_code == 200
+
+    res = await async_client.get(f"/api/stores/{store_id}")
+    assert res.json()["store_name"] == "Renamed Store"
+
+@pytest.mark.asyncio
+async def test_get_store_page_read_racing_a_write_is_not_cached(
+    async_client: AsyncClient,
+    store: dict,
+    sql_statements: list[str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from wapang.app.stores.cache import invalidate_store_pages
+    from wapang.app.stores.repositories import StoreRepository
+
+    store_id = store["id"]
+    get_store_by_id = StoreRepository.get_store_by_id
+
+    # 조회한 직후, 본문을 캐시에 넣기 전에 다른 요청의 쓰기가 커밋되어 버전을 올린 상황입니다.
+    async def racing_write(self, id):
+        found = await get_store_by_id(self, id)
+        invalidate_store_pages(id)
+        return found
+
+    with monkeypatch.context() as m:
+        m.setattr(StoreRepository, "get_store_by_id", racing_write)
+        res = await async_client.get(f"/api/stores/{store_id}")
+        assert res.status_code == 200
+
+    # 늦게 저장된 본문은 새 버전에서 보이지 않으므로 다시 조회합니다.
+    sql_statements.clear()
+    res = await async_client.get(f"/api/stores/{store_id}")
+    assert res.status_code == 200
+    assert any("FROM stores" in s for s in sql_statements)
+
+@pytest.mark.asyncio
+async def test_get_store_items_is_cached_until_items_change(
+    async_client: AsyncClient,
+    access_token: str,
+    store: dict,
+    sql_statements: list[str],
+):
+    auth_header = {"Authorization": f"Bearer {access_token}"}
+    store_id = store["id"]
+    res = await async_client.post("/api/items/", json={"item_name": "초콜릿", "price": 5000, "stock": 10}, headers=auth_header)
+    assert res.status_code == 201
+    item_id = res.json()["id"]
+
+    res = await async_client.get(f"/api/stores/{store_id}/items")
+    assert res.status_code == 200
+    assert [(i["item_name"], i["price"], i["stock"]) for i in res.json()] == [("초콜릿", 5000, 10)]
+
+    sql_statements.clear()
+    res = await async_client.get(f"/api/stores/{store_id}/items")
+    assert res.status_code == 200
+    assert not any("FROM products" in s for s in sql_statements)
+
+    res = await async_client.patch(f"/api/items/{item_id}", json={"price": 6000}, headers=auth_header)
+    assert res.status_code == 200
+    res = await async_client.get(f"/api/stores/{store_id}/items")
+    assert res.json()[0]["price"] == 6000
+
+    res = await async_client.delete(f"/api/items/{item_id}", headers=auth_header)
+    assert res.status_code == 204
+    res = await async_client.get(f"/api/stores/{store_id}/items")
+    assert res.json() == []
+
+    res = await async_client.post("/api/items/", json={"item_name": "사탕", "price": 3000, "stock": 10}, headers=auth_header)
+    item_id = res.json()["id"]
+    res = await async_client.get(f"/api/stores/{store_id}/items")
+    assert [i["item_name"] for i in res.json()] == ["사탕"]
+
+    res = await async_client.post("/api/orders/", json={"items": [{"item_id": item_id, "quantity": 3}]}, headers=auth_header)
+    assert res.status_code == 201
+    res = await async_client.get(f"/api/stores/{store_id}/items")
+    assert res.json()[0]["stock"] == 7
+
+@pytest.mark.asyncio
+async def test_get_store_conditional_requests(
+    async_client: AsyncClient,
+    access_token: str,
+    store: dict,
+    sql_statements: list[str],
+):
+    auth_header = {"Authorization": f"Bearer {access_token}"}
+    store_id = store["id"]
+    res = await async_client.get(f"/api/stores/{store_id}")
+    etag = res.headers["ETag"]
+    res = await async_client.get(f"/api/stores/{store_id}/items")
+    items_etag = res.headers["ETag"]
+
+    sql_statements.clear()
+    res = await async_client.get(f"/api/stores/{store_id}", headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    assert res.content == b""
+    assert res.headers["ETag"] == etag
+    res = await async_client.get(f"/api/stores/{store_id}/items", headers={"If-None-Match": items_etag})
+    assert res.status_code == 304
+    assert sql_statements == []
+
+    res = await async_client.post("/api/items/", json={"item_name": "초콜릿", "price": 5000, "stock": 10}, headers=auth_header)
+    assert res.status_code == 201
+
+    res = await async_client.get(f"/api/stores/{store_id}/items", headers={"If-None-Match": items_etag})
+    assert res.status_code == 200
+    assert len(res.json()) == 1
+    assert res.headers["ETag"] != items_etag
+
+    res = await async_client.get(f"/api/stores/{store_id}", headers={"If-None-Match": f'W/{etag}, "other"'})
+    assert res.status_code == 200
+
+    # "*" 로 없는 상점의 404 를 304 로 가리지 않습니다.
+    res = await async_client.get("/api/stores/invalid-store-id", headers={"If-None-Match": "*"})
+    assert res.status_code == 404
+    res = await async_client.get("/api/stores/invalid-store-id/items", headers={"If-None-Match": "*"})
+    assert res.status_code == 404
+
+@pytest.mark.asyncio
+async def test_patch_store_commits_once(
+    async_client: AsyncClient,
+    access_token: str,
+    store: dict,
+    commits: list,
+):
+    res = await async_client.get(f"/api/stores/{store['id']}")
+    assert res.status_code == 200
+
+    commits.clear()
+    res = await async_client.patch(f"/api/stores/{store['id']}", json={"delivery_fee": 100}, headers={"Authorization": f"Bearer {access_token}"})
+    assert res.status_code == 200
+    assert len(commits) == 1
+
+    # 캐시는 커밋이 끝난 뒤에 비워지므로 바로 다음 조회에 반영됩니다.
+    res = await async_client.get(f"/api/stores/{store['id']}")
+    assert res.json()["delivery_fee"] == 100
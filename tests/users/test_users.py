@@ -164,6 +164,23 @@ async def test_get_me_invalid_token(
     assert res_json["error_code"] == "ERR_007"
     assert res_json["error_msg"] == "INVALID TOKEN"
 
+@pytest.mark.asyncio
+async def test_cached_access_token_is_not_a_refresh_token(
+    async_client: AsyncClient,
+    access_token: str
+):
+    auth_header = {"Authorization": f"Bearer {access_token}"}
+
+    res = await async_client.get("/api/users/me", headers=auth_header)
+    assert res.status_code == 200
+
+    res = await async_client.get("/api/auth/tokens/refresh", headers=auth_header)
+    res_json = res.json()
+
+    assert res.status_code == 401
+    assert res_json["error_code"] == "ERR_007"
+    assert res_json["error_msg"] == "INVALID TOKEN"
+
 # TEST PATCH /api/users/me
 @pytest.mark.asyncio
 async def test_patch_me(
@@ -183,6 +200,36 @@ async def test_patch_me(
     assert res_json["nickname"] == req["nickname"]
     assert res_json["address"] == req["address"]
 
+@pytest.mark.asyncio
+async def test_get_me_uses_user_cache(
+    async_client: AsyncClient,
+    access_token: str,
+    sql_statements: list[str],
+):
+    auth_header = {"Authorization": f"Bearer {access_token}"}
+
+    res = await async_client.get("/api/users/me", headers=auth_header)
+    assert res.status_code == 200
+
+    sql_statements.clear()
+    res = await async_client.get("/api/users/me", headers=auth_header)
+    assert res.status_code == 200
+    assert not any("FROM users" in statement for statement in sql_statements)
+
+    res = await async_client.patch("/api/users/me", headers=auth_header, json={"nickname": "waffle"})
+    assert res.status_code == 200
+
+    res = await async_client.get("/api/users/me", headers=auth_header)
+    assert res.status_code == 200
+    assert res.json()["nickname"] == "waffle"
+
+    res = await async_client.patch("/api/users/me", headers=auth_header, json={"address": "Seoul"})
+    assert res.status_code == 200
+
+    res = await async_client.get("/api/users/me", headers=auth_header)
+    assert res.json()["nickname"] == "waffle"
+    assert res.json()["address"] == "Seoul"
+
 @pytest.mark.asyncio
 async def test_patch_me_random(
     async_client: AsyncClient,
@@ -254,6 +301,48 @@ async def test_get_me_orders(
     for i in range(3):
         assert res_json[i]["order_id"] is not None
 
+@pytest.mark.asyncio
+async def test_get_me_orders_paginated(
+    async_client: AsyncClient,
+    access_token: str,
+    orders
+):
+    auth_header = {"Authorization": f"Bearer {access_token}"}
+
+    res = await async_client.get("/api/users/me/orders", headers=auth_header, params={"limit": 2})
+    assert res.status_code == 200
+    first_page = res.json()
+    assert [o["order_id"] for o in first_page] == [orders[2]["order_id"], orders[1]["order_id"]]
+    assert set(first_page[0].keys()) == {"order_id", "total_price", "status", "created_at"}
+
+    res = await async_client.get(
+        "/api/users/me/orders",
+        headers=auth_header,
+        params={"limit": 2, "cursor": res.headers["X-Next-Cursor"]},
+    )
+    assert res.status_code == 200
+    assert [o["order_id"] for o in res.json()] == [orders[0]["order_id"]]
+    assert "X-Next-Cursor" not in res.headers
+
+    res = await async_client.get("/api/users/me/orders", headers=auth_header, params={"cursor": "invalid"})
+    assert res.status_code == 400
+    assert res.json()["error_code"] == "ERR_003"
+
+@pytest.mark.asyncio
+async def test_get_me_orders_uses_history_index(
+    explain_query_plan,
+):
+    from sqlalchemy import select
+    from wapang.app.orders.models import Order
+
+    plan = await explain_query_plan(
+        select(Order.id, Order.status, Order.total_price, Order.created_at)
+        .where(Order.user_id == "user")
+        .order_by(Order.created_at.desc(), Order.id.desc())
+    )
+    assert any("ix_orders_user_id_created_at_id" in detail for detail in plan)
+    assert not any("TEMP B-TREE" in detail for detail in plan)
+
 # TEST GET /api/users/me/reviews
 @pytest.mark.asyncio
 async def test_get_me_reviews(
@@ -270,4 +359,21 @@ async def test_get_me_reviews(
     assert len(res_json) == 1
     assert res_json[0]["item_name"] == "item0"
     assert res_json[0]["rating"] == 3
-    assert res_json[0]["comment"] == "good"
\ No newline at end of file
+    assert res_json[0]["comment"] == "good"
+@pytest.mark.asyncio
+async def test_patch_me_commits_once(
+    async_client: AsyncClient,
+    access_token: str,
+    commits: list,
+):
+    auth_header = {"Authorization": f"Bearer {access_token}"}
+
+    commits.clear()
+    res = await async_client.patch("/api/users/me", headers=auth_header, json={"nickname": "waffle"})
+    assert res.status_code == 200
+    assert len(commits) == 1
+
+    commits.clear()
+    res = await async_client.patch("/api/users/me", headers=auth_header, json={"invalid": "content"})
+    assert res.status_code == 400
+    assert commits == []
@@ -0,0 +1,28 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import argon2
+
+from wapang.app.auth.settings import AUTH_SETTINGS
+
+# argon2 는 CPU 를 오래 쓰는 연산이라 이벤트 루프 대신 전용 스레드 풀에서 실행합니다.
+# argon2-cffi 는 해싱 중 GIL 을 놓기 때문에 스레드로도 병렬 처리가 됩니다.
+password_hasher = argon2.PasswordHasher()
+
+password_executor = ThreadPoolExecutor(
+    max_workers=AUTH_SETTINGS.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="argon2",
+)
+
+async def hash_password(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, password_hasher.hash, password)
+
+async def check_password(plain_password: str, hashed_password: str) -> bool:
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(
+            password_executor, password_hasher.verify, hashed_password, plain_password
+        )
+    except argon2.exceptions.VerifyMismatchError:
+        return False
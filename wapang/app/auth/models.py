@@ -8,4 +8,4 @@ class BlockedToken(Base):
     __tablename__ = "blocked_tokens"
 
     token: Mapped[str] = mapped_column(String(512), primary_key=True)
-    expired_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
\ No newline at end of file
+    expired_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
\ No newline at end of file
@@ -0,0 +1,79 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from wapang.app.auth.repositories import AuthRepository
+from wapang.app.auth.revocation import rebuild_revoked_tokens
+from wapang.app.auth.settings import AUTH_SETTINGS
+
+logger = logging.getLogger('uvicorn.error')
+
+
+class TokenPurgeStats:
+    def __init__(self) -> None:
+        self.runs = 0
+        self.batches = 0
+        self.rows_purged = 0
+        self.last_run_rows = 0
+        self.last_batch_seconds = 0.0
+        self.max_batch_seconds = 0.0
+        self.last_run_at: datetime | None = None
+
+    def record_batch(self, rows: int, seconds: float) -> None:
+        self.batches += 1
+        self.rows_purged += rows
+        self.last_run_rows += rows
+        self.last_batch_seconds = seconds
+        self.max_batch_seconds = max(self.max_batch_seconds, seconds)
+
+
+token_purge_stats = TokenPurgeStats()
+
+
+async def purge_expired_tokens(
+    session_factory: async_sessionmaker[AsyncSession],
+    batch_size: int = AUTH_SETTINGS.TOKEN_PURGE_BATCH_SIZE,
+) -> int:
+    """만료된 blocked_tokens 를 batch_size 씩 나눠 지우고, 지운 행 수를 돌려줍니다."""
+    token_purge_stats.runs += 1
+    token_purge_stats.last_run_rows = 0
+    now = datetime.now()
+    token_purge_stats.last_run_at = now
+
+    while True:
+        started = time.perf_counter()
+        async with session_factory() as session:
+            purged = await AuthRepository(session).delete_expired_tokens(now, batch_size)
+            await session.commit()
+        token_purge_stats.record_batch(purged, time.perf_counter() - started)
+
+        if purged < batch_size:
+            break
+        # 긴 정리 작업이 다른 요청을 오래 막지 않도록 배치 사이에 양보합니다.
+        await asyncio.sleep(0)
+
+    if token_purge_stats.last_run_rows:
+        # 지운 토큰은 Bloom filter 에서 뺄 수 없으므로 남은 행으로 다시 만듭니다.
+        async with session_factory() as session:
+            await rebuild_revoked_tokens(session)
+
+    logger.info(
+        f"Purged {token_purge_stats.last_run_rows} expired blocked tokens "
+        f"(last batch {token_purge_stats.last_batch_seconds * 1000:.1f} ms)"
+    )
+    return token_purge_stats.last_run_rows
+
+
+async def run_token_purger(
+    session_factory: async_sessionmaker[AsyncSession],
+    interval_seconds: float = AUTH_SETTINGS.TOKEN_PURGE_INTERVAL_SECONDS,
+) -> None:
+    while True:
+        try:
+            await purge_expired_tokens(session_factory)
+        except Exception:
+            logger.exception("Failed to purge expired blocked tokens")
+        await asyncio.sleep(interval_seconds)
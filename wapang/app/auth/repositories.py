@@ -1,7 +1,8 @@
-from typing import Annotated
+from typing import Annotated, Sequence
 from datetime import datetime
 
 from fastapi import Depends
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
 from wapang.database.async_connection import get_async_db_session 
@@ -17,4 +18,27 @@ class AuthRepository:
             expired_at=exp
         )
         self.session.add(blocked_token)
-        await self.session.flush()
\ No newline at end of file
+        await self.session.flush()
+
+    async def is_token_blocked(self, token: str) -> bool:
+        tokenLoc = select(BlockedToken.token).where(BlockedToken.token == token)
+        return await self.session.scalar(tokenLoc) is not None
+
+    async def get_active_blocked_tokens(self, now: datetime) -> Sequence[str]:
+        tokensLoc = select(BlockedToken.token).where(BlockedToken.expired_at > now)
+        return (await self.session.scalars(tokensLoc)).all()
+
+
+    async def delete_expired_tokens(self, now: datetime, limit: int) -> int:
+        # MySQL 은 IN 서브쿼리에 LIMIT 을 허용하지 않아 키를 먼저 읽고 지웁니다.
+        tokensLoc = (
+            select(BlockedToken.token)
+            .where(BlockedToken.expired_at <= now)
+            .order_by(BlockedToken.expired_at)
+            .limit(limit)
+        )
+        tokens = (await self.session.scalars(tokensLoc)).all()
+        if not tokens:
+            return 0
+        await self.session.execute(delete(BlockedToken).where(BlockedToken.token.in_(tokens)))
+        return len(tokens)
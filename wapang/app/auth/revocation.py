@@ -0,0 +1,46 @@
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from wapang.app.auth.repositories import AuthRepository
+from wapang.app.auth.settings import AUTH_SETTINGS
+from wapang.common.bloom import BloomFilter
+
+# 차단된 refresh token 의 인메모리 Bloom filter 입니다.
+# 필터에 없으면 확실히 차단되지 않은 토큰이므로 DB 를 보지 않고,
+# 필터에 있을 때만 blocked_tokens 를 조회해 거짓 양성을 걸러냅니다.
+revoked_tokens = BloomFilter(AUTH_SETTINGS.REVOKED_TOKEN_FILTER_CAPACITY)
+
+# 필터에 넣었지만 아직 재구성 스냅샷에서 확인되지 않은 토큰입니다.
+# 재구성의 SELECT 이후에 커밋된 차단이 새 필터에서 빠지지 않도록 함께 넣습니다.
+_unconfirmed_tokens: set[str] = set()
+
+
+def revoke_token(token: str) -> None:
+    _unconfirmed_tokens.add(token)
+    revoked_tokens.add(token)
+
+
+def clear_revoked_tokens() -> None:
+    _unconfirmed_tokens.clear()
+    revoked_tokens.clear()
+
+
+async def rebuild_revoked_tokens(session: AsyncSession) -> int:
+    tokens = await AuthRepository(session).get_active_blocked_tokens(datetime.now())
+
+    # await 이후로는 양보하지 않고 새 필터를 만들어 한 번에 바꿉니다.
+    rebuilt = BloomFilter(AUTH_SETTINGS.REVOKED_TOKEN_FILTER_CAPACITY)
+    for token in tokens:
+        rebuilt.add(token)
+    for token in _unconfirmed_tokens:
+        rebuilt.add(token)
+    _unconfirmed_tokens.difference_update(tokens)
+    revoked_tokens.replace(rebuilt)
+    return len(tokens)
+
+
+async def is_token_revoked(auth_repository: AuthRepository, token: str) -> bool:
+    if token not in revoked_tokens:
+        return False
+    return await auth_repository.is_token_blocked(token)
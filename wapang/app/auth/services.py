@@ -2,6 +2,7 @@ from typing import Annotated
 from datetime import datetime
 
 from fastapi import Depends
+from sqlalchemy.exc import IntegrityError
 
 from wapang.app.auth.utils import (
     verify_password,
@@ -15,8 +16,11 @@ from wapang.app.auth.exceptions import (
     InvalidTokenException
 )
 from wapang.app.auth.repositories import AuthRepository
+from wapang.app.auth.revocation import is_token_revoked, revoke_token
 from wapang.app.auth.settings import AUTH_SETTINGS
 from wapang.app.users.repositories import UserRepository
+from wapang.database.async_connection import get_unit_of_work
+from wapang.database.unit_of_work import UnitOfWork
 
 ACCESS_TOKEN_SECRET = AUTH_SETTINGS.ACCESS_TOKEN_SECRET
 REFRESH_TOKEN_SECRET = AUTH_SETTINGS.REFRESH_TOKEN_SECRET
@@ -26,16 +30,18 @@ LONG_SESSION_LIFESPAN = AUTH_SETTINGS.LONG_SESSION_LIFESPAN
 class AuthService:
     def __init__(self, 
                  auth_repository: Annotated[AuthRepository, Depends()],
-                 user_repository: Annotated[UserRepository, Depends()]) -> None:
+                 user_repository: Annotated[UserRepository, Depends()],
+                 unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)]) -> None:
         self.auth_repository = auth_repository
         self.user_repository = user_repository
+        self.unit_of_work = unit_of_work
 
     async def signin(self, email: str, password: str) -> tuple[str, str]:
         user = await self.user_repository.get_user_by_email(email)
         if user is None:
             raise InvalidAccountException()
 
-        verify_password(password, user.hashed_password)
+        await verify_password(password, user.hashed_password)
 
         access_token = issue_token(user.id, SHORT_SESSION_LIFESPAN, ACCESS_TOKEN_SECRET)
         refresh_token = issue_token(user.id, LONG_SESSION_LIFESPAN, REFRESH_TOKEN_SECRET)
@@ -43,13 +49,21 @@ class AuthService:
         return access_token, refresh_token
     
     async def block_refresh_token(self, token: str, exp: datetime) -> None:
-        await self.auth_repository.block_refresh_token(token, exp)
+        try:
+            async with self.unit_of_work.savepoint():
+                await self.auth_repository.block_refresh_token(token, exp)
+        except IntegrityError:
+            # 같은 토큰으로 동시에 들어온 다른 요청이 먼저 막았으므로, 이미 쓴 토큰으로 취급합니다.
+            raise InvalidTokenException()
+        revoke_token(token)
     
     async def refresh_tokens(self, authorization: str | None) -> tuple[str, str]:
         if authorization is None:
             raise UnauthenticatedException()
         token = get_token_from_authorization_header(authorization)
         claims = verify_and_decode_token(token, REFRESH_TOKEN_SECRET)
+        if await is_token_revoked(self.auth_repository, token):
+            raise InvalidTokenException()
         
         exp = claims.get("exp", None)
         if exp is None:
@@ -70,6 +84,8 @@ class AuthService:
             raise UnauthenticatedException()
         token = get_token_from_authorization_header(authorization)
         claims = verify_and_decode_token(token, REFRESH_TOKEN_SECRET)
+        if await is_token_revoked(self.auth_repository, token):
+            raise InvalidTokenException()
 
         exp = claims.get("exp", None)
         if exp is None:
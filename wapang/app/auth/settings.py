@@ -8,6 +8,14 @@ class AuthSettings(BaseSettings):
     REFRESH_TOKEN_SECRET: str
     SHORT_SESSION_LIFESPAN: int = 15
     LONG_SESSION_LIFESPAN: int = 24 * 60
+    USER_CACHE_TTL_SECONDS: int = 30
+    USER_CACHE_MAX_SIZE: int = 1024
+    TOKEN_CACHE_MAX_SIZE: int = 4096
+    REVOKED_TOKEN_FILTER_CAPACITY: int = 100_000
+    TOKEN_PURGE_INTERVAL_SECONDS: int = 60 * 60
+    TOKEN_PURGE_BATCH_SIZE: int = 1000
+    # 이벤트 루프가 쓸 코어 하나는 남겨 둡니다.
+    PASSWORD_HASH_WORKERS: int = max(1, (os.cpu_count() or 1) - 1)
 
     model_config = SettingsConfigDict(
         case_sensitive=False,
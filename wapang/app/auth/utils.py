@@ -1,12 +1,14 @@
+import time
+import uuid
 from datetime import datetime, timedelta
 from typing import Annotated, Optional
 
 from fastapi import Depends, Header
-import argon2
 from authlib.jose import jwt, JWTClaims
 from authlib.jose.errors import JoseError
 
 from wapang.app.users.services import UserService
+from wapang.app.auth.hashing import check_password
 from wapang.app.auth.settings import AUTH_SETTINGS
 from wapang.app.auth.exceptions import (
     BadAuthorizationHeaderException,
@@ -15,28 +17,44 @@ from wapang.app.auth.exceptions import (
     InvalidTokenException
 )
 from wapang.app.users.models import User
+from wapang.common.cache import TTLCache
 
-def verify_password(plain_password: str, hashed_password: str) -> None:
-	try:
-		argon2.PasswordHasher().verify(hashed_password, plain_password)
-	except argon2.exceptions.VerifyMismatchError:
+# 검증을 마친 토큰의 claims 를 토큰 자체의 exp 까지만 보관합니다.
+# 같은 토큰 문자열이라도 secret 이 다르면 다른 검증이므로 (secret, token) 을 키로 씁니다.
+token_claims_cache: TTLCache[tuple[str, str], JWTClaims] = TTLCache(
+	maxsize=AUTH_SETTINGS.TOKEN_CACHE_MAX_SIZE,
+	ttl=AUTH_SETTINGS.LONG_SESSION_LIFESPAN * 60,
+)
+
+async def verify_password(plain_password: str, hashed_password: str) -> None:
+	if not await check_password(plain_password, hashed_password):
 		raise InvalidAccountException()
 	
 def issue_token(user_id: str, lifespan_minutes: int, secret: str) -> str:
 	header = {'alg': 'HS256'}
 	payload = {
 		'sub': user_id,
+		'jti': uuid.uuid4().hex,
 		'exp': int((datetime.now() + timedelta(minutes=lifespan_minutes)).timestamp())
 	}
 	return str(jwt.encode(header, payload, key=secret), 'utf-8')
 
 def verify_and_decode_token(token: str, secret: str) -> JWTClaims:
+	cache_key = (secret, token)
+	claims = token_claims_cache.get(cache_key)
+	if claims is not None:
+		return claims
+
 	try:
 		claims = jwt.decode(token, key=secret)
 		claims.validate()
-		return claims
 	except JoseError:
 		raise InvalidTokenException()
+
+	exp = claims.get('exp', None)
+	if isinstance(exp, (int, float)):
+		token_claims_cache.set(cache_key, claims, ttl=exp - time.time())
+	return claims
 	
 def get_token_from_authorization_header(authorization: str) -> str:
 	authorization_parts = authorization.split()
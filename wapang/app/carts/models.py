@@ -1,11 +1,14 @@
 import uuid
-from sqlalchemy import Integer, ForeignKey, String
+from sqlalchemy import Index, Integer, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from wapang.database.common import Base
 
 
 class CartProduct(Base):
     __tablename__ = "cart_products"
+    __table_args__ = (
+        Index("ix_cart_products_user_id_product_id", "user_id", "product_id", unique=True),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
@@ -1,43 +1,173 @@
-from typing import Annotated, Sequence
+import uuid
+from typing import Annotated, NamedTuple, Sequence
 
 from fastapi import Depends
-from sqlalchemy import select, delete
-from sqlalchemy.orm import joinedload
+from sqlalchemy import Row, insert, select, delete
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from wapang.app.stores.models import Store
 from wapang.app.carts.models import CartProduct
+from wapang.app.carts.settings import CART_SETTINGS
+from wapang.app.carts.store import cart_store
 from wapang.app.items.models import Product
-from wapang.database.async_connection import get_async_db_session
+from wapang.database.async_connection import get_async_db_session, get_unit_of_work
+from wapang.database.unit_of_work import UnitOfWork
+
+
+class CartLine(NamedTuple):
+    product_id: str
+    name: str
+    price: int
+    count: int
+    store_id: str
+    store_name: str
+    delivery_fee: int
 
 
 class CartRepository:
     def __init__(self, session: Annotated[AsyncSession, Depends(get_async_db_session)]) -> None:
         self.session = session
         
-    async def get_cart_product(self, user_id: str, product_id: str) -> CartProduct | None:
-        cartLoc = select(CartProduct).where(CartProduct.user_id == user_id, CartProduct.product_id == product_id)
-        return await self.session.scalar(cartLoc)
+    async def get_counts(self, user_id: str) -> dict[str, int]:
+        cartLoc = select(CartProduct.product_id, CartProduct.count).where(CartProduct.user_id == user_id)
+        return dict((await self.session.execute(cartLoc)).tuples().all())
+
+    async def set_counts(self, user_id: str, counts: dict[str, int]) -> None:
+        # 수량이 0 이하인 상품은 지우고, 나머지는 (user_id, product_id) 유니크 인덱스로 한 번에 upsert 합니다.
+        to_delete = [product_id for product_id, count in counts.items() if count <= 0]
+        rows = [
+            {"id": str(uuid.uuid4()), "user_id": user_id, "product_id": product_id, "count": count}
+            for product_id, count in counts.items()
+            if count > 0
+        ]
+        if to_delete:
+            await self.session.execute(
+                delete(CartProduct).where(CartProduct.user_id == user_id, CartProduct.product_id.in_(to_delete))
+            )
+        if rows:
+            await self.session.execute(self._upsert_counts(rows))
+
+    def _upsert_counts(self, rows: list[dict]):
+        if self.session.bind.dialect.name == "mysql":
+            stmt = mysql.insert(CartProduct).values(rows)
+            return stmt.on_duplicate_key_update(count=stmt.inserted.count)
+        dialect = postgresql if self.session.bind.dialect.name == "postgresql" else sqlite
+        stmt = dialect.insert(CartProduct).values(rows)
+        return stmt.on_conflict_do_update(
+            index_elements=[CartProduct.user_id, CartProduct.product_id],
+            set_={"count": stmt.excluded.count},
+        )
 
-    async def get_all_cart_products_with_details(self, user_id: str) -> Sequence[CartProduct]:
+    async def get_cart_lines(self, user_id: str) -> Sequence[Row]:
+        # build_store_breakdown 이 받는 순서 그대로 평탄한 행을 가져옵니다.
         cartLoc = (
-            select(CartProduct)
-            .options(
-                joinedload(CartProduct.product)
-                .joinedload(Product.store)
+            select(
+                CartProduct.product_id,
+                Product.name,
+                Product.price,
+                CartProduct.count,
+                Store.id.label("store_id"),
+                Store.store_name,
+                Store.delivery_fee,
             )
+            .join(Product, CartProduct.product_id == Product.id)
+            .join(Store, Product.store_id == Store.id)
             .where(CartProduct.user_id == user_id)
         )
-        return (await self.session.scalars(cartLoc)).all()
+        return (await self.session.execute(cartLoc)).all()
 
-    async def add(self, cart_product: CartProduct) -> None:
-        self.session.add(cart_product)
-        await self.session.commit()
+    async def get_product_line(self, product_id: str, count: int) -> CartLine | None:
+        # 바뀐 라인 하나만 요약에 반영할 수 있도록 상품과 상점 정보를 함께 읽습니다.
+        productLoc = (
+            select(Product.name, Product.price, Store.id, Store.store_name, Store.delivery_fee)
+            .join(Store, Product.store_id == Store.id)
+            .where(Product.id == product_id)
+        )
+        product = (await self.session.execute(productLoc)).first()
+        if product is None:
+            return None
+        name, price, store_id, store_name, delivery_fee = product
+        return CartLine(product_id, name, price, count, store_id, store_name, delivery_fee)
 
-    async def delete(self, cart_product: CartProduct) -> None:
-        await self.session.delete(cart_product)
-        await self.session.commit()
-        
     async def delete_all_cart_products(self, user_id: str) -> None:
         cartLoc = delete(CartProduct).where(CartProduct.user_id == user_id)
-        await self.session.execute(cartLoc)
\ No newline at end of file
+        await self.session.execute(cartLoc)
+
+    async def replace_carts(self, carts: dict[str, dict[str, int]]) -> None:
+        """사용자별 장바구니 행을 주어진 수량으로 통째로 바꿉니다. 그 사이 삭제된 상품은 건너뜁니다."""
+        await self.session.execute(delete(CartProduct).where(CartProduct.user_id.in_(carts.keys())))
+
+        product_ids = {product_id for counts in carts.values() for product_id in counts}
+        if not product_ids:
+            return
+        existing = set(await self.session.scalars(select(Product.id).where(Product.id.in_(product_ids))))
+        rows = [
+            {"user_id": user_id, "product_id": product_id, "count": count}
+            for user_id, counts in carts.items()
+            for product_id, count in counts.items()
+            if product_id in existing
+        ]
+        if rows:
+            await self.session.execute(insert(CartProduct), rows)
+
+
+class CachedCartRepository(CartRepository):
+    """장바구니 수량은 cart_store 에서 읽고 쓰며, cart_products 에는 flush_carts 가 모아서 씁니다."""
+
+    def __init__(self, session: AsyncSession, unit_of_work: UnitOfWork) -> None:
+        super().__init__(session)
+        self.unit_of_work = unit_of_work
+
+    async def get_counts(self, user_id: str) -> dict[str, int]:
+        counts = await cart_store.get_counts(user_id)
+        if counts is None:
+            counts = await super().get_counts(user_id)
+            await cart_store.load(user_id, counts)
+        return counts
+
+    async def set_counts(self, user_id: str, counts: dict[str, int]) -> None:
+        # 처음 보는 사용자는 DB 의 장바구니를 먼저 올려 두어야 부분 해시로 덮어쓰지 않습니다.
+        await self.get_counts(user_id)
+        await cart_store.set_counts(user_id, counts)
+
+    async def get_cart_lines(self, user_id: str) -> list[CartLine]:
+        counts = await self.get_counts(user_id)
+        if not counts:
+            return []
+        productLoc = (
+            select(
+                Product.id,
+                Product.name,
+                Product.price,
+                Store.id,
+                Store.store_name,
+                Store.delivery_fee,
+            )
+            .join(Store, Product.store_id == Store.id)
+            .where(Product.id.in_(counts.keys()))
+        )
+        products = {row[0]: row for row in (await self.session.execute(productLoc)).all()}
+
+        # 그 사이 삭제된 상품은 장바구니에서 보이지 않게 건너뜁니다.
+        cart_lines = []
+        for product_id, count in counts.items():
+            product = products.get(product_id)
+            if product is None:
+                continue
+            _, name, price, store_id, store_name, delivery_fee = product
+            cart_lines.append(CartLine(product_id, name, price, count, store_id, store_name, delivery_fee))
+        return cart_lines
+
+    async def delete_all_cart_products(self, user_id: str) -> None:
+        await super().delete_all_cart_products(user_id)
+        # 주문이 롤백되면 장바구니도 남아 있어야 하므로, 해시는 커밋된 뒤에 비웁니다.
+        self.unit_of_work.after_commit(cart_store.clear, user_id)
+
+
+def get_cart_repository(
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)]
+) -> CartRepository:
+    if CART_SETTINGS.CART_STORE_BACKEND == "memory":
+        return CachedCartRepository(unit_of_work.session, unit_of_work)
+    return CartRepository(unit_of_work.session)
@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, status
 from typing import Annotated
 
 from wapang.app.auth.utils import login_with_header
 from wapang.app.users.models import User
 from wapang.app.carts.schemas import *
 from wapang.app.carts.services import CartService
+from wapang.app.idempotency.services import IdempotencyService
 from wapang.app.orders.schemas import OrderResponse
 
 cart_router = APIRouter()
@@ -23,6 +24,20 @@ async def patch_carts(
         total_price=total_price
     )
 
+@cart_router.patch("/items/", status_code=status.HTTP_200_OK)
+async def patch_cart_items(
+    request: CartBatchRequest,
+    user: Annotated[User, Depends(login_with_header)],
+    cart_service: Annotated[CartService, Depends()]
+) -> CartResponse:
+
+    stores_data, total_price = await cart_service.update_cart_items(request, user)
+
+    return CartResponse(
+        details=list(stores_data.values()),
+        total_price=total_price
+    )
+
 @cart_router.get("/", status_code=status.HTTP_200_OK)
 async def get_carts(
     user: Annotated[User, Depends(login_with_header)], 
@@ -47,17 +62,26 @@ async def delete_carts(
 @cart_router.post("/checkout/", status_code=status.HTTP_201_CREATED)
 async def checkout_from_cart(
     user: Annotated[User, Depends(login_with_header)],
-    cart_service: Annotated[CartService, Depends()]
+    cart_service: Annotated[CartService, Depends()],
+    idempotency_service: Annotated[IdempotencyService, Depends()],
+    idempotency_key: Annotated[str | None, Header()] = None,
 ) -> OrderResponse:
     
+    if idempotency_key is not None:
+        saved = await idempotency_service.begin(user.id, idempotency_key, "POST /carts/checkout")
+        if saved is not None:
+            return OrderResponse.model_validate_json(saved)
+
     order, stores_data = await cart_service.checkout(user)
     
-    return OrderResponse(
+    response = OrderResponse(
         id=order.id,
         details=list(stores_data.values()),
         total_price=order.total_price,
         status=order.status
     )
+    await idempotency_service.complete(response.model_dump_json())
+    return response
 
         
         
@@ -4,6 +4,9 @@ from typing import List
 class CartProductRequest(BaseModel):
     item_id: str
     quantity: int
+
+class CartBatchRequest(BaseModel):
+    items: List[CartProductRequest]
     
 class CartItems(BaseModel):
     item_id: str
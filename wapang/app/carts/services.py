@@ -1,170 +1,134 @@
+import asyncio
+import logging
 from typing import Annotated
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from wapang.app.users.models import User
-from wapang.app.carts.models import CartProduct
-from wapang.app.carts.repositories import CartRepository
+from wapang.app.carts.repositories import CartLine, CartRepository, get_cart_repository
+from wapang.app.carts.settings import CART_SETTINGS
+from wapang.app.carts.store import cart_store
+from wapang.app.carts.summary import (
+    CartSummary,
+    cart_summary_cache,
+    current_pricing_version,
+    publish_cart_summary,
+)
 from wapang.app.carts.schemas import *
 from wapang.app.carts.exceptions import *
 from wapang.app.orders.models import Order, OrderProduct, OrderStatus
 from wapang.app.orders.repositories import OrderRepository
-from wapang.app.orders.schemas import OrderDetails, OrderItems
-from wapang.app.items.models import Product
+from wapang.app.orders.schemas import OrderDetails
 from wapang.app.items.repositories import ItemRepository
+from wapang.app.stores.cache import invalidate_store_pages
+from wapang.common.breakdown import build_store_breakdown
+from wapang.database.async_connection import get_unit_of_work
+from wapang.database.unit_of_work import UnitOfWork
+
+logger = logging.getLogger('uvicorn.error')
 
 
 class CartService:
     def __init__(
         self, 
-        cart_repository: Annotated[CartRepository, Depends()], 
+        cart_repository: Annotated[CartRepository, Depends(get_cart_repository)], 
         item_repository: Annotated[ItemRepository, Depends()],
-        order_repository: Annotated[OrderRepository, Depends()] 
+        order_repository: Annotated[OrderRepository, Depends()],
+        unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
     ) -> None:
         self.cart_repository = cart_repository
         self.item_repository = item_repository
         self.order_repository = order_repository
+        self.unit_of_work = unit_of_work
 
     async def update_cart(
         self, request: CartProductRequest, user: User
     ) -> tuple[dict[str, CartDetails], int]:
         
-        item = await self.item_repository.get_item_by_id(request.item_id)
-        if not item:
+        line = await self.cart_repository.get_product_line(request.item_id, request.quantity)
+        if line is None:
             raise ItemNotFoundException()
         
-        cart_product = await self.cart_repository.get_cart_product(user.id, request.item_id)
-        
-        if request.quantity > 0:
-            if cart_product:
-                cart_product.count = request.quantity
-                await self.cart_repository.session.flush()
-            else:
-                new_cart_product = CartProduct(
-                    count=request.quantity, 
-                    product_id=request.item_id, 
-                    user_id=user.id
-                )
-                await self.cart_repository.add(new_cart_product)
-        elif request.quantity == 0:
-            if cart_product:
-                await self.cart_repository.delete(cart_product)
-        else:
+        if request.quantity < 0:
             raise InvalidFieldFormatException()
 
-    
-        all_cart_products = await self.cart_repository.get_all_cart_products_with_details(user.id)
-        
-        stores_data = {}
-        for cp in all_cart_products:
-            product = cp.product
-            store = product.store
-            
-            if store.id not in stores_data:
-                stores_data[store.id] = CartDetails(
-                    store_id=str(store.id),
-                    store_name=store.store_name,
-                    delivery_fee=store.delivery_fee,
-                    store_total_price=store.delivery_fee,
-                    items=[]
-                )
-            
-            subtotal = product.price * cp.count
-            stores_data[store.id].items.append(
-                CartItems(
-                    item_id=str(product.id),
-                    item_name=product.name,
-                    price=product.price,
-                    quantity=cp.count,
-                    subtotal=subtotal
-                )
-            )
-            stores_data[store.id].store_total_price += subtotal
-        
+        await self.cart_repository.set_counts(user.id, {request.item_id: request.quantity})
+        return await self._apply_to_summary(user.id, [line])
 
-        total_price = sum(store.store_total_price for store in stores_data.values())
-        
-        return stores_data, total_price
+    async def update_cart_items(
+        self, request: CartBatchRequest, user: User
+    ) -> tuple[dict[str, CartDetails], int]:
+        if not request.items:
+            raise EmptyItemListException()
+
+        # 같은 상품이 여러 번 오면 마지막 수량을 씁니다.
+        counts: dict[str, int] = {}
+        for item in request.items:
+            if item.quantity < 0:
+                raise InvalidFieldFormatException()
+            counts[item.item_id] = item.quantity
+
+        products = await self.item_repository.get_items_by_ids(list(counts))
+        if len(products) != len(counts):
+            raise ItemNotFoundException()
+
+        await self.cart_repository.set_counts(user.id, counts)
+        lines = [
+            CartLine(
+                product.id,
+                product.name,
+                product.price,
+                counts[product.id],
+                product.store.id,
+                product.store.store_name,
+                product.store.delivery_fee,
+            )
+            for product in products
+        ]
+        return await self._apply_to_summary(user.id, lines)
     
     async def get_cart(self, user: User) -> tuple[dict[str, CartDetails], int]:
+        summary = cart_summary_cache.get(user.id)
+        if summary is None or not summary.is_current():
+            summary = await self._build_summary(user.id)
+        return summary.breakdown()
 
-        all_cart_products = await self.cart_repository.get_all_cart_products_with_details(user.id)
-        
-        if not all_cart_products:
-            return {}, 0
-        
-        stores_data = {}
-        for cp in all_cart_products:
-            product = cp.product
-            store = product.store
-            
-            if store.id not in stores_data:
-                stores_data[store.id] = CartDetails(
-                    store_id=str(store.id),
-                    store_name=store.store_name,
-                    delivery_fee=store.delivery_fee,
-                    store_total_price=store.delivery_fee,
-                    items=[]
-                )
-            
-            subtotal = product.price * cp.count
-            stores_data[store.id].items.append(
-                CartItems(
-                    item_id=str(product.id),
-                    item_name=product.name,
-                    price=product.price,
-                    quantity=cp.count,
-                    subtotal=subtotal
-                )
-            )
-            stores_data[store.id].store_total_price += subtotal
-        
-        total_price = sum(store.store_total_price for store in stores_data.values())
-        
-        return stores_data, total_price
+    async def _apply_to_summary(
+        self, user_id: str, lines: list[CartLine]
+    ) -> tuple[dict[str, CartDetails], int]:
+        cached = cart_summary_cache.get(user_id)
+        if cached is not None and cached.is_current():
+            summary = cached.copy()
+            summary.apply(*lines)
+            self.unit_of_work.after_commit(publish_cart_summary, user_id, cached, summary)
+        else:
+            summary = await self._build_summary(user_id)
+        return summary.breakdown()
+
+    async def _build_summary(self, user_id: str) -> CartSummary:
+        cached = cart_summary_cache.get(user_id)
+        built_at = current_pricing_version()
+        cart_lines = await self.cart_repository.get_cart_lines(user_id)
+        summary = CartSummary(cart_lines, CartDetails, built_at)
+        self.unit_of_work.after_commit(publish_cart_summary, user_id, cached, summary)
+        return summary
     
     async def clear_cart(self, user: User) -> None:
         await self.cart_repository.delete_all_cart_products(user.id)
+        self.unit_of_work.after_commit(cart_summary_cache.invalidate, user.id)
         
     async def checkout(self, user: User) -> tuple[Order, dict[str, OrderDetails]]:
-        all_cart_products = await self.cart_repository.get_all_cart_products_with_details(user.id)
+        cart_lines = await self.cart_repository.get_cart_lines(user.id)
         
-        if not all_cart_products:
+        if not cart_lines:
             raise EmptyItemListException()
 
-        stores_data: dict[str, OrderDetails] = {}
-        products_to_update: list[Product] = []
-        for cp in all_cart_products:
-            product = cp.product
-            store = product.store
-            
-            if product.stock < cp.count:
-                raise NotEnoughStockException()
-            
-            if store.id not in stores_data:
-                stores_data[store.id] = OrderDetails(
-                    store_id=str(store.id),
-                    store_name=store.store_name,
-                    delivery_fee=store.delivery_fee,
-                    store_total_price=store.delivery_fee,
-                    items=[]
-                )
-            
-            subtotal = product.price * cp.count
-            stores_data[store.id].items.append(
-                OrderItems(
-                    item_id=str(product.id),
-                    item_name=product.name,
-                    price=product.price,
-                    quantity=cp.count,
-                    subtotal=subtotal
-                )
-            )
-            stores_data[store.id].store_total_price += subtotal
-            
-            product.stock -= cp.count
-            products_to_update.append(product)
+        quantities = {line.product_id: line.count for line in cart_lines}
+        if not await self.item_repository.reserve_stock(quantities):
+            raise NotEnoughStockException()
+        self.unit_of_work.after_commit(invalidate_store_pages, *{line.store_id for line in cart_lines})
 
-        total_price = sum(store.store_total_price for store in stores_data.values())
+        stores_data, total_price = build_store_breakdown(cart_lines, OrderDetails)
 
         new_order = Order(
             status=OrderStatus.ORDERED,
@@ -173,22 +137,63 @@ class CartService:
         )
 
         self.order_repository.session.add(new_order)
-        self.order_repository.session.add_all(products_to_update)
-        
+
         await self.order_repository.session.flush()
         
         order_products_to_save: list[OrderProduct] = []
-        for cp in all_cart_products:
+        for product_id, item_name, price, quantity, store_id, store_name, delivery_fee in cart_lines:
             order_products_to_save.append(
                 OrderProduct(
                     order_id=new_order.id,
-                    product_id=cp.product_id,
-                    quantity=cp.count
+                    product_id=product_id,
+                    quantity=quantity,
+                    unit_price=price,
+                    item_name=item_name,
+                    store_id=store_id,
+                    store_name=store_name,
+                    delivery_fee=delivery_fee
                 )
             )
         
         self.order_repository.session.add_all(order_products_to_save)
         
         await self.cart_repository.delete_all_cart_products(user.id)
+        self.unit_of_work.after_commit(cart_summary_cache.invalidate, user.id)
         
-        return new_order, stores_data
\ No newline at end of file
+        return new_order, stores_data
+
+async def flush_carts(session_factory: async_sessionmaker[AsyncSession]) -> int:
+    """cart_store 에서 바뀐 장바구니를 cart_products 에 한 트랜잭션으로 쓰고, 쓴 사용자 수를 돌려줍니다."""
+    user_ids = list(cart_store.dirty)
+    if not user_ids:
+        return 0
+    cart_store.dirty.difference_update(user_ids)
+
+    try:
+        carts = {}
+        for user_id in user_ids:
+            counts = await cart_store.get_counts(user_id)
+            if counts is not None:
+                carts[user_id] = counts
+        async with session_factory() as session:
+            await CartRepository(session).replace_carts(carts)
+            await session.commit()
+    except Exception:
+        # 다음 주기에 다시 쓰도록 되돌려 놓습니다.
+        cart_store.dirty.update(user_ids)
+        raise
+    return len(carts)
+
+
+async def run_cart_flusher(
+    session_factory: async_sessionmaker[AsyncSession],
+    interval_seconds: float = CART_SETTINGS.CART_FLUSH_INTERVAL_SECONDS,
+) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            flushed = await flush_carts(session_factory)
+            if flushed:
+                logger.info(f"Flushed {flushed} carts to cart_products")
+        except Exception:
+            logger.exception("Failed to flush carts")
@@ -0,0 +1,23 @@
+from typing import Literal
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+import os
+
+ENV = os.getenv("ENV", "local")
+
+class CartSettings(BaseSettings):
+    # memory 는 장바구니를 해시 저장소에 두고 cart_products 에는 주기적으로 write-behind 합니다.
+    # 기본 InMemoryHashBackend 는 프로세스 로컬이므로 워커가 여럿이면 Redis 호환 저장소로 바꿔야 합니다.
+    CART_STORE_BACKEND: Literal["database", "memory"] = "database"
+    CART_FLUSH_INTERVAL_SECONDS: int = 5
+    CART_STORE_MAX_CARTS: int = 10_000
+    CART_SUMMARY_CACHE_TTL_SECONDS: int = 30
+    CART_SUMMARY_CACHE_MAX_SIZE: int = 10_000
+
+    model_config = SettingsConfigDict(
+        case_sensitive=False,
+        env_file=f".env.{ENV}",
+        extra='ignore'
+    )
+
+CART_SETTINGS = CartSettings()
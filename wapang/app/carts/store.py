@@ -0,0 +1,108 @@
+from collections import OrderedDict
+from typing import Optional, Protocol
+
+from wapang.app.carts.settings import CART_SETTINGS
+
+# 빈 장바구니도 "이미 DB 에서 읽어 옴" 으로 표시하기 위해 해시마다 넣어 두는 필드입니다.
+LOADED_FIELD = "_"
+
+
+class CartHashBackend(Protocol):
+    """Redis 해시 명령과 같은 시그니처의 저장소 인터페이스입니다.
+
+    decode_responses=True 로 만든 redis.asyncio.Redis 를 그대로 넘길 수 있습니다.
+    """
+
+    async def hgetall(self, name: str) -> dict[str, str]: ...
+
+    async def hset(self, name: str, mapping: dict[str, str]) -> int: ...
+
+    async def hdel(self, name: str, *keys: str) -> int: ...
+
+    async def delete(self, *names: str) -> int: ...
+
+
+class InMemoryHashBackend:
+    def __init__(self) -> None:
+        self._hashes: dict[str, dict[str, str]] = {}
+
+    async def hgetall(self, name: str) -> dict[str, str]:
+        return dict(self._hashes.get(name, {}))
+
+    async def hset(self, name: str, mapping: dict[str, str]) -> int:
+        fields = self._hashes.setdefault(name, {})
+        added = len(mapping.keys() - fields.keys())
+        fields.update(mapping)
+        return added
+
+    async def hdel(self, name: str, *keys: str) -> int:
+        fields = self._hashes.get(name, {})
+        return sum(fields.pop(key, None) is not None for key in keys)
+
+    async def delete(self, *names: str) -> int:
+        return sum(self._hashes.pop(name, None) is not None for name in names)
+
+
+class CartStore:
+    """사용자별 장바구니 수량을 해시로 들고 있고, 바뀐 사용자를 dirty 로 기록합니다."""
+
+    def __init__(self, backend: CartHashBackend, max_carts: int) -> None:
+        self.backend = backend
+        self.max_carts = max_carts
+        self.dirty: set[str] = set()
+        self._recent: OrderedDict[str, None] = OrderedDict()
+
+    @staticmethod
+    def key(user_id: str) -> str:
+        return f"cart:{user_id}"
+
+    async def get_counts(self, user_id: str) -> Optional[dict[str, int]]:
+        fields = await self.backend.hgetall(self.key(user_id))
+        if not fields:
+            return None
+        await self._touch(user_id)
+        return {
+            product_id: int(count)
+            for product_id, count in fields.items()
+            if product_id != LOADED_FIELD
+        }
+
+    async def load(self, user_id: str, counts: dict[str, int]) -> None:
+        mapping = {product_id: str(count) for product_id, count in counts.items()}
+        await self.backend.hset(self.key(user_id), mapping={LOADED_FIELD: "1", **mapping})
+        await self._touch(user_id)
+
+    async def set_counts(self, user_id: str, counts: dict[str, int]) -> None:
+        # 수량이 0 이하인 상품은 장바구니에서 뺍니다.
+        to_set = {product_id: str(count) for product_id, count in counts.items() if count > 0}
+        to_delete = [product_id for product_id, count in counts.items() if count <= 0]
+        if to_set:
+            await self.backend.hset(self.key(user_id), mapping=to_set)
+        if to_delete:
+            await self.backend.hdel(self.key(user_id), *to_delete)
+        self.dirty.add(user_id)
+        await self._touch(user_id)
+
+    async def clear(self, user_id: str) -> None:
+        await self.backend.delete(self.key(user_id))
+        await self.load(user_id, {})
+        self.dirty.add(user_id)
+
+    async def reset(self) -> None:
+        await self.backend.delete(*(self.key(user_id) for user_id in self._recent))
+        self._recent.clear()
+        self.dirty.clear()
+
+    async def _touch(self, user_id: str) -> None:
+        self._recent[user_id] = None
+        self._recent.move_to_end(user_id)
+        # 아직 DB 에 쓰지 않은(dirty) 장바구니는 버리지 않고, 오래된 깨끗한 장바구니부터 내보냅니다.
+        while len(self._recent) > self.max_carts:
+            victim = next((u for u in self._recent if u not in self.dirty), None)
+            if victim is None:
+                break
+            del self._recent[victim]
+            await self.backend.delete(self.key(victim))
+
+
+cart_store = CartStore(InMemoryHashBackend(), max_carts=CART_SETTINGS.CART_STORE_MAX_CARTS)
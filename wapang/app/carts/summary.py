@@ -0,0 +1,137 @@
+import itertools
+from typing import Iterable, TypeVar
+
+from pydantic import BaseModel
+
+from wapang.app.carts.settings import CART_SETTINGS
+from wapang.common.breakdown import BreakdownRow
+from wapang.common.cache import TTLCache
+
+D = TypeVar("D", bound=BaseModel)
+
+# 상품 가격/이름이나 상점 배송비가 바뀐 시점을 상점별로 기록해, 그 전에 만든 요약을 버리게 합니다.
+_pricing_clock = itertools.count(1)
+_pricing_versions: dict[str, int] = {}
+
+
+def current_pricing_version() -> int:
+    # 요약을 만들기 전에 받아 두면, 그 뒤의 가격 변경은 항상 더 큰 버전을 갖습니다.
+    return next(_pricing_clock)
+
+
+def invalidate_cart_pricing(*store_ids: str) -> None:
+    version = next(_pricing_clock)
+    for store_id in store_ids:
+        _pricing_versions[store_id] = version
+
+
+class CartSummary:
+    """장바구니의 상점별 라인과 합계를 들고 있다가, 바뀐 라인 하나만 반영합니다.
+
+    상점별 응답 모델도 캐시해 두고 라인이 바뀐 상점만 다시 만듭니다.
+    캐시에 올라간 요약은 여러 요청이 함께 보므로 직접 고치지 않고 copy() 한 뒤 반영합니다.
+    """
+
+    def __init__(self, rows: Iterable[BreakdownRow], details_model: type[D], built_at: int) -> None:
+        self.details_model = details_model
+        self.built_at = built_at
+        self.stores: dict[str, tuple[str, int]] = {}
+        self.lines: dict[str, dict[str, dict]] = {}
+        self.store_totals: dict[str, int] = {}
+        self.total_price = 0
+        self.details: dict[str, D] = {}
+        # 이 인스턴스가 직접 만든(다른 요약과 공유하지 않는) 상점별 라인 dict 입니다.
+        self._owned: set[str] = set()
+
+        self.apply(*rows)
+
+    def copy(self) -> "CartSummary":
+        # 바깥 dict 만 복사하고, 상점별 라인 dict 는 _apply 에서 바뀔 때 복사합니다.
+        clone = CartSummary.__new__(CartSummary)
+        clone.details_model = self.details_model
+        clone.built_at = self.built_at
+        clone.stores = dict(self.stores)
+        clone.lines = dict(self.lines)
+        clone.store_totals = dict(self.store_totals)
+        clone.total_price = self.total_price
+        clone.details = dict(self.details)
+        clone._owned = set()
+        return clone
+
+    def is_current(self) -> bool:
+        return all(_pricing_versions.get(store_id, 0) <= self.built_at for store_id in self.stores)
+
+    def apply(self, *rows: BreakdownRow) -> None:
+        for store_id in {self._apply(row) for row in rows}:
+            self._refresh(store_id)
+
+    def breakdown(self) -> tuple[dict[str, D], int]:
+        return dict(self.details), self.total_price
+
+    def _apply(self, row: BreakdownRow) -> str:
+        item_id, item_name, price, quantity, store_id, store_name, delivery_fee = row
+        items = self.lines.get(store_id)
+        if items is not None and store_id not in self._owned:
+            items = self.lines[store_id] = dict(items)
+            self._owned.add(store_id)
+        old = items.get(item_id) if items is not None else None
+        if old is not None:
+            self.store_totals[store_id] -= old["subtotal"]
+            self.total_price -= old["subtotal"]
+
+        if quantity <= 0:
+            if old is not None:
+                del items[item_id]
+                if not items:
+                    # 마지막 라인이 빠진 상점은 배송비도 함께 뺍니다.
+                    self.total_price -= self.store_totals.pop(store_id)
+                    del self.lines[store_id]
+                    del self.stores[store_id]
+            return store_id
+
+        if items is None:
+            items = self.lines[store_id] = {}
+            self._owned.add(store_id)
+            self.stores[store_id] = (store_name, delivery_fee)
+            self.store_totals[store_id] = delivery_fee
+            self.total_price += delivery_fee
+        subtotal = price * quantity
+        # 이미 있는 라인은 같은 자리에서 바꿔 응답의 라인 순서를 유지합니다.
+        items[item_id] = {
+            "item_id": item_id,
+            "item_name": item_name,
+            "price": price,
+            "quantity": quantity,
+            "subtotal": subtotal
+        }
+        self.store_totals[store_id] += subtotal
+        self.total_price += subtotal
+        return store_id
+
+    def _refresh(self, store_id: str) -> None:
+        if store_id not in self.lines:
+            self.details.pop(store_id, None)
+            return
+        store_name, delivery_fee = self.stores[store_id]
+        self.details[store_id] = self.details_model.model_validate({
+            "store_id": store_id,
+            "store_name": store_name,
+            "delivery_fee": delivery_fee,
+            "store_total_price": self.store_totals[store_id],
+            "items": list(self.lines[store_id].values())
+        })
+
+
+# 사용자별 장바구니 요약입니다. 프로세스 로컬이므로 다른 워커의 변경은 TTL 이 지나야 보입니다.
+cart_summary_cache: TTLCache[str, CartSummary] = TTLCache(
+    maxsize=CART_SETTINGS.CART_SUMMARY_CACHE_MAX_SIZE,
+    ttl=CART_SETTINGS.CART_SUMMARY_CACHE_TTL_SECONDS,
+)
+
+
+def publish_cart_summary(user_id: str, base: CartSummary | None, summary: CartSummary) -> None:
+    # 커밋된 뒤에만 호출합니다. 그 사이 다른 요청이 요약을 바꿨다면 어느 쪽도 믿지 않고 비웁니다.
+    if cart_summary_cache.get(user_id) is base:
+        cart_summary_cache.set(user_id, summary)
+    else:
+        cart_summary_cache.invalidate(user_id)
@@ -0,0 +1,19 @@
+from wapang.common.exceptions import WapangException
+
+
+class IdempotencyKeyInUseException(WapangException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=409,
+            error_code="ERR_025",
+            error_msg="IDEMPOTENCY KEY IN USE"
+        )
+
+
+class IdempotencyKeyReusedException(WapangException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=422,
+            error_code="ERR_026",
+            error_msg="IDEMPOTENCY KEY REUSED"
+        )
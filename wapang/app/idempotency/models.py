@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from wapang.database.common import Base
+
+
+class IdempotencyRecord(Base):
+    __tablename__ = "idempotency_keys"
+
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    fingerprint: Mapped[str] = mapped_column(String(64))
+    # 요청이 끝나기 전에는 비어 있고, 처리가 끝나면 응답 JSON 이 저장됩니다.
+    response_body: Mapped[str | None] = mapped_column(Text)
+    expired_at: Mapped[datetime] = mapped_column(DateTime, index=True)
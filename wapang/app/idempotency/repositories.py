@@ -0,0 +1,47 @@
+from typing import Annotated
+from datetime import datetime
+
+from fastapi import Depends
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from wapang.app.idempotency.models import IdempotencyRecord
+from wapang.database.async_connection import get_async_db_session
+
+
+class IdempotencyRepository:
+    def __init__(self, session: Annotated[AsyncSession, Depends(get_async_db_session)]) -> None:
+        self.session = session
+
+    async def get_record(self, user_id: str, key: str) -> IdempotencyRecord | None:
+        recordLoc = select(IdempotencyRecord).where(
+            IdempotencyRecord.user_id == user_id,
+            IdempotencyRecord.key == key,
+        )
+        return await self.session.scalar(recordLoc)
+
+    async def add_record(self, record: IdempotencyRecord) -> None:
+        self.session.add(record)
+        await self.session.flush()
+
+    async def delete_record(self, record: IdempotencyRecord) -> None:
+        await self.session.delete(record)
+        await self.session.flush()
+
+    async def delete_expired_records(self, now: datetime, limit: int) -> int:
+        recordsLoc = (
+            select(IdempotencyRecord.user_id, IdempotencyRecord.key)
+            .where(IdempotencyRecord.expired_at <= now)
+            .limit(limit)
+        )
+        rows = (await self.session.execute(recordsLoc)).all()
+        if not rows:
+            return 0
+        await self.session.execute(
+            delete(IdempotencyRecord).where(
+                tuple_(IdempotencyRecord.user_id, IdempotencyRecord.key).in_(
+                    [tuple(row) for row in rows]
+                )
+            )
+        )
+        return len(rows)
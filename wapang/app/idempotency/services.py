@@ -0,0 +1,100 @@
+import asyncio
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from typing import Annotated, Optional
+
+from fastapi import Depends
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from wapang.app.idempotency.exceptions import (
+    IdempotencyKeyInUseException,
+    IdempotencyKeyReusedException,
+)
+from wapang.app.idempotency.models import IdempotencyRecord
+from wapang.app.idempotency.repositories import IdempotencyRepository
+from wapang.app.idempotency.settings import IDEMPOTENCY_SETTINGS
+from wapang.common.exceptions import InvalidFormatException
+
+logger = logging.getLogger('uvicorn.error')
+
+MAX_KEY_LENGTH = 255
+
+
+class IdempotencyService:
+    def __init__(
+        self, idempotency_repository: Annotated[IdempotencyRepository, Depends()]
+    ) -> None:
+        self.idempotency_repository = idempotency_repository
+        self.record: Optional[IdempotencyRecord] = None
+
+    async def begin(self, user_id: str, key: str, scope: str, payload: str = "") -> Optional[str]:
+        """이전에 같은 키로 끝난 요청이 있으면 그 응답 JSON 을, 없으면 키를 선점하고 None 을 돌려줍니다.
+
+        선점한 키는 요청과 같은 트랜잭션에 기록되므로 처리 중 예외가 나면 함께 롤백되어
+        다음 재시도가 다시 실행됩니다.
+        """
+        if not key or len(key) > MAX_KEY_LENGTH:
+            raise InvalidFormatException()
+
+        fingerprint = hashlib.sha256(f"{scope}\n{payload}".encode("utf-8")).hexdigest()
+        record = await self.idempotency_repository.get_record(user_id, key)
+        if record is not None:
+            if record.expired_at <= datetime.now():
+                await self.idempotency_repository.delete_record(record)
+            elif record.fingerprint != fingerprint:
+                raise IdempotencyKeyReusedException()
+            elif record.response_body is None:
+                raise IdempotencyKeyInUseException()
+            else:
+                return record.response_body
+
+        record = IdempotencyRecord(
+            user_id=user_id,
+            key=key,
+            fingerprint=fingerprint,
+            expired_at=datetime.now() + timedelta(hours=IDEMPOTENCY_SETTINGS.IDEMPOTENCY_KEY_TTL_HOURS),
+        )
+        try:
+            await self.idempotency_repository.add_record(record)
+        except IntegrityError:
+            # 같은 키의 요청이 동시에 처리되고 있습니다.
+            raise IdempotencyKeyInUseException()
+        self.record = record
+        return None
+
+    async def complete(self, response_body: str) -> None:
+        if self.record is None:
+            return
+        self.record.response_body = response_body
+        await self.idempotency_repository.session.flush()
+
+
+async def purge_expired_idempotency_keys(
+    session_factory: async_sessionmaker[AsyncSession],
+    batch_size: int = IDEMPOTENCY_SETTINGS.IDEMPOTENCY_PURGE_BATCH_SIZE,
+) -> int:
+    now = datetime.now()
+    total = 0
+    while True:
+        async with session_factory() as session:
+            purged = await IdempotencyRepository(session).delete_expired_records(now, batch_size)
+            await session.commit()
+        total += purged
+        if purged < batch_size:
+            return total
+        await asyncio.sleep(0)
+
+
+async def run_idempotency_key_purger(
+    session_factory: async_sessionmaker[AsyncSession],
+    interval_seconds: float = IDEMPOTENCY_SETTINGS.IDEMPOTENCY_PURGE_INTERVAL_SECONDS,
+) -> None:
+    while True:
+        try:
+            purged = await purge_expired_idempotency_keys(session_factory)
+            logger.info(f"Purged {purged} expired idempotency keys")
+        except Exception:
+            logger.exception("Failed to purge expired idempotency keys")
+        await asyncio.sleep(interval_seconds)
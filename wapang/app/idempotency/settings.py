@@ -0,0 +1,17 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+import os
+
+ENV = os.getenv("ENV", "local")
+
+class IdempotencySettings(BaseSettings):
+    IDEMPOTENCY_KEY_TTL_HOURS: int = 24
+    IDEMPOTENCY_PURGE_INTERVAL_SECONDS: int = 60 * 60
+    IDEMPOTENCY_PURGE_BATCH_SIZE: int = 1000
+
+    model_config = SettingsConfigDict(
+        case_sensitive=False,
+        env_file=f".env.{ENV}",
+        extra='ignore'
+    )
+
+IDEMPOTENCY_SETTINGS = IdempotencySettings()
@@ -34,3 +34,10 @@ class NickNameNotSetException(WapangException):
         super().__init__(
             status_code=422, error_code="ERR_015", error_msg="NICKNAME NOT SET"
         )
+
+
+class ItemHasOrdersException(WapangException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=409, error_code="ERR_027", error_msg="ITEM HAS ORDERS"
+        )
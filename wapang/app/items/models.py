@@ -1,12 +1,16 @@
 import uuid
 from typing import List
-from sqlalchemy import Integer, ForeignKey, String
+from sqlalchemy import Index, Integer, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from wapang.database.common import Base
 
 
 class Product(Base):
     __tablename__ = "products"
+    __table_args__ = (
+        Index("ix_products_store_id_price", "store_id", "price"),
+        Index("ix_products_price_id", "price", "id"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
@@ -15,12 +19,17 @@ class Product(Base):
     price: Mapped[int] = mapped_column(Integer)
     stock: Mapped[int] = mapped_column(Integer)
 
+    # 리뷰 생성/수정/삭제 시 같은 트랜잭션에서 갱신하는 평점 집계값입니다.
+    rating_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    rating_sum: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+
     store_id: Mapped[str] = mapped_column(ForeignKey("stores.id"))
 
     store: Mapped["Store"] = relationship(back_populates="products")  # type: ignore
 
+    # reviews.product_id 는 ON DELETE CASCADE 이므로 리뷰를 읽어 오지 않고 DB 가 지우게 둡니다.
     reviews: Mapped[List["Review"]] = relationship(  # type: ignore
-        back_populates="product"
+        back_populates="product", passive_deletes=True
     )
 
     cart_products: Mapped[List["CartProduct"]] = relationship(  # type: ignore
@@ -1,10 +1,12 @@
 from typing import Annotated, Sequence
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import Row, and_, case, exists, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 from wapang.app.items.models import Product
+from wapang.app.orders.models import OrderProduct
+from wapang.app.stores.models import Store
 from wapang.database.async_connection import get_async_db_session
 
 
@@ -32,9 +34,21 @@ class ItemRepository:
             store_id: str | None = None,
             min_price: int | None = None,
             max_price: int | None = None,
-            in_stock: bool = False
-    ) -> list[Product]:
-        query = select(Product)
+            in_stock: bool = False,
+            after: tuple[int, str] | None = None,
+            limit: int | None = None,
+    ) -> Sequence[Row]:
+        # ItemResponse 필드명에 맞춰 컬럼을 뽑아 Store 를 한 번의 JOIN 으로 가져옵니다.
+        query = select(
+            Product.id,
+            Product.name.label("item_name"),
+            Product.price,
+            Product.stock,
+            Product.store_id,
+            Store.store_name,
+            Product.rating_count,
+            Product.rating_sum,
+        ).join(Store, Product.store_id == Store.id)
         if store_id:
             query = query.where(Product.store_id == store_id)
         if min_price is not None:
@@ -43,8 +57,53 @@ class ItemRepository:
             query = query.where(Product.price <= max_price)
         if in_stock:
             query = query.where(Product.stock > 0)
-        return (await self.session.scalars(query)).all()
+        if after is not None:
+            # OFFSET 대신 마지막으로 본 (price, id) 이후부터 읽는 keyset 페이지네이션입니다.
+            after_price, after_id = after
+            query = query.where(
+                or_(
+                    Product.price > after_price,
+                    and_(Product.price == after_price, Product.id > after_id),
+                )
+            )
+        query = query.order_by(Product.price, Product.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return (await self.session.execute(query)).all()
     
+    async def reserve_stock(self, quantities: dict[str, int]) -> bool:
+        # 재고 확인과 차감을 하나의 조건부 UPDATE 로 처리해 동시 주문에도 초과 판매가 없습니다.
+        # 일부 상품만 차감됐다면 False 를 돌려주며, 호출한 쪽이 예외를 던져 트랜잭션 전체가 롤백됩니다.
+        quantity = case(quantities, value=Product.id)
+        result = await self.session.execute(
+            update(Product)
+            .where(Product.id.in_(quantities.keys()), Product.stock >= quantity)
+            .values(stock=Product.stock - quantity)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == len(quantities)
+
+    async def release_stock(self, quantities: dict[str, int]) -> None:
+        quantity = case(quantities, value=Product.id)
+        await self.session.execute(
+            update(Product)
+            .where(Product.id.in_(quantities.keys()))
+            .values(stock=Product.stock + quantity)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def adjust_rating(self, product_id: str, count_delta: int, sum_delta: int) -> None:
+        # 읽고 쓰는 대신 증감 UPDATE 로 처리해 동시에 리뷰가 달려도 집계가 어긋나지 않습니다.
+        await self.session.execute(
+            update(Product)
+            .where(Product.id == product_id)
+            .values(
+                rating_count=Product.rating_count + count_delta,
+                rating_sum=Product.rating_sum + sum_delta,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
     def modify_item(self, product: Product, **kwargs) -> Product:
         for key, value in kwargs.items():
             if value is not None:
@@ -52,5 +111,8 @@ class ItemRepository:
 
         return product
 
-    def delete_item(self, product: Product) -> None:
-        self.session.delete(product)
\ No newline at end of file
+    async def has_order_lines(self, product_id: str) -> bool:
+        return await self.session.scalar(select(exists().where(OrderProduct.product_id == product_id)))
+
+    async def delete_item(self, product: Product) -> None:
+        await self.session.delete(product)
\ No newline at end of file
@@ -1,5 +1,5 @@
 from typing import Annotated, Optional, Union
-from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi import APIRouter, Depends, Header, Query, Response, status
 
 from wapang.app.auth.utils import login_with_header, optional_login_with_header
 from wapang.app.items.models import Product
@@ -14,7 +14,11 @@ from wapang.app.reviews.schemas import (
     ReviewLoginResponse,
     ReviewLogoutResponse,
 )
+from wapang.app.reviews.models import ReviewSort
 from wapang.app.items.services import ItemService
+from wapang.app.stores.cache import catalog_version
+from wapang.common.etag import etag_matches, make_etag
+from wapang.common.pagination import DEFAULT_PAGE_SIZE, NEXT_CURSOR_HEADER
 
 item_router = APIRouter()
 
@@ -39,18 +43,32 @@ async def update_item(
 
 @item_router.get("/", status_code=status.HTTP_200_OK)
 async def get_items(
+    response: Response,
     store_id: Optional[str] = Query(default=None),
     min_price: Optional[int] = Query(default=None),
     max_price: Optional[int] = Query(default=None),
     in_stock: bool = Query(default=False),
-    item_service: ItemService = Depends(ItemService)
+    cursor: Optional[str] = Query(default=None),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE),
+    if_none_match: Annotated[Optional[str], Header()] = None,
+    item_service: ItemService = Depends(ItemService),
 ) -> list[ItemResponse]:
-    return await item_service.list_items(
+    # 상품/상점/리뷰가 바뀌지 않았다면 쿼리와 직렬화 없이 304 를 돌려줍니다.
+    etag = make_etag(catalog_version())
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    items, next_cursor = await item_service.list_items(
         store_id=store_id,
         min_price=min_price,
         max_price=max_price,
-        in_stock=in_stock
+        in_stock=in_stock,
+        cursor=cursor,
+        limit=limit,
     )
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return items
 
 @item_router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_item(
@@ -72,8 +90,21 @@ async def create_review_for_item(
 
 @item_router.get("/{item_id}/reviews", status_code=status.HTTP_200_OK)
 async def list_reviews_for_item(
+    response: Response,
     item_id: str,
     user: Annotated[Optional[User], Depends(optional_login_with_header)],
     item_service: Annotated[ItemService, Depends()],
+    sort: ReviewSort = Query(default=ReviewSort.NEWEST),
+    cursor: Optional[str] = Query(default=None),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE),
 ) -> Union[list[ReviewLoginResponse], list[ReviewLogoutResponse]]:
-    return await item_service.list_reviews_for_item(item_id, user.id if user else None)
\ No newline at end of file
+    reviews, next_cursor = await item_service.list_reviews_for_item(
+        item_id,
+        user.id if user else None,
+        sort=sort,
+        cursor=cursor,
+        limit=limit,
+    )
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return reviews
\ No newline at end of file
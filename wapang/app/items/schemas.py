@@ -30,6 +30,8 @@ class ItemResponse(BaseModel):
     stock: int
     store_id: str
     store_name: str
+    rating_count: int = 0
+    rating_sum: int = 0
 
     class Config:
         from_attributes = True
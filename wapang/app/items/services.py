@@ -1,11 +1,16 @@
+from datetime import datetime
 from typing import Annotated, Optional, Union, List
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from fastapi import Depends
+from wapang.app.carts.summary import invalidate_cart_pricing
 from wapang.app.items.repositories import ItemRepository
+from wapang.app.stores.cache import invalidate_catalog, invalidate_store_pages
 from wapang.app.stores.repositories import StoreRepository
 from wapang.app.items.schemas import ItemCreateRequest, ItemResponse, ItemUpdateRequest
 from wapang.app.items.exceptions import (
+    ItemHasOrdersException,
     NickNameNotSetException,
     NoStoreOwnedException,
     ItemNotFoundException,
@@ -13,11 +18,20 @@ from wapang.app.items.exceptions import (
     StoreNotFoundException,
 )
 from wapang.app.items.models import Product
+from wapang.common.exceptions import InvalidFormatException
+from wapang.database.async_connection import get_unit_of_work
+from wapang.database.unit_of_work import UnitOfWork
+from wapang.common.pagination import (
+    DEFAULT_PAGE_SIZE,
+    decode_cursor,
+    encode_cursor,
+    validate_page_size,
+)
 
 
 from wapang.app.reviews.repositories import ReviewRepository
 from wapang.app.users.repositories import UserRepository
-from wapang.app.reviews.models import Review
+from wapang.app.reviews.models import Review, ReviewSort
 from wapang.app.reviews.schemas import (
     ReviewCreate,
     ReviewLoginResponse,
@@ -33,11 +47,13 @@ class ItemService:
         store_repository: Annotated[StoreRepository, Depends()],
         review_repository: Annotated[ReviewRepository, Depends()],
         user_repository: Annotated[UserRepository, Depends()],
+        unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
     ) -> None:
         self.item_repository = item_repository
         self.store_repository = store_repository
         self.review_repository = review_repository
         self.user_repository = user_repository
+        self.unit_of_work = unit_of_work
 
     async def create_item_for_owner(
         self, user_id: str, item_request: ItemCreateRequest
@@ -55,6 +71,7 @@ class ItemService:
 
         self.item_repository.add_item(new_product)
         await self.item_repository.session.flush()
+        self.unit_of_work.after_commit(invalidate_store_pages, store.id)
 
         return ItemResponse(
             id=new_product.id,
@@ -86,6 +103,9 @@ class ItemService:
             stock=item_request.stock,
         )
         await self.item_repository.session.flush()
+        self.unit_of_work.after_commit(invalidate_store_pages, store.id)
+        if item_request.item_name is not None or item_request.price is not None:
+            self.unit_of_work.after_commit(invalidate_cart_pricing, store.id)
 
         return ItemResponse(
             id=updated_product.id,
@@ -94,6 +114,8 @@ class ItemService:
             stock=updated_product.stock,
             store_id=store.id,
             store_name=store.store_name,
+            rating_count=updated_product.rating_count,
+            rating_sum=updated_product.rating_sum,
         )
 
     async def list_items(
@@ -102,34 +124,38 @@ class ItemService:
         min_price: Optional[int] = None,
         max_price: Optional[int] = None,
         in_stock: bool = False,
-    ) -> list[ItemResponse]:
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> tuple[list[ItemResponse], Optional[str]]:
+        validate_page_size(limit)
+        after = None
+        if cursor is not None:
+            after_price, after_id = decode_cursor(cursor, 2)
+            if not isinstance(after_price, int) or not isinstance(after_id, str):
+                raise InvalidFormatException()
+            after = (after_price, after_id)
 
         if store_id is not None:
             store = await self.store_repository.get_store_by_id(store_id)
             if store is None:
                 raise StoreNotFoundException()
 
-        products = await self.item_repository.get_items_with_query(
+        rows = await self.item_repository.get_items_with_query(
             store_id=store_id,
             min_price=min_price,
             max_price=max_price,
             in_stock=in_stock,
+            after=after,
+            limit=limit + 1,
         )
 
-        item_responses = []
-        for product in products:
-            item_responses.append(
-                ItemResponse(
-                    id=product.id,
-                    item_name=product.name,
-                    price=product.price,
-                    stock=product.stock,
-                    store_id=product.store_id,
-                    store_name=product.store.store_name,
-                )
-            )
+        # 한 건을 더 읽어 다음 페이지가 있는지 판단합니다.
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].price, rows[-1].id)
 
-        return item_responses
+        return [ItemResponse.model_validate(row) for row in rows], next_cursor
 
     async def delete_item_for_owner(self, user_id: str, item_id: str) -> None:
 
@@ -144,8 +170,20 @@ class ItemService:
         if product.store_id != store.id:
             raise NotYourItemException()
 
-        self.item_repository.delete_item(product)
-        await self.item_repository.session.flush()
+        # 주문 라인이 참조하는 상품은 삭제할 수 없습니다.
+        if await self.item_repository.has_order_lines(product.id):
+            raise ItemHasOrdersException()
+        try:
+            async with self.unit_of_work.savepoint():
+                await self.item_repository.delete_item(product)
+                await self.item_repository.session.flush()
+        except IntegrityError:
+            # 확인과 삭제 사이에 주문이 들어온 경우만 409 로 바꾸고, 다른 제약 위반은 그대로 올립니다.
+            if await self.item_repository.has_order_lines(product.id):
+                raise ItemHasOrdersException()
+            raise
+        self.unit_of_work.after_commit(invalidate_store_pages, store.id)
+        self.unit_of_work.after_commit(invalidate_cart_pricing, store.id)
 
     async def create_review_for_item(
         self, user_id: str, item_id: str, review_req: ReviewCreate
@@ -168,7 +206,9 @@ class ItemService:
             user_id=user_id,
             product_id=item_id,
         )
-        await self.review_repository.add_review(review)
+        await self.item_repository.adjust_rating(item_id, 1, review.rating)
+        self.unit_of_work.after_commit(invalidate_catalog)
+        self.review_repository.add_review(review)
         await self.review_repository.session.flush()
 
         return ReviewLoginResponse(
@@ -181,33 +221,66 @@ class ItemService:
         )
 
     async def list_reviews_for_item(
-        self, item_id: str, request_user_id: Optional[str] = None
-    ) -> Union[List[ReviewLoginResponse], List[ReviewLogoutResponse]]:
+        self,
+        item_id: str,
+        request_user_id: Optional[str] = None,
+        sort: ReviewSort = ReviewSort.NEWEST,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> tuple[Union[List[ReviewLoginResponse], List[ReviewLogoutResponse]], Optional[str]]:
+        validate_page_size(limit)
+        after = None
+        if cursor is not None:
+            after_key, after_id = decode_cursor(cursor, 2)
+            if not isinstance(after_id, str):
+                raise InvalidFormatException()
+            if sort == ReviewSort.NEWEST:
+                try:
+                    after_key = datetime.fromisoformat(after_key)
+                except (TypeError, ValueError):
+                    raise InvalidFormatException()
+            elif not isinstance(after_key, int):
+                raise InvalidFormatException()
+            after = (after_key, after_id)
+
         product = await self.item_repository.get_item_by_id(item_id)
         if product is None:
             raise ItemNotFoundException()
 
-        reviews = await self.review_repository.get_reviews_for_product(item_id)
+        reviews = await self.review_repository.get_reviews_for_product(
+            item_id, sort=sort, after=after, limit=limit + 1
+        )
+
+        # 한 건을 더 읽어 다음 페이지가 있는지 판단합니다.
+        next_cursor = None
+        if len(reviews) > limit:
+            reviews = reviews[:limit]
+            last = reviews[-1]
+            if sort == ReviewSort.NEWEST:
+                next_cursor = encode_cursor(last.created_at.isoformat(), last.id)
+            else:
+                next_cursor = encode_cursor(last.rating, last.id)
+
         if request_user_id:
             return [
                 ReviewLoginResponse(
                     review_id=r.id,
                     item_id=r.product_id,
-                    writer_nickname=(await r.get_user()).nickname,
+                    writer_nickname=r.user.nickname,
                     is_writer=(r.user_id == request_user_id),
                     rating=r.rating,
                     comment=r.comment,
                 )
                 for r in reviews
-            ]
+            ], next_cursor
         else:
             return [
                 ReviewLogoutResponse(
                     review_id=r.id,
                     item_id=r.product_id,
-                    writer_nickname=(await r.get_user()).nickname,
+                    writer_nickname=r.user.nickname,
                     rating=r.rating,
                     comment=r.comment,
                 )
                 for r in reviews
-            ]
+            ], next_cursor
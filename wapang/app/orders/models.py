@@ -1,7 +1,8 @@
 import uuid
 import enum
+from datetime import datetime
 from typing import List
-from sqlalchemy import Integer, ForeignKey, String, Enum
+from sqlalchemy import DateTime, Index, Integer, ForeignKey, String, Enum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from wapang.app.carts.exceptions import InvalidFieldFormatException
 from wapang.database.common import Base
@@ -14,11 +15,17 @@ class OrderStatus(enum.Enum):
 
 class Order(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        # 사용자별 주문 내역을 최신순 keyset 페이지로 읽기 위한 인덱스입니다.
+        Index("ix_orders_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
+
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
     )
     status: Mapped[OrderStatus] = mapped_column(Enum(OrderStatus))
     total_price: Mapped[int] = mapped_column(Integer)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.now)
 
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
     user: Mapped["User"] = relationship(back_populates="orders")  # type: ignore
@@ -35,7 +42,14 @@ class OrderProduct(Base):
     )
     quantity: Mapped[int] = mapped_column(Integer)
 
-    order_id: Mapped[str] = mapped_column(ForeignKey("orders.id"))
+    # 주문 시점의 상품/상점 정보를 그대로 남겨, 조회 시 JOIN 없이 청구 금액을 재현합니다.
+    unit_price: Mapped[int] = mapped_column(Integer)
+    item_name: Mapped[str] = mapped_column(String(50))
+    store_id: Mapped[str] = mapped_column(String(36))
+    store_name: Mapped[str] = mapped_column(String(30))
+    delivery_fee: Mapped[int] = mapped_column(Integer)
+
+    order_id: Mapped[str] = mapped_column(ForeignKey("orders.id"), index=True)
     order: Mapped["Order"] = relationship(back_populates="order_products")  # type: ignore
 
     product_id: Mapped[str] = mapped_column(ForeignKey("products.id"))
@@ -1,8 +1,8 @@
 from typing import Annotated, Sequence
 
 from fastapi import Depends
-from sqlalchemy import select
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Row, select
+from sqlalchemy.orm import Session
 
 from wapang.app.orders.models import Order, OrderProduct
 from wapang.app.items.models import Product
@@ -32,25 +32,18 @@ class OrderRepository:
         orderLoc = select(Order).where(Order.id == order_id)
         return await self.session.scalar(orderLoc)
 
-    async def get_order_products_with_details(
-        self, order_id: str
-    ) -> Sequence[OrderProduct]:
-        orderLoc = (
-            select(OrderProduct)
-            .options(joinedload(OrderProduct.product).joinedload(Product.store))
-            .where(OrderProduct.order_id == order_id)
-        )
-        return (await self.session.scalars(orderLoc)).all()
-
-    async def get_order_products_for_restock(
-        self, order_id: str
-    ) -> Sequence[OrderProduct]:
-        orderLoc = (
-            select(OrderProduct)
-            .options(joinedload(OrderProduct.product))
-            .where(OrderProduct.order_id == order_id)
-        )
-        return (await self.session.scalars(orderLoc)).all()
+    async def get_order_lines(self, order_id: str) -> Sequence[Row]:
+        # build_store_breakdown 이 받는 순서 그대로 평탄한 행을 가져옵니다.
+        orderLoc = select(
+            OrderProduct.product_id,
+            OrderProduct.item_name,
+            OrderProduct.unit_price,
+            OrderProduct.quantity,
+            OrderProduct.store_id,
+            OrderProduct.store_name,
+            OrderProduct.delivery_fee,
+        ).where(OrderProduct.order_id == order_id)
+        return (await self.session.execute(orderLoc)).all()
 
     async def add_objects_to_session(self, objects: list):
         self.session.add_all(objects)
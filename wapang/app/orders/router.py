@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, status
 from typing import Annotated
 
 from wapang.app.auth.utils import login_with_header
+from wapang.app.idempotency.services import IdempotencyService
 from wapang.app.orders.schemas import *
 from wapang.app.orders.models import *
 from wapang.app.orders.services import OrderService
@@ -14,12 +15,23 @@ order_router = APIRouter()
 async def create_orders(
     request: OrderCreateRequest,
     user: Annotated[User, Depends(login_with_header)],
-    order_service: Annotated[OrderService, Depends()]
+    order_service: Annotated[OrderService, Depends()],
+    idempotency_service: Annotated[IdempotencyService, Depends()],
+    idempotency_key: Annotated[str | None, Header()] = None,
 ) -> OrderResponse:
 
+    if idempotency_key is not None:
+        saved = await idempotency_service.begin(
+            user.id, idempotency_key, "POST /orders", request.model_dump_json()
+        )
+        if saved is not None:
+            return OrderResponse.model_validate_json(saved)
+
     order, stores_data = await order_service.create_order(request, user)
     
-    return OrderResponse(id=order.id, details=list(stores_data.values()), total_price=order.total_price, status=order.status)
+    response = OrderResponse(id=order.id, details=list(stores_data.values()), total_price=order.total_price, status=order.status)
+    await idempotency_service.complete(response.model_dump_json())
+    return response
 
 @order_router.get("/{order_id}", status_code=status.HTTP_200_OK)
 async def get_orders(
@@ -1,4 +1,5 @@
 from pydantic import BaseModel, Field
+from datetime import datetime
 from typing import List
 from wapang.app.orders.models import OrderStatus
 
@@ -32,6 +33,7 @@ class SimpleOrderResponse(BaseModel):
     id: str = Field(serialization_alias="order_id")
     total_price: int
     status: OrderStatus
+    created_at: datetime
 
     class Config:
         from_attributes = True
@@ -7,12 +7,22 @@ from wapang.app.orders.repositories import OrderRepository
 from wapang.app.orders.schemas import *
 from wapang.app.orders.exceptions import *
 from wapang.app.items.repositories import ItemRepository
+from wapang.app.stores.cache import invalidate_store_pages
+from wapang.common.breakdown import BreakdownRow, build_store_breakdown
+from wapang.database.async_connection import get_unit_of_work
+from wapang.database.unit_of_work import UnitOfWork
 
 
 class OrderService:
-    def __init__(self, order_repository: Annotated[OrderRepository, Depends()], product_repository: Annotated[ItemRepository, Depends()]) -> None:
+    def __init__(
+        self,
+        order_repository: Annotated[OrderRepository, Depends()],
+        product_repository: Annotated[ItemRepository, Depends()],
+        unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
+    ) -> None:
         self.order_repository = order_repository
         self.product_repository = product_repository
+        self.unit_of_work = unit_of_work
 
     async def create_order(self, request: OrderCreateRequest, user: User) -> tuple[Order, dict[str, OrderDetails]]:
         if not request.items:
@@ -26,41 +36,19 @@ class OrderService:
         if len(products) != len(item_ids):
             raise ItemNotFoundException()
         
-        stores_data = {}
-        total_price = 0
-        
-        for product in products:
-            item_id_str = str(product.id)
-            quantity = request_map[item_id_str]
-            
-            if quantity < 1:
-                raise InvalidFieldFormatException()
-
-            if product.stock < quantity:
-                raise NotEnoughStockException()
+        if any(quantity < 1 for quantity in request_map.values()):
+            raise InvalidFieldFormatException()
 
-            subtotal = product.price * quantity
-            store = product.store
+        if not await self.product_repository.reserve_stock(request_map):
+            raise NotEnoughStockException()
+        self.unit_of_work.after_commit(invalidate_store_pages, *{product.store_id for product in products})
 
-            if store.id not in stores_data:
-                stores_data[store.id] = OrderDetails(
-                    store_id=str(store.id),
-                    store_name=store.store_name,
-                    delivery_fee=store.delivery_fee,
-                    store_total_price=store.delivery_fee,
-                    items=[]
-                )
-            
-            stores_data[store.id].items.append(OrderItems(
-                item_id=item_id_str,
-                item_name=product.name,
-                price=product.price,
-                quantity=quantity,
-                subtotal=subtotal
-            ))
-            stores_data[store.id].store_total_price += subtotal
-        
-        total_price = sum(store.store_total_price for store in stores_data.values())
+        order_lines: list[BreakdownRow] = [
+            (product.id, product.name, product.price, request_map[product.id],
+             product.store.id, product.store.store_name, product.store.delivery_fee)
+            for product in products
+        ]
+        stores_data, total_price = build_store_breakdown(order_lines, OrderDetails)
         
         new_order = Order(
             status=OrderStatus.ORDERED, 
@@ -69,26 +57,19 @@ class OrderService:
         )
 
         self.order_repository.session.add(new_order)
-        
-        products_to_update = []
-        for product in products:
-            quantity = request_map[str(product.id)]
-            
-            product.stock -= quantity
-            products_to_update.append(product)
-            
-        self.order_repository.session.add_all(products_to_update)
-
         await self.order_repository.session.flush()
 
         order_products_to_save = []
-        for product in products:
-            quantity = request_map[str(product.id)]
-            
+        for product_id, item_name, price, quantity, store_id, store_name, delivery_fee in order_lines:
             order_products_to_save.append(OrderProduct(
                 order_id=new_order.id,
-                product_id=product.id,
-                quantity=quantity
+                product_id=product_id,
+                quantity=quantity,
+                unit_price=price,
+                item_name=item_name,
+                store_id=store_id,
+                store_name=store_name,
+                delivery_fee=delivery_fee
             ))
 
         self.order_repository.session.add_all(order_products_to_save)
@@ -103,31 +84,8 @@ class OrderService:
         if order.user_id != user.id:
             raise NotYourOrderException()
             
-        order_products = await self.order_repository.get_order_products_with_details(order_id)
-        
-        stores_data = {}
-        for op in order_products:
-            product = op.product
-            store = product.store
-            
-            if store.id not in stores_data:
-                stores_data[store.id] = OrderDetails(
-                    store_id=str(store.id),
-                    store_name=store.store_name,
-                    delivery_fee=store.delivery_fee,
-                    store_total_price=store.delivery_fee,
-                    items=[]
-                )
-                
-            subtotal = product.price * op.quantity
-            stores_data[store.id].items.append(OrderItems(
-                item_id=str(product.id),
-                item_name=product.name,
-                price=product.price,
-                quantity=op.quantity,
-                subtotal=subtotal
-            ))
-            stores_data[store.id].store_total_price += subtotal
+        order_lines = await self.order_repository.get_order_lines(order_id)
+        stores_data, _ = build_store_breakdown(order_lines, OrderDetails)
         
         return order, stores_data
     
@@ -141,15 +99,17 @@ class OrderService:
             raise InvalidOrderStatusException()
             
         objects_to_save = [order]
+        order_lines = await self.order_repository.get_order_lines(order_id)
 
         if request.status == OrderStatus.CANCELED:
             order.status = OrderStatus.CANCELED
 
-            order_products = await self.order_repository.get_order_products_for_restock(order_id)
-            for op in order_products:
-                if op.product:
-                    op.product.stock += op.quantity
-                    objects_to_save.append(op.product)        
+            restock: dict[str, int] = {}
+            for line in order_lines:
+                restock[line.product_id] = restock.get(line.product_id, 0) + line.quantity
+            if restock:
+                await self.product_repository.release_stock(restock)
+                self.unit_of_work.after_commit(invalidate_store_pages, *{line.store_id for line in order_lines})
         elif request.status == OrderStatus.COMPLETE:
             order.status = OrderStatus.COMPLETE 
         else:
@@ -157,30 +117,6 @@ class OrderService:
         
         await self.order_repository.add_objects_to_session(objects_to_save)
         
-        order_products = await self.order_repository.get_order_products_with_details(order_id)
+        stores_data, _ = build_store_breakdown(order_lines, OrderDetails)
         
-        stores_data = {}
-        for op in order_products:
-            product = op.product
-            store = product.store
-            
-            if store.id not in stores_data:
-                stores_data[store.id] = OrderDetails(
-                    store_id=str(store.id),
-                    store_name=store.store_name,
-                    delivery_fee=store.delivery_fee,
-                    store_total_price=store.delivery_fee,
-                    items=[]
-                )
-                
-            subtotal = product.price * op.quantity
-            stores_data[store.id].items.append(OrderItems(
-                item_id=str(product.id),
-                item_name=product.name,
-                price=product.price,
-                quantity=op.quantity,
-                subtotal=subtotal
-            ))
-            stores_data[store.id].store_total_price += subtotal
-            
         return order, stores_data
\ No newline at end of file
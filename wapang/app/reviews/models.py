@@ -1,21 +1,33 @@
-from typing import List
+import enum
 import uuid
-from sqlalchemy import Integer, ForeignKey, String
+from datetime import datetime
+from sqlalchemy import DateTime, Index, Integer, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from wapang.app.items.models import Product
-from wapang.common.exceptions import WapangException
 from wapang.database.common import Base
-from sqlalchemy.ext.asyncio import async_object_session
+
+
+class ReviewSort(enum.Enum):
+    NEWEST = "newest"
+    HIGHEST = "highest"
+    LOWEST = "lowest"
 
 
 class Review(Base):
     __tablename__ = "reviews"
+    __table_args__ = (
+        Index("ix_reviews_user_id_product_id", "user_id", "product_id"),
+        # 상품별 리뷰 목록의 정렬 기준(최신순 / 평점순)마다 keyset 페이지네이션을 받쳐 주는 인덱스입니다.
+        Index("ix_reviews_product_id_created_at_id", "product_id", "created_at", "id"),
+        Index("ix_reviews_product_id_rating_id", "product_id", "rating", "id"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
     )
     rating: Mapped[int] = mapped_column(Integer, nullable=False)
     comment: Mapped[str] = mapped_column(String(500), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.now)
     
     user_id: Mapped[str] = mapped_column(
         String(36),
@@ -24,23 +36,9 @@ class Review(Base):
     )
     user: Mapped["User"] = relationship(back_populates="reviews")  # type: ignore
 
-    async def get_user(self) -> "User":
-        session = async_object_session(self)
-        if session is None:
-            raise WapangException(500, "ERR_000", "Session not found for the user instance.")
-        await session.refresh(self, attribute_names=["user"])
-        return self.user
-
     product_id: Mapped[str] = mapped_column(
         String(36),
         ForeignKey("products.id", ondelete="CASCADE"),
         nullable=False,
     )
-    product: Mapped["Product"] = relationship(back_populates="reviews")  # type: ignore
-
-    async def get_products(self) -> List[Product]:
-        session = async_object_session(self)
-        if session is None:
-            raise WapangException(500, "ERR_000", "Session not found for the user instance.")
-        await session.refresh(self, attribute_names=["product"])
-        return self.product
\ No newline at end of file
+    product: Mapped["Product"] = relationship(back_populates="reviews")  # type: ignore
\ No newline at end of file
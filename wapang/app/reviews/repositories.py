@@ -2,27 +2,58 @@ from typing import Annotated, Sequence
 import uuid
 
 from fastapi import Depends
-from sqlalchemy import select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import and_, or_, select
+from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from wapang.database.async_connection import get_async_db_session
-from wapang.app.reviews.models import Review
+from wapang.app.reviews.models import Review, ReviewSort
 
 
 class ReviewRepository:
     def __init__(self, session: Annotated[AsyncSession, Depends(get_async_db_session)]) -> None:
         self.session = session
 
-    async def add_review(self, review: Review) -> None:
+    def add_review(self, review: Review) -> None:
         self.session.add(review)
-        await self.session.commit()
     
     async def get_review_by_id(self, review_id: str) -> Review | None:
-        reviewLoc = select(Review).where(Review.id == review_id)
+        reviewLoc = select(Review).options(joinedload(Review.user)).where(Review.id == review_id)
         return await self.session.scalar(reviewLoc)
     
-    async def get_reviews_for_product(self, product_id: str) -> list[Review]:
-        reviewsLoc = select(Review).where(Review.product_id == product_id)
+    async def get_reviews_for_product(
+            self,
+            product_id: str,
+            sort: ReviewSort = ReviewSort.NEWEST,
+            after: tuple | None = None,
+            limit: int | None = None,
+    ) -> Sequence[Review]:
+        # 작성자를 selectinload 로 한 번에 읽어 리뷰 수와 상관없이 쿼리 두 번으로 끝냅니다.
+        reviewsLoc = (
+            select(Review)
+            .options(selectinload(Review.user))
+            .where(Review.product_id == product_id)
+        )
+        # 정렬 키는 (product_id, 정렬 컬럼, id) 인덱스 순서와 같아 정렬 없이 인덱스를 그대로 읽습니다.
+        if sort == ReviewSort.NEWEST:
+            key, descending = Review.created_at, True
+        else:
+            key, descending = Review.rating, sort == ReviewSort.HIGHEST
+        if after is not None:
+            after_key, after_id = after
+            if descending:
+                reviewsLoc = reviewsLoc.where(
+                    or_(key < after_key, and_(key == after_key, Review.id < after_id))
+                )
+            else:
+                reviewsLoc = reviewsLoc.where(
+                    or_(key > after_key, and_(key == after_key, Review.id > after_id))
+                )
+        if descending:
+            reviewsLoc = reviewsLoc.order_by(key.desc(), Review.id.desc())
+        else:
+            reviewsLoc = reviewsLoc.order_by(key, Review.id)
+        if limit is not None:
+            reviewsLoc = reviewsLoc.limit(limit)
         return (await self.session.scalars(reviewsLoc)).all()
 
     async def get_user_review_for_product(self, user_id: str, product_id: str) -> Review | None:
@@ -4,12 +4,15 @@ from fastapi import Depends
 from wapang.app.reviews.models import Review
 from wapang.app.reviews.repositories import ReviewRepository
 from wapang.app.items.repositories import ItemRepository
+from wapang.app.stores.cache import invalidate_catalog
 from wapang.app.reviews.exceptions import (
     ReviewAlreadyExistsException,
     ReviewNotFoundException,
     NotYourReviewException,
 )
 from wapang.app.items.exceptions import ItemNotFoundException
+from wapang.database.async_connection import get_unit_of_work
+from wapang.database.unit_of_work import UnitOfWork
 
 from wapang.app.reviews.schemas import (
     ReviewCreate,
@@ -24,8 +27,12 @@ class ReviewService:
     def __init__(
         self,
         review_repository: Annotated[ReviewRepository, Depends()],
+        item_repository: Annotated[ItemRepository, Depends()],
+        unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
     ) -> None:
         self.review_repository = review_repository
+        self.item_repository = item_repository
+        self.unit_of_work = unit_of_work
 
     async def get_review_one(
         self, review_id: str, request_user_id: Optional[str] = None
@@ -38,7 +45,7 @@ class ReviewService:
             return ReviewLoginResponse(
                 review_id=review.id,
                 item_id=review.product_id,
-                writer_nickname=(await review.get_user()).nickname,
+                writer_nickname=review.user.nickname,
                 rating=review.rating,
                 comment=review.comment,
                 is_writer=(review.user_id == request_user_id),
@@ -47,7 +54,7 @@ class ReviewService:
             return ReviewLogoutResponse(
                 review_id=review.id,
                 item_id=review.product_id,
-                writer_nickname=(await review.get_user()).nickname,
+                writer_nickname=review.user.nickname,
                 rating=review.rating,
                 comment=review.comment,
             )
@@ -62,6 +69,10 @@ class ReviewService:
         if review.user_id != user_id:
             raise NotYourReviewException()
 
+        if req.rating is not None and req.rating != review.rating:
+            await self.item_repository.adjust_rating(review.product_id, 0, req.rating - review.rating)
+            self.unit_of_work.after_commit(invalidate_catalog)
+
         updated = self.review_repository.modify_review(
             review,
             rating=req.rating if req.rating is not None else review.rating,
@@ -86,5 +97,7 @@ class ReviewService:
         if review.user_id != user_id:
             raise NotYourReviewException()
 
+        await self.item_repository.adjust_rating(review.product_id, -1, -review.rating)
+        self.unit_of_work.after_commit(invalidate_catalog)
         await self.review_repository.delete_review(review)
         await self.review_repository.session.flush()
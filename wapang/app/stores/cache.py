@@ -0,0 +1,57 @@
+import uuid
+
+from wapang.app.stores.settings import STORE_SETTINGS
+from wapang.common.cache import CacheBackend, TTLCache
+
+# 인증 없이 읽는 상점 페이지의 직렬화된 JSON 과 ETag 용 버전 토큰을 담아 두는 캐시입니다.
+store_page_cache: CacheBackend = TTLCache(
+    maxsize=STORE_SETTINGS.STORE_PAGE_CACHE_MAX_SIZE,
+    ttl=STORE_SETTINGS.STORE_PAGE_CACHE_TTL_SECONDS,
+)
+
+CATALOG_VERSION_KEY = "catalog:version"
+
+
+# 본문 키에 버전을 넣어, 쓰기가 버전을 올린 뒤 늦게 도착한 읽기의 본문은 아무도 읽지 않는 키에 저장되게 합니다.
+def store_page_key(store_id: str, version: str) -> str:
+    return f"store:{store_id}:{version}:body"
+
+
+def store_items_page_key(store_id: str, version: str) -> str:
+    return f"store:{store_id}:{version}:items"
+
+
+def store_version_key(store_id: str) -> str:
+    return f"store:{store_id}:version"
+
+
+def _get_version(key: str) -> str:
+    # 버전은 증가하는 숫자 대신 무작위 토큰이라, 항목이 만료/축출돼도 예전 ETag 와 겹치지 않습니다.
+    version = store_page_cache.get(key)
+    if version is None:
+        version = uuid.uuid4().hex
+        store_page_cache.set(key, version)
+    return version
+
+
+def store_version(store_id: str) -> str:
+    return _get_version(store_version_key(store_id))
+
+
+def catalog_version() -> str:
+    return _get_version(CATALOG_VERSION_KEY)
+
+
+def invalidate_catalog() -> None:
+    store_page_cache.invalidate(CATALOG_VERSION_KEY)
+
+
+def invalidate_store_pages(*store_ids: str) -> None:
+    # 상점 정보나 상품(재고 포함)이 바뀌는 쓰기 경로에서 호출하며, 상점과 전체 상품 목록의 버전도 함께 올립니다.
+    for store_id in store_ids:
+        version = store_page_cache.get(store_version_key(store_id))
+        if version is not None:
+            store_page_cache.invalidate(store_page_key(store_id, version))
+            store_page_cache.invalidate(store_items_page_key(store_id, version))
+        store_page_cache.invalidate(store_version_key(store_id))
+    invalidate_catalog()
@@ -2,10 +2,8 @@ from typing import List
 import uuid
 from sqlalchemy import Integer, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from wapang.common.exceptions import WapangException
 from wapang.database.common import Base
 
-from sqlalchemy.ext.asyncio import async_object_session
 from wapang.app.items.models import Product
 
 
@@ -25,11 +23,4 @@ class Store(Base):
 
     products: Mapped[List["Product"]] = relationship(  # type: ignore
         back_populates="store", cascade="all, delete-orphan"
-    )
-
-    async def get_products(self) -> List[Product]:
-        session = async_object_session(self)
-        if session is None:
-            raise WapangException(500, "ERR_000", "Session not found for the user instance.")
-        await session.refresh(self, attribute_names=["products"])
-        return self.products
\ No newline at end of file
+    )
\ No newline at end of file
@@ -1,7 +1,7 @@
 from typing import Annotated, Sequence
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from wapang.app.users.models import User
 from wapang.app.stores.models import Store
@@ -38,22 +38,34 @@ class StoreRepository:
     async def modify_store(self, store: Store, **kwargs) -> Store:
         for key, value in kwargs.items():
             setattr(store, key, value)
-        await self.session.commit()
+        await self.session.flush()
         return store
 
     async def get_store_by_id(self, id: str) -> Store | None:
         return await self.session.scalar(select(Store).where(Store.id == id))
 
-    async def get_store_by_name(self, name: str) -> Store | None:
-        return await self.session.scalar(select(Store).where(Store.store_name == name))
-
-    async def get_store_by_email(self, email: str) -> Store | None:
-        return await self.session.scalar(select(Store).where(Store.email == email))
+    async def get_conflicting_fields(
+        self,
+        store_name: str | None,
+        email: str | None,
+        phone_number: str | None,
+        user_id: str | None,
+    ) -> set[str]:
+        # 고유 컬럼 조건을 OR 로 묶어 한 번에 조회하고, 겹친 필드 이름을 돌려줍니다.
+        # 어느 필드가 겹쳤는지도 DB 가 판단하게 해서, 대소문자를 무시하는 콜레이션에서도 조회와 결과가 어긋나지 않습니다.
+        values = {
+            "store_name": store_name,
+            "email": email,
+            "phone_number": phone_number,
+            "user_id": user_id,
+        }
+        values = {field: value for field, value in values.items() if value}
+        if not values:
+            return set()
 
-    async def get_store_by_phone(self, phone_number: str) -> Store | None:
-        return await self.session.scalar(
-            select(Store).where(Store.phone_number == phone_number)
-        )
+        matches = [(getattr(Store, field) == value).label(field) for field, value in values.items()]
+        rows = await self.session.execute(select(*matches).where(or_(*matches)))
+        return {field for row in rows for field in values if getattr(row, field)}
 
     async def get_store_by_user(self, user_id: str) -> Store | None:
         return await self.session.scalar(select(Store).where(Store.user_id == user_id))
\ No newline at end of file
@@ -1,11 +1,13 @@
-from typing import Annotated, List
-from fastapi import APIRouter, Depends, status
+from typing import Annotated, List, Optional
+from fastapi import APIRouter, Depends, Header, Response, status
 
 from wapang.app.auth.utils import login_with_header
 from wapang.app.stores.schemas import ChangeStoreRequest, NewStoreRequest, StoreResponse
 from wapang.app.items.schemas import ProductResponse
 from wapang.app.users.models import User
+from wapang.app.stores.cache import store_version
 from wapang.app.stores.services import StoreService
+from wapang.common.etag import etag_matches, make_etag
 
 store_router = APIRouter()
 
@@ -33,20 +35,28 @@ async def patch_store(
     return StoreResponse.model_validate(store)
 
 
-@store_router.get("/{store_id}")
+@store_router.get("/{store_id}", response_model=StoreResponse)
 async def get_store(
     store_service: Annotated[StoreService, Depends()],
     store_id: str,
-) -> StoreResponse:
-    store = await store_service.get_store_by_id(None, store_id)
-    return StoreResponse.model_validate(store)
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
+    etag = make_etag(store_version(store_id))
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    # 캐시된 JSON 을 그대로 내려보내 재검증/재직렬화를 건너뜁니다.
+    body = await store_service.get_store_page(store_id)
+    return Response(body, media_type="application/json", headers={"ETag": etag})
 
 
-@store_router.get("/{store_id}/items")
+@store_router.get("/{store_id}/items", response_model=List[ProductResponse])
 async def get_store_items(
     store_service: Annotated[StoreService, Depends()],
     store_id: str,
-) -> List[ProductResponse]:
-    store = await store_service.get_store_by_id(None, store_id)
-    products = await store_service.get_all_products(store)
-    return [ProductResponse.model_validate(product) for product in products]
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
+    etag = make_etag(store_version(store_id))
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    body = await store_service.get_store_items_page(store_id)
+    return Response(body, media_type="application/json", headers={"ETag": etag})
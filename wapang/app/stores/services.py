@@ -1,7 +1,18 @@
 from typing import Annotated, List, Optional
 
 from fastapi import Depends
-from wapang.app.items.models import Product
+from pydantic import TypeAdapter
+from sqlalchemy.exc import IntegrityError
+from wapang.app.carts.summary import invalidate_cart_pricing
+from wapang.app.items.repositories import ItemRepository
+from wapang.app.items.schemas import ProductResponse
+from wapang.app.stores.cache import (
+    invalidate_store_pages,
+    store_items_page_key,
+    store_page_cache,
+    store_page_key,
+    store_version,
+)
 from wapang.app.stores.exceptions import (
     NoStoreOwnedException,
     NotYourStoreException,
@@ -9,15 +20,27 @@ from wapang.app.stores.exceptions import (
     StoreInfoConflictException,
     StoreNotFoundException,
 )
-from wapang.app.stores.schemas import ChangeStoreRequest
+from wapang.app.stores.schemas import ChangeStoreRequest, StoreResponse
 from wapang.app.users.models import User
 from wapang.app.stores.models import Store
 from wapang.app.stores.repositories import StoreRepository
+from wapang.database.async_connection import get_unit_of_work
+from wapang.database.unit_of_work import UnitOfWork
+
+
+product_list_adapter = TypeAdapter(List[ProductResponse])
 
 
 class StoreService:
-    def __init__(self, store_repository: Annotated[StoreRepository, Depends()]) -> None:
+    def __init__(
+        self,
+        store_repository: Annotated[StoreRepository, Depends()],
+        item_repository: Annotated[ItemRepository, Depends()],
+        unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
+    ) -> None:
         self.store_repository = store_repository
+        self.item_repository = item_repository
+        self.unit_of_work = unit_of_work
 
     async def create_store(
         self,
@@ -29,9 +52,16 @@ class StoreService:
         delivery_fee: int,
     ) -> Store:
         await self._check_duplicates(store_name, email, phone_number, user.id)
-        return await self.store_repository.create_store(
-            user.id, store_name, address, email, phone_number, delivery_fee
-        )
+        try:
+            async with self.unit_of_work.savepoint():
+                return await self.store_repository.create_store(
+                    user.id, store_name, address, email, phone_number, delivery_fee
+                )
+        except IntegrityError:
+            # 조회와 쓰기 사이에 다른 요청이 먼저 같은 값을 쓴 경우, 겹친 컬럼을 다시 조회해 API 오류로 바꿉니다.
+            # 다시 조회해도 찾지 못하면 상점 정보 충돌로 봅니다.
+            await self._check_duplicates(store_name, email, phone_number, user.id)
+            raise StoreInfoConflictException()
 
     async def get_store_by_id(self, user: Optional[User], store_id: str) -> Store:
         store_from_id = await self.store_repository.get_store_by_id(store_id)
@@ -57,12 +87,45 @@ class StoreService:
             change_request.phone_number,
             None,
         )
-        return await self.store_repository.modify_store(
-            store, **change_request.model_dump(exclude_unset=True)
-        )
+        try:
+            async with self.unit_of_work.savepoint():
+                store = await self.store_repository.modify_store(
+                    store, **change_request.model_dump(exclude_unset=True)
+                )
+        except IntegrityError:
+            await self._check_duplicates(
+                change_request.store_name,
+                change_request.email,
+                change_request.phone_number,
+                None,
+            )
+            raise StoreInfoConflictException()
+        self.unit_of_work.after_commit(invalidate_store_pages, store.id)
+        self.unit_of_work.after_commit(invalidate_cart_pricing, store.id)
+        return store
+
+    async def get_store_page(self, store_id: str) -> str:
+        # 조회 전에 버전을 잡아 두어야, 조회 도중 커밋된 쓰기보다 오래된 본문이 새 버전으로 저장되지 않습니다.
+        key = store_page_key(store_id, store_version(store_id))
+        body = store_page_cache.get(key)
+        if body is None:
+            store = await self.get_store_by_id(None, store_id)
+            body = StoreResponse.model_validate(store).model_dump_json()
+            store_page_cache.set(key, body)
+        return body
 
-    async def get_all_products(self, store: Store) -> List[Product]:
-        return await store.get_products()
+    async def get_store_items_page(self, store_id: str) -> str:
+        key = store_items_page_key(store_id, store_version(store_id))
+        body = store_page_cache.get(key)
+        if body is None:
+            await self.get_store_by_id(None, store_id)
+            products = await self.item_repository.get_all_items_in_store(store_id)
+            body = product_list_adapter.dump_json(
+                [ProductResponse.model_validate(product) for product in products],
+                by_alias=True,
+            ).decode()
+            store_page_cache.set(key, body)
+        return body
 
     async def _check_duplicates(
         self,
@@ -71,13 +134,10 @@ class StoreService:
         phone_number: Optional[str],
         user_id: Optional[str],
     ):
-
-        if store_name and await self.store_repository.get_store_by_name(store_name):
-            raise StoreInfoConflictException()
-        if email and await self.store_repository.get_store_by_email(email):
-            raise StoreInfoConflictException()
-        if phone_number and await self.store_repository.get_store_by_phone(phone_number):
+        conflicts = await self.store_repository.get_conflicting_fields(
+            store_name, email, phone_number, user_id
+        )
+        if conflicts - {"user_id"}:
             raise StoreInfoConflictException()
-        if user_id and await self.store_repository.get_store_by_user(user_id):
+        if conflicts:
             raise StoreAlreadyExistsException()
-
@@ -0,0 +1,16 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+import os
+
+ENV = os.getenv("ENV", "local")
+
+class StoreSettings(BaseSettings):
+    STORE_PAGE_CACHE_TTL_SECONDS: int = 60
+    STORE_PAGE_CACHE_MAX_SIZE: int = 2048
+
+    model_config = SettingsConfigDict(
+        case_sensitive=False,
+        env_file=f".env.{ENV}",
+        extra='ignore'
+    )
+
+STORE_SETTINGS = StoreSettings()
@@ -1,8 +1,11 @@
 from typing import Annotated, Sequence
 import asyncio
+from datetime import datetime
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import Row, and_, inspect, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from wapang.app.items.models import Product
 from wapang.app.reviews.models import Review
 from wapang.app.users.models import User
 from wapang.app.orders.models import Order
@@ -24,19 +27,60 @@ class UserRepository:
     async def get_user_by_id(self, user_id: str) -> User | None:
         return await self.session.scalar(select(User).where(User.id == user_id))
 
+    def snapshot_user(self, user: User) -> dict:
+        return {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+
+    async def attach_user_snapshot(self, snapshot: dict) -> User:
+        # 캐시된 컬럼 값으로 User 를 만들고 SELECT 없이 현재 세션에 붙입니다.
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+        return await self.session.merge(user, load=False)
+
     async def get_user_by_email(self, email: str) -> User | None:
         return await self.session.scalar(select(User).where(User.email == email))
 
     async def modify_user(self, user: User, **kwargs) -> User:
         for key, value in kwargs.items():
             setattr(user, key, value)
-        await self.session.commit()
+        await self.session.flush()
         return user
 
-    async def get_all_orders_from_user(self, user: User) -> Sequence[Order]:
-        return (await self.session.scalars(select(Order).where(Order.user_id == user.id))).all()
+    async def get_all_orders_from_user(
+            self,
+            user: User,
+            after: tuple[datetime, str] | None = None,
+            limit: int | None = None,
+    ) -> Sequence[Row]:
+        # 요약 컬럼만 최신순으로 읽고, OFFSET 대신 마지막으로 본 (created_at, id) 이후부터 이어 읽습니다.
+        query = select(
+            Order.id,
+            Order.status,
+            Order.total_price,
+            Order.created_at,
+        ).where(Order.user_id == user.id)
+        if after is not None:
+            after_created_at, after_id = after
+            query = query.where(
+                or_(
+                    Order.created_at < after_created_at,
+                    and_(Order.created_at == after_created_at, Order.id < after_id),
+                )
+            )
+        query = query.order_by(Order.created_at.desc(), Order.id.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        return (await self.session.execute(query)).all()
 
-    async def get_all_reviews_from_user(self, user: User) -> Sequence[Review]:
-        return (await self.session.scalars(
-            select(Review).where(Review.user_id == user.id)
+    async def get_all_reviews_from_user(self, user: User) -> Sequence[Row]:
+        # ReviewResponse 필드명에 맞춘 컬럼만 JOIN 한 번으로 읽어 ORM 객체를 만들지 않습니다.
+        return (await self.session.execute(
+            select(
+                Review.id.label("review_id"),
+                Review.product_id.label("item_id"),
+                Product.name.label("item_name"),
+                Review.comment,
+                Review.rating,
+            )
+            .join(Product, Review.product_id == Product.id)
+            .where(Review.user_id == user.id)
         )).all()
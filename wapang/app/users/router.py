@@ -1,6 +1,6 @@
 import sys
-from typing import Annotated
-from fastapi import APIRouter, Depends, status
+from typing import Annotated, Optional
+from fastapi import APIRouter, Depends, Query, Response, status
 
 from wapang.app.auth.utils import login_with_header
 from wapang.app.orders.schemas import SimpleOrderResponse
@@ -13,6 +13,7 @@ from wapang.app.users.schemas import (
     UserResponse,
 )
 from wapang.app.users.services import UserService
+from wapang.common.pagination import DEFAULT_PAGE_SIZE, NEXT_CURSOR_HEADER
 
 user_router = APIRouter()
 
@@ -53,10 +54,15 @@ async def patch_me(
 
 @user_router.get("/me/orders")
 async def get_orders(
+    response: Response,
     user: Annotated[User, Depends(login_with_header)],
     user_service: Annotated[UserService, Depends()],
+    cursor: Optional[str] = Query(default=None),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE),
 ) -> list[SimpleOrderResponse]:
-    orders = await user_service.get_orders(user)
+    orders, next_cursor = await user_service.get_orders(user, cursor=cursor, limit=limit)
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return [SimpleOrderResponse.model_validate(order) for order in orders]
 
 
@@ -66,15 +72,4 @@ async def get_reviews(
     user_service: Annotated[UserService, Depends()],
 ) -> list[ReviewResponse]:
     reviews = await user_service.get_reviews(user)
-    response = []
-    for review in reviews:
-        response.append(
-            ReviewResponse( # TODO update to load product as well
-                review_id=review.id,
-                item_id=review.product_id,
-                item_name=(await review.get_products()).name,
-                comment=review.comment,
-                rating=review.rating,
-            )
-        )
-    return response
+    return [ReviewResponse.model_validate(review) for review in reviews]
@@ -121,3 +121,6 @@ class ReviewResponse(BaseModel):
     item_name: str
     comment: str
     rating: int
+
+    class Config:
+        from_attributes = True
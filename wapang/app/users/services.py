@@ -1,29 +1,58 @@
+from datetime import datetime
 from typing import Annotated, Optional
-from argon2 import PasswordHasher
 
 from fastapi import Depends
+from sqlalchemy import Row
+from wapang.app.auth.hashing import hash_password
+from wapang.app.auth.settings import AUTH_SETTINGS
 from wapang.app.users.models import User
-from wapang.app.orders.models import Order
-from wapang.app.reviews.models import Review
 from wapang.app.users.repositories import UserRepository
 from wapang.app.users.exceptions import EmailAlreadyExistsException
 from wapang.app.users.schemas import OrderResponse, UserChangeRequest
+from wapang.common.cache import TTLCache
+from wapang.common.exceptions import InvalidFormatException
+from wapang.database.async_connection import get_unit_of_work
+from wapang.database.unit_of_work import UnitOfWork
+from wapang.common.pagination import (
+    DEFAULT_PAGE_SIZE,
+    decode_cursor,
+    encode_cursor,
+    validate_page_size,
+)
+
+# 인증된 요청마다 반복되는 사용자 조회를 줄이기 위한 프로세스 로컬 캐시입니다.
+user_cache: TTLCache[str, dict] = TTLCache(
+    maxsize=AUTH_SETTINGS.USER_CACHE_MAX_SIZE,
+    ttl=AUTH_SETTINGS.USER_CACHE_TTL_SECONDS,
+)
 
 
 class UserService:
-    def __init__(self, user_repository: Annotated[UserRepository, Depends()]) -> None:
+    def __init__(
+        self,
+        user_repository: Annotated[UserRepository, Depends()],
+        unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
+    ) -> None:
         self.user_repository = user_repository
+        self.unit_of_work = unit_of_work
 
     async def create_user(self, email: str, password: str) -> User:
         if await self.user_repository.get_user_by_email(email):
             raise EmailAlreadyExistsException()
 
-        hashed_password = PasswordHasher().hash(password)
+        hashed_password = await hash_password(password)
 
         return await self.user_repository.create_user(email, hashed_password)
 
     async def get_user_by_id(self, user_id: str) -> User | None:
-        return await self.user_repository.get_user_by_id(user_id)
+        snapshot = user_cache.get(user_id)
+        if snapshot is not None:
+            return await self.user_repository.attach_user_snapshot(snapshot)
+
+        user = await self.user_repository.get_user_by_id(user_id)
+        if user is not None:
+            user_cache.set(user_id, self.user_repository.snapshot_user(user))
+        return user
 
     async def modify_user(self, user: User, change_request: UserChangeRequest) -> User:
         if change_request.email is not None and await self.user_repository.get_user_by_email(
@@ -31,12 +60,38 @@ class UserService:
         ):
             raise EmailAlreadyExistsException()
 
-        return await self.user_repository.modify_user(
+        user = await self.user_repository.modify_user(
             user, **change_request.model_dump(exclude_unset=True)
         )
+        # 커밋 전에 지우면 그 사이 다른 요청이 이전 값을 다시 캐시할 수 있습니다.
+        self.unit_of_work.after_commit(user_cache.invalidate, user.id)
+        return user
+
+    async def get_orders(
+        self,
+        user: User,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> tuple[list[Row], Optional[str]]:
+        validate_page_size(limit)
+        after = None
+        if cursor is not None:
+            after_created_at, after_id = decode_cursor(cursor, 2)
+            if not isinstance(after_id, str):
+                raise InvalidFormatException()
+            try:
+                after = (datetime.fromisoformat(after_created_at), after_id)
+            except (TypeError, ValueError):
+                raise InvalidFormatException()
+
+        rows = list(await self.user_repository.get_all_orders_from_user(user, after=after, limit=limit + 1))
 
-    async def get_orders(self, user: User) -> list[Order]:
-        return list(await self.user_repository.get_all_orders_from_user(user))
+        # 한 건을 더 읽어 다음 페이지가 있는지 판단합니다.
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].created_at.isoformat(), rows[-1].id)
+        return rows, next_cursor
 
-    async def get_reviews(self, user: User) -> list[Review]:
+    async def get_reviews(self, user: User) -> list[Row]:
         return list(await self.user_repository.get_all_reviews_from_user(user))
@@ -0,0 +1,43 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """거짓 양성은 있지만 거짓 음성은 없는 집합 멤버십 필터입니다."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        # 128비트 해시 하나를 둘로 나눠 double hashing 으로 k 개의 위치를 만듭니다.
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def replace(self, other: "BloomFilter") -> None:
+        # 같은 크기로 따로 만든 필터의 비트를 한 번에 넘겨받습니다. 중간 상태가 보이지 않습니다.
+        assert other.num_bits == self.num_bits and other.num_hashes == self.num_hashes
+        self._bits = other._bits
+        self.count = other.count
+
+    def clear(self) -> None:
+        self._bits = bytearray(len(self._bits))
+        self.count = 0
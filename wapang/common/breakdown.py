@@ -0,0 +1,46 @@
+from typing import Iterable, TypeVar
+
+from pydantic import BaseModel
+
+D = TypeVar("D", bound=BaseModel)
+
+# (item_id, item_name, price, quantity, store_id, store_name, delivery_fee)
+BreakdownRow = tuple[str, str, int, int, str, str, int]
+
+
+def build_store_breakdown(
+    rows: Iterable[BreakdownRow],
+    details_model: type[D],
+) -> tuple[dict[str, D], int]:
+    """평탄한 주문/장바구니 라인을 상점별로 묶어 배송비와 소계를 합산합니다.
+
+    라인은 dict 로만 모아 두고 상점마다 model_validate 를 한 번 호출해 중첩 모델을 한꺼번에 만듭니다.
+    """
+    groups: dict[str, tuple[str, int, list]] = {}
+    totals: dict[str, int] = {}
+    for item_id, item_name, price, quantity, store_id, store_name, delivery_fee in rows:
+        group = groups.get(store_id)
+        if group is None:
+            group = groups[store_id] = (store_name, delivery_fee, [])
+            totals[store_id] = delivery_fee
+        subtotal = price * quantity
+        totals[store_id] += subtotal
+        group[2].append({
+            "item_id": item_id,
+            "item_name": item_name,
+            "price": price,
+            "quantity": quantity,
+            "subtotal": subtotal
+        })
+
+    stores_data = {
+        store_id: details_model.model_validate({
+            "store_id": store_id,
+            "store_name": store_name,
+            "delivery_fee": delivery_fee,
+            "store_total_price": totals[store_id],
+            "items": items
+        })
+        for store_id, (store_name, delivery_fee, items) in groups.items()
+    }
+    return stores_data, sum(totals.values())
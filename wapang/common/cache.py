@@ -0,0 +1,59 @@
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Protocol, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CacheBackend(Protocol):
+    """문자열 키/값을 TTL 과 함께 저장하는 캐시 인터페이스입니다.
+
+    TTLCache 가 기본 구현이며, GET/SET EX/DEL 을 지원하는 Redis 호환 저장소로 같은 메서드를 구현해 바꿔 끼울 수 있습니다.
+    """
+
+    def get(self, key: str) -> Optional[str]: ...
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None: ...
+
+    def invalidate(self, key: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class TTLCache(Generic[K, V]):
+    """프로세스 내부에서만 쓰는 크기 제한 LRU 캐시이며, 항목마다 만료 시각을 가집니다."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
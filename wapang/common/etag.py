@@ -0,0 +1,16 @@
+from typing import Optional
+
+
+def make_etag(version: str) -> str:
+    return f'"{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    # If-None-Match 는 쉼표로 구분된 여러 ETag 일 수 있고, 비교는 약한 비교(W/ 무시)로 합니다.
+    # "*" 는 리소스가 있는지 확인하기 전에 비교하므로 일치로 보지 않습니다. 없는 상점도 404 를 돌려줘야 합니다.
+    if not if_none_match:
+        return False
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
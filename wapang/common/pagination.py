@@ -0,0 +1,34 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+from wapang.common.exceptions import InvalidFormatException
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def validate_page_size(limit: int) -> int:
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        raise InvalidFormatException()
+    return limit
+
+
+def encode_cursor(*values: Any) -> str:
+    # 정렬 키 값들을 JSON 으로 묶어 클라이언트에게는 불투명한 문자열로 전달합니다.
+    raw = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise InvalidFormatException()
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidFormatException()
+    return values
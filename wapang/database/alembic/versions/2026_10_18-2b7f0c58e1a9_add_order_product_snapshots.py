@@ -0,0 +1,59 @@
+"""Add order product snapshots
+
+Revision ID: 2b7f0c58e1a9
+Revises: e93a6c1d4f07
+Create Date: 2026-10-18 15:03:41.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b7f0c58e1a9'
+down_revision: Union[str, Sequence[str], None] = 'e93a6c1d4f07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('order_products', sa.Column('unit_price', sa.Integer(), nullable=True))
+    op.add_column('order_products', sa.Column('item_name', sa.String(length=50), nullable=True))
+    op.add_column('order_products', sa.Column('store_id', sa.String(length=36), nullable=True))
+    op.add_column('order_products', sa.Column('store_name', sa.String(length=30), nullable=True))
+    op.add_column('order_products', sa.Column('delivery_fee', sa.Integer(), nullable=True))
+
+    # 기존 주문 라인은 현재 상품/상점 정보로 채웁니다.
+    op.execute(
+        """
+        UPDATE order_products SET
+            unit_price = (SELECT products.price FROM products WHERE products.id = order_products.product_id),
+            item_name = (SELECT products.name FROM products WHERE products.id = order_products.product_id),
+            store_id = (SELECT products.store_id FROM products WHERE products.id = order_products.product_id)
+        """
+    )
+    op.execute(
+        """
+        UPDATE order_products SET
+            store_name = (SELECT stores.store_name FROM stores WHERE stores.id = order_products.store_id),
+            delivery_fee = (SELECT stores.delivery_fee FROM stores WHERE stores.id = order_products.store_id)
+        """
+    )
+
+    op.alter_column('order_products', 'unit_price', existing_type=sa.Integer(), nullable=False)
+    op.alter_column('order_products', 'item_name', existing_type=sa.String(length=50), nullable=False)
+    op.alter_column('order_products', 'store_id', existing_type=sa.String(length=36), nullable=False)
+    op.alter_column('order_products', 'store_name', existing_type=sa.String(length=30), nullable=False)
+    op.alter_column('order_products', 'delivery_fee', existing_type=sa.Integer(), nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('order_products', 'delivery_fee')
+    op.drop_column('order_products', 'store_name')
+    op.drop_column('order_products', 'store_id')
+    op.drop_column('order_products', 'item_name')
+    op.drop_column('order_products', 'unit_price')
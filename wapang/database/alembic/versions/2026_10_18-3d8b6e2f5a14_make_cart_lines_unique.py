@@ -0,0 +1,40 @@
+"""Make cart lines unique per user and product
+
+Revision ID: 3d8b6e2f5a14
+Revises: f06b3d9a2e71
+Create Date: 2026-10-18 18:12:05.614203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d8b6e2f5a14'
+down_revision: Union[str, Sequence[str], None] = 'f06b3d9a2e71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 같은 상품이 두 줄로 들어간 장바구니는 한 줄만 남깁니다.
+    op.execute(
+        "DELETE FROM cart_products WHERE id NOT IN ("
+        "SELECT id FROM (SELECT MAX(id) AS id FROM cart_products GROUP BY user_id, product_id) AS keep)"
+    )
+    # user_id 외래 키가 기존 인덱스를 쓰고 있으므로 새 인덱스를 먼저 만들고 지웁니다.
+    op.create_index('ix_cart_products_user_id_product_id_tmp', 'cart_products', ['user_id', 'product_id'], unique=True)
+    op.drop_index('ix_cart_products_user_id_product_id', table_name='cart_products')
+    op.create_index('ix_cart_products_user_id_product_id', 'cart_products', ['user_id', 'product_id'], unique=True)
+    op.drop_index('ix_cart_products_user_id_product_id_tmp', table_name='cart_products')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_cart_products_user_id_product_id_tmp', 'cart_products', ['user_id', 'product_id'], unique=False)
+    op.drop_index('ix_cart_products_user_id_product_id', table_name='cart_products')
+    op.create_index('ix_cart_products_user_id_product_id', 'cart_products', ['user_id', 'product_id'], unique=False)
+    op.drop_index('ix_cart_products_user_id_product_id_tmp', table_name='cart_products')
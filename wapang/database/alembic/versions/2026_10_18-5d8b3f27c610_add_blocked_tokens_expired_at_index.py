@@ -0,0 +1,28 @@
+"""Add blocked_tokens expired_at index
+
+Revision ID: 5d8b3f27c610
+Revises: a41f9e06b8c2
+Create Date: 2026-10-18 13:05:52.117630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d8b3f27c610'
+down_revision: Union[str, Sequence[str], None] = 'a41f9e06b8c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_blocked_tokens_expired_at'), 'blocked_tokens', ['expired_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_blocked_tokens_expired_at'), table_name='blocked_tokens')
@@ -0,0 +1,39 @@
+"""Add product rating aggregates
+
+Revision ID: 8e4d2a6f9b13
+Revises: 2b7f0c58e1a9
+Create Date: 2026-10-18 15:41:07.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4d2a6f9b13'
+down_revision: Union[str, Sequence[str], None] = '2b7f0c58e1a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('products', sa.Column('rating_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('products', sa.Column('rating_sum', sa.Integer(), server_default='0', nullable=False))
+
+    # 기존 리뷰로 집계값을 채웁니다.
+    op.execute(
+        """
+        UPDATE products SET
+            rating_count = (SELECT COUNT(*) FROM reviews WHERE reviews.product_id = products.id),
+            rating_sum = (SELECT COALESCE(SUM(reviews.rating), 0) FROM reviews WHERE reviews.product_id = products.id)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('products', 'rating_sum')
+    op.drop_column('products', 'rating_count')
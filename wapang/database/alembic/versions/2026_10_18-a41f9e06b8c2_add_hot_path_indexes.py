@@ -0,0 +1,40 @@
+"""Add hot path indexes
+
+Revision ID: a41f9e06b8c2
+Revises: 7c2e4a91d3b5
+Create Date: 2026-10-18 10:31:07.284915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41f9e06b8c2'
+down_revision: Union[str, Sequence[str], None] = '7c2e4a91d3b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_products_store_id_price', 'products', ['store_id', 'price'], unique=False)
+    op.create_index('ix_products_price_id', 'products', ['price', 'id'], unique=False)
+    op.create_index(op.f('ix_reviews_product_id'), 'reviews', ['product_id'], unique=False)
+    op.create_index('ix_reviews_user_id_product_id', 'reviews', ['user_id', 'product_id'], unique=False)
+    op.create_index('ix_cart_products_user_id_product_id', 'cart_products', ['user_id', 'product_id'], unique=False)
+    op.create_index(op.f('ix_orders_user_id'), 'orders', ['user_id'], unique=False)
+    op.create_index(op.f('ix_order_products_order_id'), 'order_products', ['order_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_order_products_order_id'), table_name='order_products')
+    op.drop_index(op.f('ix_orders_user_id'), table_name='orders')
+    op.drop_index('ix_cart_products_user_id_product_id', table_name='cart_products')
+    op.drop_index('ix_reviews_user_id_product_id', table_name='reviews')
+    op.drop_index(op.f('ix_reviews_product_id'), table_name='reviews')
+    op.drop_index('ix_products_price_id', table_name='products')
+    op.drop_index('ix_products_store_id_price', table_name='products')
@@ -0,0 +1,37 @@
+"""Add review sort indexes
+
+Revision ID: c5a19e7d3f48
+Revises: 8e4d2a6f9b13
+Create Date: 2026-10-18 16:12:54.730162
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5a19e7d3f48'
+down_revision: Union[str, Sequence[str], None] = '8e4d2a6f9b13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('reviews', sa.Column('created_at', sa.DateTime(), nullable=True))
+    op.execute("UPDATE reviews SET created_at = CURRENT_TIMESTAMP")
+    op.alter_column('reviews', 'created_at', existing_type=sa.DateTime(), nullable=False)
+
+    op.create_index('ix_reviews_product_id_created_at_id', 'reviews', ['product_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_reviews_product_id_rating_id', 'reviews', ['product_id', 'rating', 'id'], unique=False)
+    op.drop_index(op.f('ix_reviews_product_id'), table_name='reviews')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_reviews_product_id'), 'reviews', ['product_id'], unique=False)
+    op.drop_index('ix_reviews_product_id_rating_id', table_name='reviews')
+    op.drop_index('ix_reviews_product_id_created_at_id', table_name='reviews')
+    op.drop_column('reviews', 'created_at')
@@ -0,0 +1,38 @@
+"""Add idempotency keys
+
+Revision ID: e93a6c1d4f07
+Revises: 5d8b3f27c610
+Create Date: 2026-10-18 14:22:18.930471
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e93a6c1d4f07'
+down_revision: Union[str, Sequence[str], None] = '5d8b3f27c610'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('idempotency_keys',
+    sa.Column('user_id', sa.String(length=36), nullable=False),
+    sa.Column('key', sa.String(length=255), nullable=False),
+    sa.Column('fingerprint', sa.String(length=64), nullable=False),
+    sa.Column('response_body', sa.Text(), nullable=True),
+    sa.Column('expired_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'key')
+    )
+    op.create_index(op.f('ix_idempotency_keys_expired_at'), 'idempotency_keys', ['expired_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_idempotency_keys_expired_at'), table_name='idempotency_keys')
+    op.drop_table('idempotency_keys')
@@ -0,0 +1,35 @@
+"""Add orders created_at
+
+Revision ID: f06b3d9a2e71
+Revises: c5a19e7d3f48
+Create Date: 2026-10-18 16:48:22.391847
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f06b3d9a2e71'
+down_revision: Union[str, Sequence[str], None] = 'c5a19e7d3f48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('orders', sa.Column('created_at', sa.DateTime(), nullable=True))
+    op.execute("UPDATE orders SET created_at = CURRENT_TIMESTAMP")
+    op.alter_column('orders', 'created_at', existing_type=sa.DateTime(), nullable=False)
+
+    op.create_index('ix_orders_user_id_created_at_id', 'orders', ['user_id', 'created_at', 'id'], unique=False)
+    op.drop_index(op.f('ix_orders_user_id'), table_name='orders')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_orders_user_id'), 'orders', ['user_id'], unique=False)
+    op.drop_index('ix_orders_user_id_created_at_id', table_name='orders')
+    op.drop_column('orders', 'created_at')
@@ -1,5 +1,7 @@
-from typing import AsyncGenerator, Any
+from typing import Annotated, AsyncGenerator, Any
 
+from fastapi import Depends
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     async_sessionmaker,
@@ -7,13 +9,23 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from wapang.database.async_settings import ASYNC_DB_SETTINGS
+from wapang.database.request_usage import current_usage, instrument_engine
+from wapang.database.unit_of_work import UnitOfWork
 
 import os
 
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
 class AsyncDatabaseManager:
     def __init__(self):
         if os.environ["ENV"] == "test":
             self.engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+            # 운영 DB 처럼 외래 키(ON DELETE CASCADE 포함)를 지키도록 SQLite 에서도 켭니다.
+            event.listen(self.engine.sync_engine, "connect", _enable_sqlite_foreign_keys)
         else:
             self.engine = create_async_engine(
                 ASYNC_DB_SETTINGS.url,
@@ -22,17 +34,28 @@ class AsyncDatabaseManager:
                 pool_pre_ping=True,
                 echo=False
             )
+        instrument_engine(self.engine)
         self.session_factory = async_sessionmaker(bind=self.engine, expire_on_commit=False)
 
 async_db_manager = AsyncDatabaseManager()
 
-async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
-    session = async_db_manager.session_factory()
+async def get_unit_of_work() -> AsyncGenerator[UnitOfWork, None]:
+    # FastAPI 가 요청 안에서 의존성을 캐시하므로 레포지토리가 몇 개든 세션은 하나만 만들어집니다.
+    usage = current_usage()
+    if usage is not None:
+        usage.record_session()
+    uow = UnitOfWork(async_db_manager.session_factory())
     try:
-        yield session
-        await session.commit()
+        yield uow
+        await uow.commit()
     except Exception as e:
-        await session.rollback()
+        await uow.rollback()
         raise e
     finally:
-        await session.close()
\ No newline at end of file
+        await uow.session.close()
+
+async def get_async_db_session(
+    uow: Annotated[UnitOfWork, Depends(get_unit_of_work)]
+) -> AsyncSession:
+    # 같은 요청의 레포지토리는 모두 이 세션 하나를 공유하며, 직접 커밋하지 않습니다.
+    return uow.session
@@ -0,0 +1,105 @@
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger('uvicorn.error')
+
+DB_CONNECTIONS_HEADER = "X-DB-Connections"
+
+
+class RequestDbUsage:
+    def __init__(self, strict: bool) -> None:
+        self.strict = strict
+        self.sessions = 0
+        self.checkouts = 0
+
+    def record_session(self) -> None:
+        self.sessions += 1
+        if self.strict:
+            assert self.sessions == 1, "요청 하나에서 AsyncSession 을 두 번 이상 만들었습니다."
+
+    def record_checkout(self) -> None:
+        self.checkouts += 1
+        if self.strict:
+            assert self.checkouts == 1, "요청 하나에서 풀 커넥션을 두 번 이상 꺼냈습니다."
+
+
+class DbUsageStats:
+    def __init__(self) -> None:
+        self.requests = 0
+        self.checkouts = 0
+        self.max_checkouts = 0
+        self.multi_checkout_requests = 0
+
+    def record(self, usage: RequestDbUsage) -> None:
+        self.requests += 1
+        self.checkouts += usage.checkouts
+        self.max_checkouts = max(self.max_checkouts, usage.checkouts)
+        if usage.checkouts > 1:
+            self.multi_checkout_requests += 1
+
+
+db_usage_stats = DbUsageStats()
+
+_current_usage: ContextVar[Optional[RequestDbUsage]] = ContextVar("request_db_usage", default=None)
+
+
+def current_usage() -> Optional[RequestDbUsage]:
+    # 요청 밖(lifespan, 백그라운드 작업)에서는 None 입니다.
+    return _current_usage.get()
+
+
+@contextmanager
+def track_db_usage(strict: bool = False) -> Iterator[RequestDbUsage]:
+    usage = RequestDbUsage(strict)
+    token = _current_usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _current_usage.reset(token)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        usage = _current_usage.get()
+        if usage is not None:
+            usage.record_checkout()
+
+    event.listen(engine.sync_engine, "checkout", _on_checkout)
+
+
+class DbUsageMiddleware:
+    """요청마다 세션 수와 풀 커넥션 checkout 수를 세어 db_usage_stats 에 모읍니다.
+
+    strict 이면 두 번째 세션이나 checkout 에서 AssertionError 를 내고, 응답에 X-DB-Connections 헤더를 붙입니다.
+    """
+
+    def __init__(self, app: ASGIApp, strict: bool = False) -> None:
+        self.app = app
+        self.strict = strict
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_db_usage(self.strict) as usage:
+            async def send_with_usage(message: Message) -> None:
+                if self.strict and message["type"] == "http.response.start":
+                    MutableHeaders(scope=message).append(DB_CONNECTIONS_HEADER, str(usage.checkouts))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_usage)
+            finally:
+                db_usage_stats.record(usage)
+                if usage.checkouts > 1:
+                    logger.warning(
+                        f"{scope['method']} {scope['path']} checked out {usage.checkouts} connections"
+                    )
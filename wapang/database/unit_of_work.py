@@ -0,0 +1,43 @@
+import inspect
+import logging
+from typing import Any, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncSessionTransaction
+
+logger = logging.getLogger('uvicorn.error')
+
+
+class UnitOfWork:
+    """요청 하나의 트랜잭션 경계입니다.
+
+    레포지토리는 flush 까지만 하고, 커밋은 요청이 예외 없이 끝났을 때 get_unit_of_work 가 한 번만 합니다.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self._after_commit: list[tuple[Callable[..., Any], tuple[Any, ...]]] = []
+
+    def savepoint(self) -> AsyncSessionTransaction:
+        # 실패해도 요청 전체를 되돌리지 않고 이어 가야 하는 구간을 `async with uow.savepoint():` 로 감쌉니다.
+        return self.session.begin_nested()
+
+    def after_commit(self, callback: Callable[..., Any], *args: Any) -> None:
+        # 캐시 무효화처럼 커밋된 뒤에야 해야 하는 일을 등록합니다. 롤백되면 버려집니다.
+        # 코루틴 함수도 등록할 수 있으며, 커밋 뒤 등록한 순서대로 await 합니다.
+        self._after_commit.append((callback, args))
+
+    async def commit(self) -> None:
+        await self.session.commit()
+        callbacks, self._after_commit = self._after_commit, []
+        # 이미 커밋된 뒤이므로, 콜백 하나가 실패해도 나머지를 마저 실행하고 응답은 바꾸지 않습니다.
+        for callback, args in callbacks:
+            try:
+                result = callback(*args)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                logger.exception(f"After-commit callback {callback!r} failed")
+
+    async def rollback(self) -> None:
+        self._after_commit.clear()
+        await self.session.rollback()
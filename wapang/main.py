@@ -1,16 +1,52 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.exception_handlers import request_validation_exception_handler
 from fastapi.exceptions import RequestValidationError
 
 from wapang.api import api_router
+from wapang.app.auth.purge import run_token_purger
+from wapang.app.auth.revocation import rebuild_revoked_tokens
+from wapang.app.carts.services import flush_carts, run_cart_flusher
+from wapang.app.carts.settings import CART_SETTINGS
+from wapang.app.idempotency.services import run_idempotency_key_purger
 from wapang.app.orders.exceptions import InvalidFieldFormatException
 from wapang.common.exceptions import (
     WapangException,
     MissingRequiredFieldException
 )
+from wapang.database.async_connection import async_db_manager
+from wapang.database.request_usage import DbUsageMiddleware
+from wapang.settings import SETTINGS
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    async with async_db_manager.session_factory() as session:
+        await rebuild_revoked_tokens(session)
+    purgers = [
+        asyncio.create_task(run_token_purger(async_db_manager.session_factory)),
+        asyncio.create_task(run_idempotency_key_purger(async_db_manager.session_factory)),
+    ]
+    if CART_SETTINGS.CART_STORE_BACKEND == "memory":
+        purgers.append(asyncio.create_task(run_cart_flusher(async_db_manager.session_factory)))
+    yield
+    for purger in purgers:
+        purger.cancel()
+        with suppress(asyncio.CancelledError):
+            await purger
+    if CART_SETTINGS.CART_STORE_BACKEND == "memory":
+        # 종료 전에 아직 쓰지 않은 장바구니를 마저 씁니다.
+        await flush_carts(async_db_manager.session_factory)
+    await async_db_manager.engine.dispose()
+
+
+app = FastAPI(lifespan=lifespan)
 
-app = FastAPI()
+# 운영 외 환경에서는 요청당 세션/커넥션이 하나를 넘으면 바로 실패시킵니다.
+app.add_middleware(DbUsageMiddleware, strict=not SETTINGS.is_prod)
 
 app.include_router(api_router, prefix="/api")
 